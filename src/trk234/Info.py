@@ -52,10 +52,16 @@ Last Modified: 14-SEP-2023
 """
 from .SFDU import SFDU
 from .Reader import Reader
-from .util import bands, format_codes, data_descriptions, types
-from datetime import datetime
+from .util import bands, format_codes, data_descriptions, types, doy_datetime
+from collections import Counter
+from datetime import datetime, timedelta
 import struct
 
+# data description IDs as big-endian 4 byte integers, for `Info.quicklook`
+DDID = struct.Struct('>I')
+C123 = int.from_bytes(b'C123', 'big')
+C124 = int.from_bytes(b'C124', 'big')
+
 # ---------------------------------------------------------------------------
 class Info:
    """Get information about a TRK 2-34 file.
@@ -158,65 +164,59 @@ class Info:
       # Number of records
       self.numRecords = len(f.sfdu_list)
 
+      # Gather the scalar fields of the decoded SFDUs, instead of walking the
+      #   SFDU list once per attribute
+      sec = [ x.sec_chdo for x in f.sfdu_list if x.is_decoded ]
+      scft_id = { x.scft_id for x in sec }
+      epoch = [ (x.year, x.doy, x.sec) for x in sec ]
+      modified = [ (x.mod_day, x.mod_msec) for x in sec ]
+
       # Get the types and number of types
       self.numberDataTypes = types(f.sfdu_list)
       self.dataTypes = [ i for i, e in enumerate( self.numberDataTypes ) if e != 0 ]
 
-      # Compute the time of the first SFDU and last SFDU
-      dt = [ x.timestamp() for x in f.sfdu_list if x.is_decoded ]
-      self.startTime = min(dt)
-      self.endTime = max(dt)
+      # Compute the time of the first SFDU and last SFDU. the epoch fields
+      #   sort the same way as the timestamps, so only convert the extremes
+      self.startTime = doy_datetime( *min(epoch) )
+      self.endTime = doy_datetime( *max(epoch) )
 
       # Get the last modified date
-      dtm = [ x.last_modified() for x in f.sfdu_list if x.is_decoded ]
-      self.lastModified = max(dtm)
+      mod_day, mod_msec = max(modified)
+      self.lastModified = datetime(year=1958, month=1, day=1) + \
+                timedelta(days=mod_day, milliseconds=mod_msec)
 
       # Get the Spacecraft ID(s)
-      self.spacecraftId = list(set([ x.sec_chdo.scft_id for x in f.sfdu_list if x.is_decoded ]))
+      self.spacecraftId = list( scft_id )
+
+      # Group the SFDUs by data description ID once, so each field below is
+      #   gathered from the groups that carry it instead of branching on
+      #   the ID of every SFDU
+      groups = {}
+      for x in f.sfdu_list:
+         groups.setdefault( x.label.data_description_id, [] ).append( x )
+
+      def select(*ddids):
+         """ list the SFDUs of the given data description IDs """
+         return [ x for ddid in ddids for x in groups.get(ddid, []) ]
 
       # Get all data description IDs
-      self.dataDescriptionIds = list(set( [ x.label.data_description_id for x in f.sfdu_list ] ))
+      self.dataDescriptionIds = list(set( groups ))
 
-      # A more complicated loop to find the uplink/downlink bands, DSS IDs, and modes
-      #   strategy: create a list of all bands/IDs and then find unique vals 
-      #   in each list
-      ul_dss_id = []
-      dl_dss_id = []
-      ul_band = []
-      dl_band = []
-      trk_mode = []
-      loop_bw = []
-      for x in f.sfdu_list:
-         if x.label.data_description_id == 'C123': # uplink
-            ul_dss_id.append( x.sec_chdo.ul_dss_id )
-            ul_band.append( x.sec_chdo.ul_band )
-         elif x.label.data_description_id == 'C124': # downlink
-            dl_dss_id.append( x.sec_chdo.dl_dss_id )
-            dl_band.append( x.sec_chdo.dl_band )
-            trk_mode.append( x.tracking_mode() )
-         elif x.label.data_description_id == 'C125': # derived
-#            ul_dss_id.append( x.sec_chdo.ul_dss_id )
-            dl_dss_id.append( x.sec_chdo.dl_dss_id )
-#            dl_band.append( x.sec_chdo.dl_band )
-#            ul_band.append( x.sec_chdo.ul_band )
-            trk_mode.append( x.tracking_mode() )
-         elif x.label.data_description_id == 'C126': # VLBI
-            ul_dss_id.append( x.sec_chdo.ul_dss_id )
-            dl_dss_id.append( x.sec_chdo.dl_dss_id )
-            dl_dss_id.append( x.sec_chdo.dl_dss_id_2 )
-            dl_band.append( x.sec_chdo.dl_band )
-            ul_band.append( x.sec_chdo.ul_band )
-            trk_mode.append( x.tracking_mode() )
-         elif x.label.data_description_id == 'C127': # filtered
-            dl_dss_id.append( x.sec_chdo.dl_dss_id )
-            dl_band.append( x.sec_chdo.dl_band )
-            trk_mode.append( x.tracking_mode() )
+      # Uplink (C123), downlink (C124), derived (C125), VLBI (C126) and
+      #   filtered (C127) SFDUs each carry a different subset of the
+      #   bands/IDs and modes. collect them all and find unique vals
+      ul_dss_id = { x.sec_chdo.ul_dss_id for x in select('C123', 'C126') }
+      dl_dss_id = { x.sec_chdo.dl_dss_id for x in select('C124', 'C125', 'C126', 'C127') }
+      dl_dss_id |= { x.sec_chdo.dl_dss_id_2 for x in select('C126') }
+      ul_band = { x.sec_chdo.ul_band for x in select('C123', 'C126') }
+      dl_band = { x.sec_chdo.dl_band for x in select('C124', 'C126', 'C127') }
+      trk_mode = { x.tracking_mode() for x in select('C124', 'C125', 'C126', 'C127') }
 
-      self.dnlinkDssId = list(set( dl_dss_id ))
-      self.uplinkDssId = list(set( ul_dss_id ))
-      self.dnlinkBand = [ bands[i] for i in list(set( dl_band )) ]
-      self.uplinkBand = [ bands[i] for i in list(set( ul_band )) ]
-      self.trackingMode = list(set( trk_mode ))
+      self.dnlinkDssId = list( dl_dss_id )
+      self.uplinkDssId = list( ul_dss_id )
+      self.dnlinkBand = [ bands[i] for i in dl_band ]
+      self.uplinkBand = [ bands[i] for i in ul_band ]
+      self.trackingMode = list( trk_mode )
 
       # Get doppler count time
       self.dopplerCountTime = list(set( x.sec_chdo.cnt_time for x in f.sfdu_list if x.pri_chdo.format_code == 16 ))
@@ -230,38 +230,40 @@ class Info:
       # Number of records, format codes, and data types. copied from above and trk234.util
       print( "Getting data type list..." )
       self.numRecords = len(f.index)-1
-      format_codes = f.get_data_types()
-      n = []
-      for i in range(0,18):
-         n.append( len([ s for s in format_codes if s==i ]) )
-      self.numberDataTypes = n
+      counts = Counter( f.get_data_types() )
+      self.numberDataTypes = [ counts[i] for i in range(0,18) ]
       self.dataTypes = [ i for i, e in enumerate( self.numberDataTypes ) if e != 0 ]
 
       # Find a list of DSN station IDs
       print( "Getting DSS information..." )
-      dl_dss_id = []
-      dl_band = []
-      data_description_id = []
-      ul_dss_id = []
-      ul_band = []
-      prdx_mode = []
-      for i in range(len(f.index)-1):
-         bindata = f.binarydata[ f.index[i]:f.index[i+1] ]
-         ddid = struct.unpack('>4s', bindata[8:12])[0].decode('ascii')
-         data_description_id.append( ddid )
-         if ddid == 'C124':
-            dl_dss_id.append( struct.unpack('>B', bindata[66:67])[0] )
-            dl_band.append( struct.unpack('>B', bindata[67:68])[0] )
-            prdx_mode.append( struct.unpack('>B', bindata[69:70])[0] )
-         if ddid == 'C123':
-            ul_dss_id.append( struct.unpack('>B', bindata[66:67])[0] )
-            ul_band.append( struct.unpack('>B', bindata[67:68])[0] )
-      self.dataDescriptionIds = list(set( data_description_id ))
-      self.dnlinkDssId = list(set( dl_dss_id ))
-      self.uplinkDssId = list(set( ul_dss_id ))
-      self.dnlinkBand = [ bands[i] for i in list(set( dl_band )) ]
-      self.uplinkBand = [ bands[i] for i in list(set( ul_band )) ]
-      self.trackingMode = [ '%1dW'%x for x in list(set( prdx_mode )) if x in [1,2,3] ]
+      # read the fields in place, indexing the data gives the byte as an int.
+      #   the data description ID is compared as a 4 byte integer and only
+      #   the unique ones are decoded to strings at the end. the values go
+      #   straight into sets, as only the unique ones are reported
+      dl_dss_id = set()
+      dl_band = set()
+      data_description_id = set()
+      ul_dss_id = set()
+      ul_band = set()
+      prdx_mode = set()
+      data = f.binarydata
+      ddid_at = DDID.unpack_from
+      for i in f.index[:-1]:
+         ddid = ddid_at(data, i+8)[0]
+         data_description_id.add( ddid )
+         if ddid == C124:
+            dl_dss_id.add( data[i+66] )
+            dl_band.add( data[i+67] )
+            prdx_mode.add( data[i+69] )
+         elif ddid == C123:
+            ul_dss_id.add( data[i+66] )
+            ul_band.add( data[i+67] )
+      self.dataDescriptionIds = [ x.to_bytes(4, 'big').decode('ascii') for x in data_description_id ]
+      self.dnlinkDssId = list( dl_dss_id )
+      self.uplinkDssId = list( ul_dss_id )
+      self.dnlinkBand = [ bands[i] for i in dl_band ]
+      self.uplinkBand = [ bands[i] for i in ul_band ]
+      self.trackingMode = [ '%1dW'%x for x in prdx_mode if x in [1,2,3] ]
 
       # decode the first and last SFDU
       print( "Getting timestamps..." )
@@ -52,6 +52,9 @@ Last Modified: 14-SEP-2023
 
 from .ProgressDisplay import ProgressDisplay
 from .SFDU import SFDU
+from .util import sec_chdo_fields, trk_chdo_fields
+from array import array
+import mmap
 import re
 import struct
 
@@ -61,61 +64,117 @@ class Reader:
       Main class to read a TRK 2-34 file
 
       f = TRK234.Reader(filename)
+
+      start and stop are optional byte offsets to only read part of the file.
+      they must be on SFDU boundaries, such as the ones returned by blocks(),
+      and first is the number of the first SFDU that is read
    """
 
    # search string
    STARTPACKET = 'NJPL'
 
-   def __init__(self, filename):
+   # sfdu_length attribute of the label, bytes 12-20
+   SFDU_LENGTH = struct.Struct( '>Q' )
+
+   def __init__(self, filename, start=0, stop=None, first=0):
       """ class constructor """
 
       # set basic attributes
       self.filename = filename.split('/')[-1]
+      self.first = first
       self.sfdu_list = []
       self.is_decoded = False
       
       # read the data and determine the index
-      self.binarydata = self.read( filename )
+      self.binarydata = self.read( filename, start, stop )
       self.index = self.sfdu_index( self.binarydata )
+      self.data_types = None
 
-   def decode(self, progress=False, label=True, agg_chdo=True, pri_chdo=True, sec_chdo=True, trk_chdo=True):
+   def decode(self, progress=False, label=True, agg_chdo=True, pri_chdo=True, sec_chdo=True, trk_chdo=True,
+              format_codes=None):
       """ return the SFDUs, processed in SFDU class
             decode based on the function inputs (default=decode all)
+            format_codes is an optional set to filter on. SFDUs that are not in
+            it only get the label and primary CHDO decoded, and are kept in the
+            list with is_decoded=False
       """
 
-      # initialize variable
-      sfdus = []
+      self.sfdu_list = list( self.iter_sfdus( progress, label, agg_chdo, pri_chdo, sec_chdo, trk_chdo,
+                                              format_codes ) )
+      self.is_decoded = True
+#      return sfdus
+
+   def iter_sfdus(self, progress=False, label=True, agg_chdo=True, pri_chdo=True, sec_chdo=True, trk_chdo=True,
+                  format_codes=None):
+      """ generator of the SFDUs, decoded one at a time with the same inputs as
+            decode(). the SFDUs are not kept in sfdu_list, so only the one in use
+            has to be in memory
+      """
 
       # want the sfdu index to be one size larger for the loop
       ind = self.index
       #ind.append( len(self.binarydata)+1 )
 
-      # separate out the binary blocks and decode the SFDU
+      # separate out the binary blocks and decode the SFDU. the blocks are
+      #   memoryview slices of the file data, so they are not copied
+      data = memoryview( self.binarydata )
       n = len(ind) - 1
       if progress: p = ProgressDisplay(maxIndex=n)
       for i in range( n ):
          sfdu = SFDU()
-         sfdu.number = i
-         sfdu.decode( self.binarydata[ ind[i]:ind[i+1] ], label, agg_chdo, pri_chdo, sec_chdo, trk_chdo )
-         sfdus.append( sfdu )
+         sfdu.number = self.first + i
+         binarydata = data[ ind[i]:ind[i+1] ]
+         if format_codes is not None:
+            # decode the headers first, and skip the rest if filtered out
+            sfdu.decode( binarydata, True, agg_chdo, True, False, False )
+            if sfdu.pri_chdo.format_code not in format_codes:
+               sfdu.is_decoded = False
+            else:
+               sfdu.decode( binarydata, False, False, False, sec_chdo, trk_chdo )
+         else:
+            sfdu.decode( binarydata, label, agg_chdo, pri_chdo, sec_chdo, trk_chdo )
          if progress: p.update(i)
+         yield sfdu
       if progress: p.kill()
 
-      self.sfdu_list = sfdus
-      self.is_decoded = True
-#      return sfdus
+   def iter_records(self):
+      """ generator of (format_code, start, length, block) for each SFDU, read
+            straight from the binary data without creating SFDU objects. start
+            and length are in bytes, and block is a memoryview of the SFDU
+      """
+      data = memoryview( self.binarydata )
+      ind = self.index
+      for i in range( len(ind) - 1 ):
+         start = ind[i]
+         stop = ind[i+1]
+         yield data[start+31], start, stop - start, data[start:stop]
 
    def dump(self):
       """ dump the contents of this TRK 2-34 file to window """
       for s in self.sfdus:
          print( s )
 
-   def read(self, filename):
-      """ read the SFDU file and return the binary data """
+   def read(self, filename, start=0, stop=None):
+      """ read the SFDU file and return the binary data. the whole file is
+            memory mapped read-only instead of read, so the OS pages it in as
+            it is used. slicing the map returns bytes, like slicing a bytes
+            object. a part of the file is read as bytes
+      """
 
       # read the file
       with open(filename, 'rb') as f:
-          binarydata = f.read()
+         if start != 0 or stop is not None:
+            f.seek( start )
+            return f.read( -1 if stop is None else stop - start )
+         try:
+            binarydata = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+         except ValueError:
+            # empty files cannot be mapped
+            return b''
+
+      # the file is mostly walked from start to end
+      if hasattr(binarydata, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+         binarydata.madvise( mmap.MADV_SEQUENTIAL )
 
       # return the binary data
       return binarydata
@@ -125,28 +184,89 @@ class Reader:
       # NJPL search method
       #return [ m.start() for m in re.finditer(self.STARTPACKET, binarystring) ]
 
-      N = len(self.binarydata)
-      ind = [0]
-      next_ind = 0
+      # walk the sfdu_length attribute in each "label". the index is a compact
+      #   array of unsigned 64 bit integers instead of a list of python ints
+      N = len(binarystring)
+      unpack_from = self.SFDU_LENGTH.unpack_from
+      ind = array( 'Q', [0] )
+      append = ind.append
       offset = 0
-      while(next_ind < N):
-         # sfdu_length attribute in "label"
-         sfdu_length = struct.unpack('>Q', self.binarydata[offset+12:offset+20])[0]
-         next_ind = sfdu_length + 20 + ind[-1]
-         offset = next_ind
-         ind.append(next_ind)
+      while offset < N:
+         offset += unpack_from( binarystring, offset+12 )[0] + 20
+         append( offset )
       return ind
 
+   def blocks(self, n):
+      """ split the SFDUs into at most n contiguous blocks of (nearly) the same
+            size, and return the (start, stop) byte offsets and the number of
+            the first SFDU of each block
+      """
+      ind = self.index
+      nsfdu = len(ind) - 1
+      size = max( 1, -(-nsfdu // n) )
+      return [ (ind[i], ind[min(i+size, nsfdu)], i) for i in range(0, nsfdu, size) ]
+
    def get_data_types(self):
-      """ decode ONLY the data type from the SFDU and return them """
-
-      # pretty much the same looping code as above from decode(),
-      #   but manually unpack the format code, which is blocks 31:32
-      j = self.sfdu_index( self.binarydata )
-      #j.append( len(self.binarydata)+1 )
-      fc = []
-      for i in range( len(j)-1 ):
-         fc.append( struct.unpack('>B', self.binarydata[ j[i]:j[i+1] ][31:32])[0] )
-      return fc
+      """ decode ONLY the data type from the SFDU and return them. the list is
+            gathered once and shared by later calls, so do not modify it
+      """
+
+      # the format code is the single byte 31 of each SFDU, so gather it
+      #   straight from the existing index. indexing the data gives an int
+      if self.data_types is None:
+         data = self.binarydata
+         self.data_types = [ data[i+31] for i in self.index[:-1] ]
+      return self.data_types
+
+   def columns(self, *names, format_codes=None):
+      """ return a dict of parallel lists (one entry per SFDU) with the
+            SFDU number, the data description ID, the format code and the
+            requested secondary CHDO fields (or tracking CHDO fields in
+            util.trk_chdo_fields), read directly from the binary data without
+            decoding. fields that do not exist in an SFDU are -1.
+            format_codes is an optional set to only return those SFDUs
+      """
+
+      # the label and primary CHDO are at fixed locations in every SFDU
+      codes = self.get_data_types()
+      if format_codes is None:
+         numbers = range( len(codes) )
+         starts = self.index[:-1]
+      else:
+         numbers = [ i for i, code in enumerate( codes ) if code in format_codes ]
+         starts = [ self.index[i] for i in numbers ]
+         codes = [ codes[i] for i in numbers ]
+      cols = {}
+      cols['number'] = [ self.first + i for i in numbers ]
+      cols['data_description_id'] = [ self.binarydata[i+8:i+12].decode('ascii', 'replace') for i in starts ]
+      cols['format_code'] = codes
+
+      # the secondary CHDO layout depends on the data description ID, and the
+      #   tracking CHDO layout on the format code. single bytes are read by
+      #   indexing the data, which gives them as an int, and other fields
+      #   with a Struct compiled once per column
+      data = self.binarydata
+      for name in names:
+         if any( name in layout for layout in sec_chdo_fields.values() ):
+            layouts, keys = sec_chdo_fields, cols['data_description_id']
+         else:
+            layouts, keys = trk_chdo_fields, codes
+         fields = { key : (layout[name][0], struct.Struct(layout[name][1]).unpack_from)
+                    for key, layout in layouts.items() if name in layout and layout[name][1] != '>B' }
+         offsets = { key : layout[name][0] for key, layout in layouts.items()
+                     if name in layout and layout[name][1] == '>B' }
+         col = []
+         append = col.append
+         for i, key in zip( starts, keys ):
+            offset = offsets.get(key)
+            if offset is not None:
+               append( data[i+offset] )
+            elif key in fields:
+               offset, unpack_from = fields[key]
+               append( unpack_from(data, i+offset)[0] )
+            else:
+               append( -1 )
+         cols[name] = col
+      return cols
 
 # ---------------------------------------------------------------------------
@@ -52,7 +52,8 @@ Last Modified: 14-SEP-2023
 """
 
 from datetime import datetime, timedelta
-from .util import bands, data_descriptions, format_codes
+import sys
+from .util import bands, data_descriptions, format_codes, doy_datetime
 from .components import SFDULabel
 from .components import SFDUAggCHDO
 from .components import PrimaryCHDO
@@ -65,37 +66,75 @@ class SFDU:
       Read/decode an SFDU
    """
 
+   # secondary CHDO class for each data description ID
+   SEC_CHDO = {
+      'C123' : UplinkCHDO,
+      'C124' : DownlinkCHDO,
+      'C125' : DerivedCHDO,
+      'C126' : InferometricCHDO,
+      'C127' : FilteredCHDO,
+   }
+
+   # tracking CHDO class for each format code
+   TRK_CHDO = {
+      0 : UplinkCarrierPhaseTrackingCHDO,
+      1 : DownlinkCarrierPhaseTrackingCHDO,
+      2 : UplinkSequentialRangingPhaseTrackingCHDO,
+      3 : DownlinkSequentialRangingPhaseTrackingCHDO,
+      4 : UplinkPnRangingPhaseTrackingCHDO,
+      5 : DownlinkPnRangingPhaseTrackingCHDO,
+      6 : DopplerCountTrackingCHDO,
+      7 : SequentialRangeTrackingCHDO,
+      8 : AngleTrackingCHDO,
+      9 : RampTrackingCHDO,
+      10 : VlbiCHDO,
+      11 : DrvidTrackingCHDO,
+      12 : SmoothedNoiseTrackingCHDO,
+      13 : AllanDeviationTrackingCHDO,
+      14 : PnRangeTrackingCHDO,
+      15 : ToneRangeTrackingCHDO,
+      16 : CarrierFrequencyObservableTrackingCHDO,
+      17 : TotalCountPhaseObservableTrackingCHDO,
+   }
+
+   # tracking mode name for each prdx_mode. 3-way modes (3) also name the
+   #   uplink station, and are formatted in tracking_mode()
+   TRACKING_MODES = { 0 : 'None', 1 : '1W', 2 : '2W', 4 : 'Invalid' }
+
+   # an SFDU is created for every record in a file, so keep them small
+   __slots__ = ( 'binarydata', 'number', 'label', 'agg_chdo', 'pri_chdo', 'sec_chdo', 'trk_chdo', 'is_decoded' )
+
    def __init__(self):
-      """ class constructor """
-      self.binarydata = ''
+      """ class constructor. the label and the CHDOs are created when they
+            are decoded, or as empty defaults when they are skipped """
+      self.binarydata = b''
       self.number = 0
-      self.label = SFDULabel()
-      self.agg_chdo = SFDUAggCHDO()
-      self.pri_chdo = PrimaryCHDO()
+      self.label = None
+      self.agg_chdo = None
+      self.pri_chdo = None
       self.sec_chdo = None
       self.trk_chdo = None
       self.is_decoded = False
 
    def __str__(self):
       """ print string """
-      out = 'TRK2-34 SFDU[%i]:\n' % self.number
-      out += 'SFDU_Label = {'
-      out += '\n' + self.label.__str__()
-      out += '}\nAggregation_CHDO = {'
-      out += '\n' + self.agg_chdo.__str__()
-      out += '}\nPrimary_CHDO = {'
-      out += '\n' + self.pri_chdo.__str__()
-      out += '}\nSecondary_CHDO = {'
-      out += '\n' + self.sec_chdo.__str__()
-      out += '}\nTracking_CHDO = {'
-      out += '\n' + self.trk_chdo.__str__()
-      out += '}'
-      return out
+      # built with a single format instead of appending each part. header
+      #   parts that were never created print as their empty defaults
+      return ( 'TRK2-34 SFDU[%i]:\n'
+               'SFDU_Label = {\n%s}\n'
+               'Aggregation_CHDO = {\n%s}\n'
+               'Primary_CHDO = {\n%s}\n'
+               'Secondary_CHDO = {\n%s}\n'
+               'Tracking_CHDO = {\n%s}' ) % \
+             ( self.number,
+               SFDULabel() if self.label is None else self.label,
+               SFDUAggCHDO() if self.agg_chdo is None else self.agg_chdo,
+               PrimaryCHDO() if self.pri_chdo is None else self.pri_chdo,
+               self.sec_chdo, self.trk_chdo )
 
    def timestamp(self):
       """ Return a timestamp (python datetime) of the SFDU """
-      return datetime(year=self.sec_chdo.year, month=1, day=1) + \
-                timedelta(days=self.sec_chdo.doy - 1, seconds=self.sec_chdo.sec )
+      return doy_datetime( self.sec_chdo.year, self.sec_chdo.doy, self.sec_chdo.sec )
 
    def last_modified(self):
       """ Return the python datetime this SFDU was last modified on """
@@ -104,43 +143,20 @@ class SFDU:
 
    def tracking_mode(self):
       """ Return a string of the tracking mode (None, 1W, 2W, 3W/DSS, Invalid) """
-      if self.label.data_description_id != 'C123':
-         if self.sec_chdo.prdx_mode == 4:
-            return 'Invalid'
-         elif self.sec_chdo.prdx_mode == 3:
-            return '3W/%i' % self.sec_chdo.ul_prdx_stn
-         elif self.sec_chdo.prdx_mode == 2:
-            return '2W'
-         elif self.sec_chdo.prdx_mode == 1:
-            return '1W'
-         elif self.sec_chdo.prdx_mode == 0:
-            return 'None'
-      else:
+      if self.label.data_description_id == 'C123':
          return 'N/A'
+      mode = self.sec_chdo.prdx_mode
+      if mode == 3:
+         return '3W/%i' % self.sec_chdo.ul_prdx_stn
+      return self.TRACKING_MODES.get( mode )
 
    def dss_id(self):
       """ Return a tuple of (uplink, downlink) DSS ID for the SFDU. """
-      if hasattr( self.sec_chdo, 'ul_dss_id' ):
-         uplink_id = self.sec_chdo.ul_dss_id
-      else:
-         uplink_id = 0
-      if hasattr( self.sec_chdo, 'dl_dss_id' ):
-         dnlink_id = self.sec_chdo.dl_dss_id
-      else:
-         dnlink_id = 0
-      return ( uplink_id, dnlink_id )
+      return ( getattr(self.sec_chdo, 'ul_dss_id', 0), getattr(self.sec_chdo, 'dl_dss_id', 0) )
 
    def radio_band(self):
       """ Return a tuple of (uplink, downlink) radiometric band (X,S,L,Ka,etc) """
-      if hasattr( self.sec_chdo, 'ul_band' ):
-         uplink_band = self.sec_chdo.ul_band
-      else:
-         uplink_band = 0
-      if hasattr( self.sec_chdo, 'dl_band' ):
-         dnlink_band = self.sec_chdo.dl_band
-      else:
-         dnlink_band = 0
-      return ( bands[uplink_band], bands[dnlink_band] )
+      return ( bands[getattr(self.sec_chdo, 'ul_band', 0)], bands[getattr(self.sec_chdo, 'dl_band', 0)] )
 
    def decode(self, binarystring, label=True, agg_chdo=True, pri_chdo=True, sec_chdo=True, trk_chdo=True):
       """ decode the SFDU binary string. only decode if the kwargs are True.
@@ -149,83 +165,54 @@ class SFDU:
       # Store binary data
       self.binarydata = binarystring
 
-      # decode the label
+      # decode the label. a part that is skipped keeps its previous value,
+      #   or gets an empty default so the checks below still work
       if label:
+         self.label = SFDULabel()
          self.label.decode( self.binarydata ) 
+      elif self.label is None:
+         self.label = SFDULabel()
       if agg_chdo:
+         self.agg_chdo = SFDUAggCHDO()
          self.agg_chdo.decode( self.binarydata )
+      elif self.agg_chdo is None:
+         self.agg_chdo = SFDUAggCHDO()
 
       # decode the primary CHDO
       if pri_chdo:
+         self.pri_chdo = PrimaryCHDO()
          self.pri_chdo.decode( self.binarydata )
+      elif self.pri_chdo is None:
+         self.pri_chdo = PrimaryCHDO()
 
       # decode the secondary CHDO - first, deterimine the type, then decode
       if sec_chdo:
-         if self.label.data_description_id == 'C123':
-            self.sec_chdo = UplinkCHDO()
-         elif self.label.data_description_id == 'C124':
-            self.sec_chdo = DownlinkCHDO()
-         elif self.label.data_description_id == 'C125':
-            self.sec_chdo = DerivedCHDO()
-         elif self.label.data_description_id == 'C126':
-            self.sec_chdo = InferometricCHDO()
-         elif self.label.data_description_id == 'C127':
-            self.sec_chdo = FilteredCHDO()
-         else:
+         chdo = self.SEC_CHDO.get( self.label.data_description_id )
+         if chdo is None:
             #raise RuntimeError("The secondary CHDO code %s cannot be decoded." % self.label.data_description_id + \
             #    "The TRK 2-34 file is likely corrupted")
-            print( "SFDU %d: Warning: Unknown secondary CHDO type %s. Skipping..." % (self.number, self.label.data_description_id) )
+            # warnings go to stderr, so they do not mix with the data output
+            print( "SFDU %d: Warning: Unknown secondary CHDO type %s. Skipping..." % (self.number, self.label.data_description_id),
+                   file=sys.stderr )
             self.is_decoded = False
             return
 
+         self.sec_chdo = chdo()
          self.sec_chdo.decode( self.binarydata )
 
       # decode the tracking CHDO - first, determine the type, then decode
       if trk_chdo:
-         if self.pri_chdo.format_code == 0:
-            self.trk_chdo = UplinkCarrierPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 1:
-            self.trk_chdo = DownlinkCarrierPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 2:
-            self.trk_chdo = UplinkSequentialRangingPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 3:
-            self.trk_chdo = DownlinkSequentialRangingPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 4:
-            self.trk_chdo = UplinkPnRangingPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 5:
-            self.trk_chdo = DownlinkPnRangingPhaseTrackingCHDO()
-         elif self.pri_chdo.format_code == 6:
-            self.trk_chdo = DopplerCountTrackingCHDO()
-         elif self.pri_chdo.format_code == 7:
-            self.trk_chdo = SequentialRangeTrackingCHDO()
-         elif self.pri_chdo.format_code == 8:
-            self.trk_chdo = AngleTrackingCHDO()
-         elif self.pri_chdo.format_code == 9:
-            self.trk_chdo = RampTrackingCHDO()
-         elif self.pri_chdo.format_code == 10:
-            self.trk_chdo = VlbiCHDO()
-         elif self.pri_chdo.format_code == 11:
-            self.trk_chdo = DrvidTrackingCHDO()
-         elif self.pri_chdo.format_code == 12:
-            self.trk_chdo = SmoothedNoiseTrackingCHDO()
-         elif self.pri_chdo.format_code == 13:
-            self.trk_chdo = AllanDeviationTrackingCHDO()
-         elif self.pri_chdo.format_code == 14:
-            self.trk_chdo = PnRangeTrackingCHDO()
-         elif self.pri_chdo.format_code == 15:
-            self.trk_chdo = ToneRangeTrackingCHDO()
-         elif self.pri_chdo.format_code == 16:
-            self.trk_chdo = CarrierFrequencyObservableTrackingCHDO()
-         elif self.pri_chdo.format_code == 17:
-            self.trk_chdo = TotalCountPhaseObservableTrackingCHDO()
-         else:
+         chdo = self.TRK_CHDO.get( self.pri_chdo.format_code )
+         if chdo is None:
             #raise RuntimeError("The trakcing CHDO code %i cannot be decoded." + \
             #    "The TRK 2-34 file is likely corrupted" % \
             #    self.pri_chdo.format_code )
-            print( "SFDU %d: Warning: Unknown tracking CHDO type %i. Skipping..." % (self.number, self.pri_chdo.format_code) )
+            print( "SFDU %d: Warning: Unknown tracking CHDO type %i. Skipping..." % (self.number, self.pri_chdo.format_code),
+                   file=sys.stderr )
             self.is_decoded = False
             return
 
+         self.trk_chdo = chdo()
          self.trk_chdo.decode( self.binarydata )
 
       self.is_decoded = True
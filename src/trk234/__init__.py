@@ -52,7 +52,7 @@ Last Modified: 14-SEP-2023
 from .Reader import Reader
 from .Info import Info
 from .SFDU import SFDU
-from .util import bands, format_codes, data_descriptions, types
+from .util import bands, band_codes, format_codes, data_descriptions, types, doy_datetime, fast_iso, sfdu_runs, output_name, write_runs
 from importlib.metadata import version, PackageNotFoundError
 
 try:
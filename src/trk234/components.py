@@ -89,26 +89,21 @@ class SFDULabel:
       out += '         sfdu_length = %i\n' % self.sfdu_length
       return out
 
+   # the fixed fields of bytes 0-20, decoded in a single call
+   LAYOUT = struct.Struct( '>4scc2s4sQ' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # control_auth_id: 4 character string, bytes 0-4
-      self.control_auth_id = struct.unpack('>4s', sfdu_block[0:4])[0]
-
       # sfdu_version_id: 1 character, byte 4
-      self.sfdu_version_id = struct.unpack('>c', sfdu_block[4:5])[0]
-
       # sfdu_class_id: 1 character, byte 5
-      self.sfdu_class_id = struct.unpack('>c', sfdu_block[5:6])[0]
-
       # reserve2: 2 character string, byte 6-8
-      self.reserve2 = struct.unpack('>2s', sfdu_block[6:8])[0]
-
       # data_description_id: 4 character string, bytes 8-12
-      self.data_description_id = struct.unpack('>4s', sfdu_block[8:12])[0].decode('ascii')
-
       # sfdu_length: 8 byte integer, bytes 12-20
-      self.sfdu_length = struct.unpack('>Q', sfdu_block[12:20])[0]
+      ( self.control_auth_id, self.sfdu_version_id, self.sfdu_class_id, self.reserve2,
+        self.data_description_id, self.sfdu_length ) = self.LAYOUT.unpack_from( sfdu_block, 0 )
+      self.data_description_id = self.data_description_id.decode('ascii')
 
       # POST-PROCESS: convert the data_description_id to a string
       try:
@@ -138,14 +133,15 @@ class SFDUAggCHDO:
       out += '         chdo_length = %i \n' % self.chdo_length
       return out
 
+   # the fixed fields of bytes 20-24, decoded in a single call
+   LAYOUT = struct.Struct( '>HH' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte integer, bytes 20-22
-      self.chdo_type = struct.unpack('>H', sfdu_block[20:22])[0]
-      
       # chdo_length: 2 byte integer, bytes 22-24
-      self.chdo_length = struct.unpack('>H', sfdu_block[22:24])[0]
+      ( self.chdo_type, self.chdo_length ) = self.LAYOUT.unpack_from( sfdu_block, 20 )
 
 # ---------------------------------------------------------------------------
 
@@ -182,26 +178,20 @@ class PrimaryCHDO:
       return out
 
 
+   # the fixed fields of bytes 24-32, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBBB' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte integer, bytes 24-26
-      self.chdo_type = struct.unpack('>H', sfdu_block[24:26])[0]
-
       # chdo_length: 2 byte integer, bytes 26-28
-      self.chdo_length = struct.unpack('>H', sfdu_block[26:28])[0]
-
       # mjr_data_class: 1 byte integer, byte 28
-      self.mjr_data_class = struct.unpack('>B', sfdu_block[28:29])[0]
-
       # mnr_data_class: 1 byte integer, byte 29
-      self.mnr_data_class = struct.unpack('>B', sfdu_block[29:30])[0]
-
       # mission_id: 1 byte integer, byte 30
-      self.mission_id = struct.unpack('>B', sfdu_block[30:31])[0]
-
       # format_code: 1 byte integer, byte 31
-      self.format_code = struct.unpack('>B', sfdu_block[31:32])[0]
+      ( self.chdo_type, self.chdo_length, self.mjr_data_class, self.mnr_data_class,
+        self.mission_id, self.format_code ) = self.LAYOUT.unpack_from( sfdu_block, 24 )
 
       # POST-PROCESSING: decode the format string
       self.format = format_codes[self.format_code]
@@ -290,104 +280,51 @@ class UplinkCHDO:
       out += '            reserve4 = %s \n' % self.reserve4
       return out
 
+   # the fixed fields of bytes 32-102, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBB1sBIIHHdHIBBBBBBBBB1sdfHIBBB1s4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 32-34
-      self.chdo_type = struct.unpack('>H', sfdu_block[32:34])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 34-36
-      self.chdo_length = struct.unpack('>H', sfdu_block[34:36])[0]
-
       # orig_id: 1 byte UnsignedByte, bytes 36-37
-      self.orig_id = struct.unpack('>B', sfdu_block[36:37])[0]
-
       # last_modifier_id: 1 byte UnsignedByte, bytes 37-38
-      self.last_modifier_id = struct.unpack('>B', sfdu_block[37:38])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 38-39
-      self.reserve1 = sfdu_block[38:39]
-
       # scft_id: 1 byte UnsignedByte, bytes 39-40
-      self.scft_id = struct.unpack('>B', sfdu_block[39:40])[0]
-
       # upl_rec_seq_num: 4 byte UnsignedMSB4, bytes 40-44
-      self.upl_rec_seq_num = struct.unpack('>I', sfdu_block[40:44])[0]
-
       # rec_seq_num: 4 byte UnsignedMSB4, bytes 44-48
-      self.rec_seq_num = struct.unpack('>I', sfdu_block[44:48])[0]
-
       # year: 2 byte UnsignedMSB2, bytes 48-50
-      self.year = struct.unpack('>H', sfdu_block[48:50])[0]
-
       # doy: 2 byte UnsignedMSB2, bytes 50-52
-      self.doy = struct.unpack('>H', sfdu_block[50:52])[0]
-
       # sec: 8 byte IEEE754MSBDouble, bytes 52-60
-      self.sec = struct.unpack('>d', sfdu_block[52:60])[0]
-
       # rct_day: 2 byte UnsignedMSB2, bytes 60-62
-      self.rct_day = struct.unpack('>H', sfdu_block[60:62])[0]
-
       # rct_msec: 4 byte UnsignedMSB4, bytes 62-66
-      self.rct_msec = struct.unpack('>I', sfdu_block[62:66])[0]
-
       # ul_dss_id: 1 byte UnsignedByte, bytes 66-67
-      self.ul_dss_id = struct.unpack('>B', sfdu_block[66:67])[0]
-
       # ul_band: 1 byte UnsignedByte, bytes 67-68
-      self.ul_band = struct.unpack('>B', sfdu_block[67:68])[0]
-
       # ul_assembly_num: 1 byte UnsignedByte, bytes 68-69
-      self.ul_assembly_num = struct.unpack('>B', sfdu_block[68:69])[0]
-
       # transmit_num: 1 byte UnsignedByte, bytes 69-70
-      self.transmit_num = struct.unpack('>B', sfdu_block[69:70])[0]
-
       # transmit_stat: 1 byte UnsignedByte, bytes 70-71
-      self.transmit_stat = struct.unpack('>B', sfdu_block[70:71])[0]
-
       # transmit_mode: 1 byte UnsignedByte, bytes 71-72
-      self.transmit_mode = struct.unpack('>B', sfdu_block[71:72])[0]
-
       # cmd_modul_stat: 1 byte UnsignedByte, bytes 72-73
-      self.cmd_modul_stat = struct.unpack('>B', sfdu_block[72:73])[0]
-
       # rng_modul_stat: 1 byte UnsignedByte, bytes 73-74
-      self.rng_modul_stat = struct.unpack('>B', sfdu_block[73:74])[0]
-
       # fts_vld_flag: 1 byte UnsignedByte, bytes 74-75
-      self.fts_vld_flag = struct.unpack('>B', sfdu_block[74:75])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 75-76
-      self.reserve1a = sfdu_block[75:76]
-
       # transmit_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 76-84
-      self.transmit_time_tag_delay = struct.unpack('>d', sfdu_block[76:84])[0]
-
       # ul_zheight_corr: 4 byte IEEE754MSBSingle, bytes 84-88
-      self.ul_zheight_corr = struct.unpack('>f', sfdu_block[84:88])[0]
-
       # mod_day: 2 byte UnsignedMSB2, bytes 88-90
-      self.mod_day = struct.unpack('>H', sfdu_block[88:90])[0]
-
       # mod_msec: 4 byte UnsignedMSB4, bytes 90-94
-      self.mod_msec = struct.unpack('>I', sfdu_block[90:94])[0]
-
       # version_num: 1 byte UnsignedByte, bytes 94-95
-      self.version_num = struct.unpack('>B', sfdu_block[94:95])[0]
-
       # sub_version_num: 1 byte UnsignedByte, bytes 95-96
-      self.sub_version_num = struct.unpack('>B', sfdu_block[95:96])[0]
-
       # sub_sub_version_num: 1 byte UnsignedByte, bytes 96-97
-      self.sub_sub_version_num = struct.unpack('>B', sfdu_block[96:97])[0]
-
       # reserve1b: 1 byte UnsignedByte, bytes 97-98
-      self.reserve1b = sfdu_block[97:98]
-
       # reserve4: 4 byte UnsignedMSB4, bytes 98-102
-      self.reserve4 = sfdu_block[98:102]
+      ( self.chdo_type, self.chdo_length, self.orig_id, self.last_modifier_id, self.reserve1,
+        self.scft_id, self.upl_rec_seq_num, self.rec_seq_num, self.year, self.doy, self.sec,
+        self.rct_day, self.rct_msec, self.ul_dss_id, self.ul_band, self.ul_assembly_num,
+        self.transmit_num, self.transmit_stat, self.transmit_mode, self.cmd_modul_stat,
+        self.rng_modul_stat, self.fts_vld_flag, self.reserve1a, self.transmit_time_tag_delay,
+        self.ul_zheight_corr, self.mod_day, self.mod_msec, self.version_num, self.sub_version_num,
+        self.sub_sub_version_num, self.reserve1b, self.reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 32 )
 
 # ---------------------------------------------------------------------------
 
@@ -507,155 +444,72 @@ class DownlinkCHDO:
       out += '            reserve4 = %s \n' % self.reserve4
       return out
 
+   # the fixed fields of bytes 32-146, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBB1sBIIHHdHIBBBBBBdBBBBBBBBdfBBBBB1sddIIBBHIBBBB4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 32-34
-      self.chdo_type = struct.unpack('>H', sfdu_block[32:34])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 34-36
-      self.chdo_length = struct.unpack('>H', sfdu_block[34:36])[0]
-
       # orig_id: 1 byte UnsignedByte, bytes 36-37
-      self.orig_id = struct.unpack('>B', sfdu_block[36:37])[0]
-
       # last_modifier_id: 1 byte UnsignedByte, bytes 37-38
-      self.last_modifier_id = struct.unpack('>B', sfdu_block[37:38])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 38-39
-      self.reserve1 = sfdu_block[38:39]
-
       # scft_id: 1 byte UnsignedByte, bytes 39-40
-      self.scft_id = struct.unpack('>B', sfdu_block[39:40])[0]
-
       # dtt_rec_seq_num: 4 byte UnsignedMSB4, bytes 40-44
-      self.dtt_rec_seq_num = struct.unpack('>I', sfdu_block[40:44])[0]
-
       # rec_seq_num: 4 byte UnsignedMSB4, bytes 44-48
-      self.rec_seq_num = struct.unpack('>I', sfdu_block[44:48])[0]
-
       # year: 2 byte UnsignedMSB2, bytes 48-50
-      self.year = struct.unpack('>H', sfdu_block[48:50])[0]
-
       # doy: 2 byte UnsignedMSB2, bytes 50-52
-      self.doy = struct.unpack('>H', sfdu_block[50:52])[0]
-
       # sec: 8 byte IEEE754MSBDouble, bytes 52-60
-      self.sec = struct.unpack('>d', sfdu_block[52:60])[0]
-
       # rct_day: 2 byte UnsignedMSB2, bytes 60-62
-      self.rct_day = struct.unpack('>H', sfdu_block[60:62])[0]
-
       # rct_msec: 4 byte UnsignedMSB4, bytes 62-66
-      self.rct_msec = struct.unpack('>I', sfdu_block[62:66])[0]
-
       # dl_dss_id: 1 byte UnsignedByte, bytes 66-67
-      self.dl_dss_id = struct.unpack('>B', sfdu_block[66:67])[0]
-
       # dl_band: 1 byte UnsignedByte, bytes 67-68
-      self.dl_band = struct.unpack('>B', sfdu_block[67:68])[0]
-
       # dl_chan_num: 1 byte UnsignedByte, bytes 68-69
-      self.dl_chan_num = struct.unpack('>B', sfdu_block[68:69])[0]
-
       # prdx_mode: 1 byte UnsignedByte, bytes 69-70
-      self.prdx_mode = struct.unpack('>B', sfdu_block[69:70])[0]
-
       # ul_prdx_stn: 1 byte UnsignedByte, bytes 70-71
-      self.ul_prdx_stn = struct.unpack('>B', sfdu_block[70:71])[0]
-
       # ul_band_dl: 1 byte UnsignedByte, bytes 71-72
-      self.ul_band_dl = struct.unpack('>B', sfdu_block[71:72])[0]
-
       # array_delay: 8 byte IEEE754MSBDouble, bytes 72-80
-      self.array_delay = struct.unpack('>d', sfdu_block[72:80])[0]
-
       # fts_vld_flag: 1 byte UnsignedByte, bytes 80-81
-      self.fts_vld_flag = struct.unpack('>B', sfdu_block[80:81])[0]
-
       # carr_lock_stat: 1 byte UnsignedByte, bytes 81-82
-      self.carr_lock_stat = struct.unpack('>B', sfdu_block[81:82])[0]
-
       # array_flag: 1 byte UnsignedByte, bytes 82-83
-      self.array_flag = struct.unpack('>B', sfdu_block[82:83])[0]
-
       # polarization: 1 byte UnsignedByte, bytes 83-84
-      self.polarization = struct.unpack('>B', sfdu_block[83:84])[0]
-
       # diplxr_stat: 1 byte UnsignedByte, bytes 84-85
-      self.diplxr_stat = struct.unpack('>B', sfdu_block[84:85])[0]
-
       # lna_num: 1 byte UnsignedByte, bytes 85-86
-      self.lna_num = struct.unpack('>B', sfdu_block[85:86])[0]
-
       # rf_if_chan_num: 1 byte UnsignedByte, bytes 86-87
-      self.rf_if_chan_num = struct.unpack('>B', sfdu_block[86:87])[0]
-
       # if_num: 1 byte UnsignedByte, bytes 87-88
-      self.if_num = struct.unpack('>B', sfdu_block[87:88])[0]
-
       # rcv_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 88-96
-      self.rcv_time_tag_delay = struct.unpack('>d', sfdu_block[88:96])[0]
-
       # dl_zheight_corr: 4 byte IEEE754MSBSingle, bytes 96-100
-      self.dl_zheight_corr = struct.unpack('>f', sfdu_block[96:100])[0]
-
       # vld_ul_stn: 1 byte UnsignedByte, bytes 100-101
-      self.vld_ul_stn = struct.unpack('>B', sfdu_block[100:101])[0]
-
       # vld_dop_mode: 1 byte UnsignedByte, bytes 101-102
-      self.vld_dop_mode = struct.unpack('>B', sfdu_block[101:102])[0]
-
       # vld_scft_coh: 1 byte UnsignedByte, bytes 102-103
-      self.vld_scft_coh = struct.unpack('>B', sfdu_block[102:103])[0]
-
       # scft_transpd_lock: 1 byte UnsignedByte, bytes 103-104
-      self.scft_transpd_lock = struct.unpack('>B', sfdu_block[103:104])[0]
-
       # scft_transpd_num: 1 byte UnsignedByte, bytes 104-105
-      self.scft_transpd_num = struct.unpack('>B', sfdu_block[104:105])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 105-106
-      self.reserve1a = sfdu_block[105:106]
-
       # scft_osc_freq: 8 byte IEEE754MSBDouble, bytes 106-114
-      self.scft_osc_freq = struct.unpack('>d', sfdu_block[106:114])[0]
-
       # scft_transpd_delay: 8 byte IEEE754MSBDouble, bytes 114-122
-      self.scft_transpd_delay = struct.unpack('>d', sfdu_block[114:122])[0]
-
       # scft_transpd_turn_num: 4 byte UnsignedMSB4, bytes 122-126
-      self.scft_transpd_turn_num = struct.unpack('>I', sfdu_block[122:126])[0]
-
       # scft_transpd_turn_den: 4 byte UnsignedMSB4, bytes 126-130
-      self.scft_transpd_turn_den = struct.unpack('>I', sfdu_block[126:130])[0]
-
       # scft_twnc_stat: 1 byte UnsignedByte, bytes 130-131
-      self.scft_twnc_stat = struct.unpack('>B', sfdu_block[130:131])[0]
-
       # scft_osc_type: 1 byte UnsignedByte, bytes 131-132
-      self.scft_osc_type = struct.unpack('>B', sfdu_block[131:132])[0]
-
       # mod_day: 2 byte UnsignedMSB2, bytes 132-134
-      self.mod_day = struct.unpack('>H', sfdu_block[132:134])[0]
-
       # mod_msec: 4 byte UnsignedMSB4, bytes 134-138
-      self.mod_msec = struct.unpack('>I', sfdu_block[134:138])[0]
-
       # version_num: 1 byte UnsignedByte, bytes 138-139
-      self.version_num = struct.unpack('>B', sfdu_block[138:139])[0]
-
       # sub_version_num: 1 byte UnsignedByte, bytes 139-140
-      self.sub_version_num = struct.unpack('>B', sfdu_block[139:140])[0]
-
       # sub_sub_version_num: 1 byte UnsignedByte, bytes 140-141
-      self.sub_sub_version_num = struct.unpack('>B', sfdu_block[140:141])[0]
-
       # lna_corr_value: 1 byte UnsignedByte, bytes 141-142
-      self.lna_corr_value = struct.unpack('>B', sfdu_block[141:142])[0]
-
       # reserve4: 4 byte UnsignedMSB4, bytes 142-146
-      self.reserve4 = sfdu_block[142:146]
+      ( self.chdo_type, self.chdo_length, self.orig_id, self.last_modifier_id, self.reserve1,
+        self.scft_id, self.dtt_rec_seq_num, self.rec_seq_num, self.year, self.doy, self.sec,
+        self.rct_day, self.rct_msec, self.dl_dss_id, self.dl_band, self.dl_chan_num,
+        self.prdx_mode, self.ul_prdx_stn, self.ul_band_dl, self.array_delay, self.fts_vld_flag,
+        self.carr_lock_stat, self.array_flag, self.polarization, self.diplxr_stat, self.lna_num,
+        self.rf_if_chan_num, self.if_num, self.rcv_time_tag_delay, self.dl_zheight_corr,
+        self.vld_ul_stn, self.vld_dop_mode, self.vld_scft_coh, self.scft_transpd_lock,
+        self.scft_transpd_num, self.reserve1a, self.scft_osc_freq, self.scft_transpd_delay,
+        self.scft_transpd_turn_num, self.scft_transpd_turn_den, self.scft_twnc_stat,
+        self.scft_osc_type, self.mod_day, self.mod_msec, self.version_num, self.sub_version_num,
+        self.sub_sub_version_num, self.lna_corr_value, self.reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 32 )
 
 # ---------------------------------------------------------------------------
 
@@ -787,173 +641,80 @@ class DerivedCHDO:
       out += '      lna_corr_value = %i \n' % self.lna_corr_value
       return out
 
+   # the fixed fields of bytes 32-160, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBB1sBIHHdHIBBBBBBBBdfB1sBBBBdBBBBdfBBBBBB2sddIIBBHIfBBBB' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 32-34
-      self.chdo_type = struct.unpack('>H', sfdu_block[32:34])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 34-36
-      self.chdo_length = struct.unpack('>H', sfdu_block[34:36])[0]
-
       # orig_id: 1 byte UnsignedByte, bytes 36-37
-      self.orig_id = struct.unpack('>B', sfdu_block[36:37])[0]
-
       # last_modifier_id: 1 byte UnsignedByte, bytes 37-38
-      self.last_modifier_id = struct.unpack('>B', sfdu_block[37:38])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 38-39
-      self.reserve1 = sfdu_block[38:39]
-
       # scft_id: 1 byte UnsignedByte, bytes 39-40
-      self.scft_id = struct.unpack('>B', sfdu_block[39:40])[0]
-
       # rec_seq_num: 4 byte UnsignedMSB4, bytes 40-44
-      self.rec_seq_num = struct.unpack('>I', sfdu_block[40:44])[0]
-
       # year: 2 byte UnsignedMSB2, bytes 44-46
-      self.year = struct.unpack('>H', sfdu_block[44:46])[0]
-
       # doy: 2 byte UnsignedMSB2, bytes 46-48
-      self.doy = struct.unpack('>H', sfdu_block[46:48])[0]
-
       # sec: 8 byte IEEE754MSBDouble, bytes 48-56
-      self.sec = struct.unpack('>d', sfdu_block[48:56])[0]
-
       # rct_day: 2 byte UnsignedMSB2, bytes 56-58
-      self.rct_day = struct.unpack('>H', sfdu_block[56:58])[0]
-
       # rct_msec: 4 byte UnsignedMSB4, bytes 58-62
-      self.rct_msec = struct.unpack('>I', sfdu_block[58:62])[0]
-
       # stn_stream_src: 1 byte UnsignedByte, bytes 62-63
-      self.stn_stream_src = struct.unpack('>B', sfdu_block[62:63])[0]
-
       # ul_band: 1 byte UnsignedByte, bytes 63-64
-      self.ul_band = struct.unpack('>B', sfdu_block[63:64])[0]
-
       # ul_assembly_num: 1 byte UnsignedByte, bytes 64-65
-      self.ul_assembly_num = struct.unpack('>B', sfdu_block[64:65])[0]
-
       # transmit_num: 1 byte UnsignedByte, bytes 65-66
-      self.transmit_num = struct.unpack('>B', sfdu_block[65:66])[0]
-
       # transmit_stat: 1 byte UnsignedByte, bytes 66-67
-      self.transmit_stat = struct.unpack('>B', sfdu_block[66:67])[0]
-
       # transmit_mode: 1 byte UnsignedByte, bytes 67-68
-      self.transmit_mode = struct.unpack('>B', sfdu_block[67:68])[0]
-
       # cmd_modul_stat: 1 byte UnsignedByte, bytes 68-69
-      self.cmd_modul_stat = struct.unpack('>B', sfdu_block[68:69])[0]
-
       # rng_modul_stat: 1 byte UnsignedByte, bytes 69-70
-      self.rng_modul_stat = struct.unpack('>B', sfdu_block[69:70])[0]
-
       # transmit_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 70-78
-      self.transmit_time_tag_delay = struct.unpack('>d', sfdu_block[70:78])[0]
-
       # ul_zheight_corr: 4 byte IEEE754MSBSingle, bytes 78-82
-      self.ul_zheight_corr = struct.unpack('>f', sfdu_block[78:82])[0]
-
       # dl_dss_id: 1 byte UnsignedByte, bytes 82-83
-      self.dl_dss_id = struct.unpack('>B', sfdu_block[82:83])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 83-84
-      self.reserve1a = sfdu_block[83:84]
-
       # dl_chan_num: 1 byte UnsignedByte, bytes 84-85
-      self.dl_chan_num = struct.unpack('>B', sfdu_block[84:85])[0]
-
       # prdx_mode: 1 byte UnsignedByte, bytes 85-86
-      self.prdx_mode = struct.unpack('>B', sfdu_block[85:86])[0]
-
       # ul_prdx_stn: 1 byte UnsignedByte, bytes 86-87
-      self.ul_prdx_stn = struct.unpack('>B', sfdu_block[86:87])[0]
-
       # ul_band_dl: 1 byte UnsignedByte, bytes 87-88
-      self.ul_band_dl = struct.unpack('>B', sfdu_block[87:88])[0]
-
       # array_delay: 8 byte IEEE754MSBDouble, bytes 88-96
-      self.array_delay = struct.unpack('>d', sfdu_block[88:96])[0]
-
       # fts_vld_flag: 1 byte UnsignedByte, bytes 96-97
-      self.fts_vld_flag = struct.unpack('>B', sfdu_block[96:97])[0]
-
       # carr_lock_stat: 1 byte UnsignedByte, bytes 97-98
-      self.carr_lock_stat = struct.unpack('>B', sfdu_block[97:98])[0]
-
       # array_flag: 1 byte UnsignedByte, bytes 98-99
-      self.array_flag = struct.unpack('>B', sfdu_block[98:99])[0]
-
       # lna_num: 1 byte UnsignedByte, bytes 99-100
-      self.lna_num = struct.unpack('>B', sfdu_block[99:100])[0]
-
       # rcv_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 100-108
-      self.rcv_time_tag_delay = struct.unpack('>d', sfdu_block[100:108])[0]
-
       # dl_zheight_corr: 4 byte IEEE754MSBSingle, bytes 108-112
-      self.dl_zheight_corr = struct.unpack('>f', sfdu_block[108:112])[0]
-
       # vld_ul_stn: 1 byte UnsignedByte, bytes 112-113
-      self.vld_ul_stn = struct.unpack('>B', sfdu_block[112:113])[0]
-
       # vld_dop_mode: 1 byte UnsignedByte, bytes 113-114
-      self.vld_dop_mode = struct.unpack('>B', sfdu_block[113:114])[0]
-
       # vld_scft_coh: 1 byte UnsignedByte, bytes 114-115
-      self.vld_scft_coh = struct.unpack('>B', sfdu_block[114:115])[0]
-
       # vld_dl_band: 1 byte UnsignedByte, bytes 115-116
-      self.vld_dl_band = struct.unpack('>B', sfdu_block[115:116])[0]
-
       # scft_transpd_lock: 1 byte UnsignedByte, bytes 116-117
-      self.scft_transpd_lock = struct.unpack('>B', sfdu_block[116:117])[0]
-
       # scft_transpd_num: 1 byte UnsignedByte, bytes 117-118
-      self.scft_transpd_num = struct.unpack('>B', sfdu_block[117:118])[0]
-
       # reserve2: 2 byte UnsignedMSB2, bytes 118-120
-      self.reserve2 = sfdu_block[118:120]
-
       # scft_osc_freq: 8 byte IEEE754MSBDouble, bytes 120-128
-      self.scft_osc_freq = struct.unpack('>d', sfdu_block[120:128])[0]
-
       # scft_transpd_delay: 8 byte IEEE754MSBDouble, bytes 128-136
-      self.scft_transpd_delay = struct.unpack('>d', sfdu_block[128:136])[0]
-
       # scft_transpd_turn_num: 4 byte UnsignedMSB4, bytes 136-140
-      self.scft_transpd_turn_num = struct.unpack('>I', sfdu_block[136:140])[0]
-
       # scft_transpd_turn_den: 4 byte UnsignedMSB4, bytes 140-144
-      self.scft_transpd_turn_den = struct.unpack('>I', sfdu_block[140:144])[0]
-
       # scft_twnc_stat: 1 byte UnsignedByte, bytes 144-145
-      self.scft_twnc_stat = struct.unpack('>B', sfdu_block[144:145])[0]
-
       # scft_osc_type: 1 byte UnsignedByte, bytes 145-146
-      self.scft_osc_type = struct.unpack('>B', sfdu_block[145:146])[0]
-
       # mod_day: 2 byte UnsignedMSB2, bytes 146-148
-      self.mod_day = struct.unpack('>H', sfdu_block[146:148])[0]
-
       # mod_msec: 4 byte UnsignedMSB4, bytes 148-152
-      self.mod_msec = struct.unpack('>I', sfdu_block[148:152])[0]
-
       # cnt_time: 4 byte IEEE754MSBSingle, bytes 152-156
-      self.cnt_time = struct.unpack('>f', sfdu_block[152:156])[0]
-
       # version_num: 1 byte UnsignedByte, bytes 156-157
-      self.version_num = struct.unpack('>B', sfdu_block[156:157])[0]
-
       # sub_version_num: 1 byte UnsignedByte, bytes 157-158
-      self.sub_version_num = struct.unpack('>B', sfdu_block[157:158])[0]
-
       # sub_sub_version_num: 1 byte UnsignedByte, bytes 158-159
-      self.sub_sub_version_num = struct.unpack('>B', sfdu_block[158:159])[0]
-
       # lna_corr_value: 1 byte UnsignedByte, bytes 159-160
-      self.lna_corr_value = struct.unpack('>B', sfdu_block[159:160])[0]
+      ( self.chdo_type, self.chdo_length, self.orig_id, self.last_modifier_id, self.reserve1,
+        self.scft_id, self.rec_seq_num, self.year, self.doy, self.sec, self.rct_day, self.rct_msec,
+        self.stn_stream_src, self.ul_band, self.ul_assembly_num, self.transmit_num,
+        self.transmit_stat, self.transmit_mode, self.cmd_modul_stat, self.rng_modul_stat,
+        self.transmit_time_tag_delay, self.ul_zheight_corr, self.dl_dss_id, self.reserve1a,
+        self.dl_chan_num, self.prdx_mode, self.ul_prdx_stn, self.ul_band_dl, self.array_delay,
+        self.fts_vld_flag, self.carr_lock_stat, self.array_flag, self.lna_num,
+        self.rcv_time_tag_delay, self.dl_zheight_corr, self.vld_ul_stn, self.vld_dop_mode,
+        self.vld_scft_coh, self.vld_dl_band, self.scft_transpd_lock, self.scft_transpd_num,
+        self.reserve2, self.scft_osc_freq, self.scft_transpd_delay, self.scft_transpd_turn_num,
+        self.scft_transpd_turn_den, self.scft_twnc_stat, self.scft_osc_type, self.mod_day,
+        self.mod_msec, self.cnt_time, self.version_num, self.sub_version_num,
+        self.sub_sub_version_num, self.lna_corr_value ) = self.LAYOUT.unpack_from( sfdu_block, 32 )
 
 # ---------------------------------------------------------------------------
 
@@ -1045,113 +806,55 @@ class InferometricCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 32-124, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBB1sBIHHdHIBBBBBBBBB1sBBddddHIBBB1s8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 32-34
-      self.chdo_type = struct.unpack('>H', sfdu_block[32:34])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 34-36
-      self.chdo_length = struct.unpack('>H', sfdu_block[34:36])[0]
-
       # orig_id: 1 byte UnsignedByte, bytes 36-37
-      self.orig_id = struct.unpack('>B', sfdu_block[36:37])[0]
-
       # last_modifier_id: 1 byte UnsignedByte, bytes 37-38
-      self.last_modifier_id = struct.unpack('>B', sfdu_block[37:38])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 38-39
-      self.reserve1a = sfdu_block[38:39]
-
       # scft_id: 1 byte UnsignedByte, bytes 39-40
-      self.scft_id = struct.unpack('>B', sfdu_block[39:40])[0]
-
       # rec_seq_num: 4 byte UnsignedMSB4, bytes 40-44
-      self.rec_seq_num = struct.unpack('>I', sfdu_block[40:44])[0]
-
       # year: 2 byte UnsignedMSB2, bytes 44-46
-      self.year = struct.unpack('>H', sfdu_block[44:46])[0]
-
       # doy: 2 byte UnsignedMSB2, bytes 46-48
-      self.doy = struct.unpack('>H', sfdu_block[46:48])[0]
-
       # sec: 8 byte IEEE754MSBDouble, bytes 48-56
-      self.sec = struct.unpack('>d', sfdu_block[48:56])[0]
-
       # rct_day: 2 byte UnsignedMSB2, bytes 56-58
-      self.rct_day = struct.unpack('>H', sfdu_block[56:58])[0]
-
       # rct_msec: 4 byte UnsignedMSB4, bytes 58-62
-      self.rct_msec = struct.unpack('>I', sfdu_block[58:62])[0]
-
       # ul_dss_id: 1 byte UnsignedByte, bytes 62-63
-      self.ul_dss_id = struct.unpack('>B', sfdu_block[62:63])[0]
-
       # dl_dss_id: 1 byte UnsignedByte, bytes 63-64
-      self.dl_dss_id = struct.unpack('>B', sfdu_block[63:64])[0]
-
       # dl_dss_id_2: 1 byte UnsignedByte, bytes 64-65
-      self.dl_dss_id_2 = struct.unpack('>B', sfdu_block[64:65])[0]
-
       # dl_band: 1 byte UnsignedByte, bytes 65-66
-      self.dl_band = struct.unpack('>B', sfdu_block[65:66])[0]
-
       # prdx_mode: 1 byte UnsignedByte, bytes 66-67
-      self.prdx_mode = struct.unpack('>B', sfdu_block[66:67])[0]
-
       # ul_band: 1 byte UnsignedByte, bytes 67-68
-      self.ul_band = struct.unpack('>B', sfdu_block[67:68])[0]
-
       # rec_type: 1 byte UnsignedByte, bytes 68-69
-      self.rec_type = struct.unpack('>B', sfdu_block[68:69])[0]
-
       # source_type: 1 byte UnsignedByte, bytes 69-70
-      self.source_type = struct.unpack('>B', sfdu_block[69:70])[0]
-
       # fts_vld_flag: 1 byte UnsignedByte, bytes 70-71
-      self.fts_vld_flag = struct.unpack('>B', sfdu_block[70:71])[0]
-
       # reserve1b: 1 byte UnsignedByte, bytes 71-72
-      self.reserve1b = sfdu_block[71:72]
-
       # array_flag: 1 byte UnsignedByte, bytes 72-73
-      self.array_flag = struct.unpack('>B', sfdu_block[72:73])[0]
-
       # array_flag_2: 1 byte UnsignedByte, bytes 73-74
-      self.array_flag_2 = struct.unpack('>B', sfdu_block[73:74])[0]
-
       # array_delay: 8 byte IEEE754MSBDouble, bytes 74-82
-      self.array_delay = struct.unpack('>d', sfdu_block[74:82])[0]
-
       # array_delay_2: 8 byte IEEE754MSBDouble, bytes 82-90
-      self.array_delay_2 = struct.unpack('>d', sfdu_block[82:90])[0]
-
       # rcv_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 90-98
-      self.rcv_time_tag_delay = struct.unpack('>d', sfdu_block[90:98])[0]
-
       # rcv_time_tag_delay_2: 8 byte IEEE754MSBDouble, bytes 98-106
-      self.rcv_time_tag_delay_2 = struct.unpack('>d', sfdu_block[98:106])[0]
-
       # mod_day: 2 byte UnsignedMSB2, bytes 106-108
-      self.mod_day = struct.unpack('>H', sfdu_block[106:108])[0]
-
       # mod_msec: 4 byte UnsignedMSB4, bytes 108-112
-      self.mod_msec = struct.unpack('>I', sfdu_block[108:112])[0]
-
       # version_num: 1 byte UnsignedByte, bytes 112-113
-      self.version_num = struct.unpack('>B', sfdu_block[112:113])[0]
-
       # sub_version_num: 1 byte UnsignedByte, bytes 113-114
-      self.sub_version_num = struct.unpack('>B', sfdu_block[113:114])[0]
-
       # sub_sub_version_num: 1 byte UnsignedByte, bytes 114-115
-      self.sub_sub_version_num = struct.unpack('>B', sfdu_block[114:115])[0]
-
       # reserve1c: 1 byte UnsignedByte, bytes 115-116
-      self.reserve1c = sfdu_block[115:116]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 116-124
-      self.reserve8 = sfdu_block[116:124]
+      ( self.chdo_type, self.chdo_length, self.orig_id, self.last_modifier_id, self.reserve1a,
+        self.scft_id, self.rec_seq_num, self.year, self.doy, self.sec, self.rct_day, self.rct_msec,
+        self.ul_dss_id, self.dl_dss_id, self.dl_dss_id_2, self.dl_band, self.prdx_mode,
+        self.ul_band, self.rec_type, self.source_type, self.fts_vld_flag, self.reserve1b,
+        self.array_flag, self.array_flag_2, self.array_delay, self.array_delay_2,
+        self.rcv_time_tag_delay, self.rcv_time_tag_delay_2, self.mod_day, self.mod_msec,
+        self.version_num, self.sub_version_num, self.sub_sub_version_num, self.reserve1c,
+        self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 32 )
 
 # ---------------------------------------------------------------------------
 
@@ -1259,137 +962,65 @@ class FilteredCHDO:
       out += '            reserve4 = %s \n' % self.reserve4
       return out
 
+   # the fixed fields of bytes 32-134, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBB1sBIHHdHIBBBBBBddBBBBBBBBB1sddIIBBHIBBB1s4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 32-34
-      self.chdo_type = struct.unpack('>H', sfdu_block[32:34])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 34-36
-      self.chdo_length = struct.unpack('>H', sfdu_block[34:36])[0]
-
       # orig_id: 1 byte UnsignedByte, bytes 36-37
-      self.orig_id = struct.unpack('>B', sfdu_block[36:37])[0]
-
       # last_modifier_id: 1 byte UnsignedByte, bytes 37-38
-      self.last_modifier_id = struct.unpack('>B', sfdu_block[37:38])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 38-39
-      self.reserve1 = sfdu_block[38:39]
-
       # scft_id: 1 byte UnsignedByte, bytes 39-40
-      self.scft_id = struct.unpack('>B', sfdu_block[39:40])[0]
-
       # rec_seq_num: 4 byte UnsignedMSB4, bytes 40-44
-      self.rec_seq_num = struct.unpack('>I', sfdu_block[40:44])[0]
-
       # year: 2 byte UnsignedMSB2, bytes 44-46
-      self.year = struct.unpack('>H', sfdu_block[44:46])[0]
-
       # doy: 2 byte UnsignedMSB2, bytes 46-48
-      self.doy = struct.unpack('>H', sfdu_block[46:48])[0]
-
       # sec: 8 byte IEEE754MSBDouble, bytes 48-56
-      self.sec = struct.unpack('>d', sfdu_block[48:56])[0]
-
       # rct_day: 2 byte UnsignedMSB2, bytes 56-58
-      self.rct_day = struct.unpack('>H', sfdu_block[56:58])[0]
-
       # rct_msec: 4 byte UnsignedMSB4, bytes 58-62
-      self.rct_msec = struct.unpack('>I', sfdu_block[58:62])[0]
-
       # dl_dss_id: 1 byte UnsignedByte, bytes 62-63
-      self.dl_dss_id = struct.unpack('>B', sfdu_block[62:63])[0]
-
       # dl_band: 1 byte UnsignedByte, bytes 63-64
-      self.dl_band = struct.unpack('>B', sfdu_block[63:64])[0]
-
       # dl_chan_num: 1 byte UnsignedByte, bytes 64-65
-      self.dl_chan_num = struct.unpack('>B', sfdu_block[64:65])[0]
-
       # prdx_mode: 1 byte UnsignedByte, bytes 65-66
-      self.prdx_mode = struct.unpack('>B', sfdu_block[65:66])[0]
-
       # ul_prdx_stn: 1 byte UnsignedByte, bytes 66-67
-      self.ul_prdx_stn = struct.unpack('>B', sfdu_block[66:67])[0]
-
       # ul_band_dl: 1 byte UnsignedByte, bytes 67-68
-      self.ul_band_dl = struct.unpack('>B', sfdu_block[67:68])[0]
-
       # rcv_time_tag_delay: 8 byte IEEE754MSBDouble, bytes 68-76
-      self.rcv_time_tag_delay = struct.unpack('>d', sfdu_block[68:76])[0]
-
       # array_delay: 8 byte IEEE754MSBDouble, bytes 76-84
-      self.array_delay = struct.unpack('>d', sfdu_block[76:84])[0]
-
       # fts_vld_flag: 1 byte UnsignedByte, bytes 84-85
-      self.fts_vld_flag = struct.unpack('>B', sfdu_block[84:85])[0]
-
       # carr_lock_stat: 1 byte UnsignedByte, bytes 85-86
-      self.carr_lock_stat = struct.unpack('>B', sfdu_block[85:86])[0]
-
       # array_flag: 1 byte UnsignedByte, bytes 86-87
-      self.array_flag = struct.unpack('>B', sfdu_block[86:87])[0]
-
       # lna_num: 1 byte UnsignedByte, bytes 87-88
-      self.lna_num = struct.unpack('>B', sfdu_block[87:88])[0]
-
       # vld_ul_stn: 1 byte UnsignedByte, bytes 88-89
-      self.vld_ul_stn = struct.unpack('>B', sfdu_block[88:89])[0]
-
       # vld_dop_mode: 1 byte UnsignedByte, bytes 89-90
-      self.vld_dop_mode = struct.unpack('>B', sfdu_block[89:90])[0]
-
       # vld_scft_coh: 1 byte UnsignedByte, bytes 90-91
-      self.vld_scft_coh = struct.unpack('>B', sfdu_block[90:91])[0]
-
       # scft_transpd_lock: 1 byte UnsignedByte, bytes 91-92
-      self.scft_transpd_lock = struct.unpack('>B', sfdu_block[91:92])[0]
-
       # scft_transpd_num: 1 byte UnsignedByte, bytes 92-93
-      self.scft_transpd_num = struct.unpack('>B', sfdu_block[92:93])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 93-94
-      self.reserve1a = sfdu_block[93:94]
-
       # scft_osc_freq: 8 byte IEEE754MSBDouble, bytes 94-102
-      self.scft_osc_freq = struct.unpack('>d', sfdu_block[94:102])[0]
-
       # scft_transpd_delay: 8 byte IEEE754MSBDouble, bytes 102-110
-      self.scft_transpd_delay = struct.unpack('>d', sfdu_block[102:110])[0]
-
       # scft_transpd_turn_num: 4 byte UnsignedMSB4, bytes 110-114
-      self.scft_transpd_turn_num = struct.unpack('>I', sfdu_block[110:114])[0]
-
       # scft_transpd_turn_den: 4 byte UnsignedMSB4, bytes 114-118
-      self.scft_transpd_turn_den = struct.unpack('>I', sfdu_block[114:118])[0]
-
       # scft_twnc_stat: 1 byte UnsignedByte, bytes 118-119
-      self.scft_twnc_stat = struct.unpack('>B', sfdu_block[118:119])[0]
-
       # scft_osc_type: 1 byte UnsignedByte, bytes 119-120
-      self.scft_osc_type = struct.unpack('>B', sfdu_block[119:120])[0]
-
       # mod_day: 2 byte UnsignedMSB2, bytes 120-122
-      self.mod_day = struct.unpack('>H', sfdu_block[120:122])[0]
-
       # mod_msec: 4 byte UnsignedMSB4, bytes 122-126
-      self.mod_msec = struct.unpack('>I', sfdu_block[122:126])[0]
-
       # version_num: 1 byte UnsignedByte, bytes 126-127
-      self.version_num = struct.unpack('>B', sfdu_block[126:127])[0]
-
       # sub_version_num: 1 byte UnsignedByte, bytes 127-128
-      self.sub_version_num = struct.unpack('>B', sfdu_block[127:128])[0]
-
       # sub_sub_version_num: 1 byte UnsignedByte, bytes 128-129
-      self.sub_sub_version_num = struct.unpack('>B', sfdu_block[128:129])[0]
-
       # reserve1b: 1 byte UnsignedByte, bytes 129-130
-      self.reserve1b = sfdu_block[129:130]
-
       # reserve4: 4 byte UnsignedMSB4, bytes 130-134
-      self.reserve4 = sfdu_block[130:134]
+      ( self.chdo_type, self.chdo_length, self.orig_id, self.last_modifier_id, self.reserve1,
+        self.scft_id, self.rec_seq_num, self.year, self.doy, self.sec, self.rct_day, self.rct_msec,
+        self.dl_dss_id, self.dl_band, self.dl_chan_num, self.prdx_mode, self.ul_prdx_stn,
+        self.ul_band_dl, self.rcv_time_tag_delay, self.array_delay, self.fts_vld_flag,
+        self.carr_lock_stat, self.array_flag, self.lna_num, self.vld_ul_stn, self.vld_dop_mode,
+        self.vld_scft_coh, self.scft_transpd_lock, self.scft_transpd_num, self.reserve1a,
+        self.scft_osc_freq, self.scft_transpd_delay, self.scft_transpd_turn_num,
+        self.scft_transpd_turn_den, self.scft_twnc_stat, self.scft_osc_type, self.mod_day,
+        self.mod_msec, self.version_num, self.sub_version_num, self.sub_sub_version_num,
+        self.reserve1b, self.reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 32 )
 
 # ---------------------------------------------------------------------------
 
@@ -1449,65 +1080,36 @@ class UplinkCarrierPhaseTrackingCHDO:
       out += '            reserve6 = %s \n' % self.reserve6
       return out
 
+   # the fixed fields of bytes 102-182, decoded in a single call
+   LAYOUT = struct.Struct( '>HHIIIddBBf8s8sddBBB1s6s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 102-104
-      self.chdo_type = struct.unpack('>H', sfdu_block[102:104])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 104-106
-      self.chdo_length = struct.unpack('>H', sfdu_block[104:106])[0]
-
       # ul_hi_phs_cycles: 4 byte UnsignedMSB4, bytes 106-110
-      self.ul_hi_phs_cycles = struct.unpack('>I', sfdu_block[106:110])[0]
-
       # ul_lo_phs_cycles: 4 byte UnsignedMSB4, bytes 110-114
-      self.ul_lo_phs_cycles = struct.unpack('>I', sfdu_block[110:114])[0]
-
       # ul_frac_phs_cycles: 4 byte UnsignedMSB4, bytes 114-118
-      self.ul_frac_phs_cycles = struct.unpack('>I', sfdu_block[114:118])[0]
-
       # ramp_freq: 8 byte IEEE754MSBDouble, bytes 118-126
-      self.ramp_freq = struct.unpack('>d', sfdu_block[118:126])[0]
-
       # ramp_rate: 8 byte IEEE754MSBDouble, bytes 126-134
-      self.ramp_rate = struct.unpack('>d', sfdu_block[126:134])[0]
-
       # transmit_switch_stat: 1 byte UnsignedByte, bytes 134-135
-      self.transmit_switch_stat = struct.unpack('>B', sfdu_block[134:135])[0]
-
       # ramp_type: 1 byte UnsignedByte, bytes 135-136
-      self.ramp_type = struct.unpack('>B', sfdu_block[135:136])[0]
-
       # transmit_op_pwr: 4 byte IEEE754MSBSingle, bytes 136-140
-      self.transmit_op_pwr = struct.unpack('>f', sfdu_block[136:140])[0]
-
       # sup_data_id: 8 byte ASCII_String, bytes 140-148
-      self.sup_data_id = struct.unpack('>8s', sfdu_block[140:148])[0]
-
       # sup_data_rev: 8 byte ASCII_String, bytes 148-156
-      self.sup_data_rev = struct.unpack('>8s', sfdu_block[148:156])[0]
-
       # prdx_time_offset: 8 byte IEEE754MSBDouble, bytes 156-164
-      self.prdx_time_offset = struct.unpack('>d', sfdu_block[156:164])[0]
-
       # prdx_freq_offset: 8 byte IEEE754MSBDouble, bytes 164-172
-      self.prdx_freq_offset = struct.unpack('>d', sfdu_block[164:172])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 172-173
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[172:173])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 173-174
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[173:174])[0]
-
       # fabricated_sfdu_flag: 1 byte UnsignedByte, bytes 174-175
-      self.fabricated_sfdu_flag = struct.unpack('>B', sfdu_block[174:175])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 175-176
-      self.reserve1 = sfdu_block[175:176]
-
       # reserve6: 6 byte UnsignedMSB6, bytes 176-182
-      self.reserve6 = sfdu_block[176:182]
+      ( self.chdo_type, self.chdo_length, self.ul_hi_phs_cycles, self.ul_lo_phs_cycles,
+        self.ul_frac_phs_cycles, self.ramp_freq, self.ramp_rate, self.transmit_switch_stat,
+        self.ramp_type, self.transmit_op_pwr, self.sup_data_id, self.sup_data_rev,
+        self.prdx_time_offset, self.prdx_freq_offset, self.time_tag_corr_flag,
+        self.type_time_corr_flag, self.fabricated_sfdu_flag, self.reserve1, self.reserve6 ) = self.LAYOUT.unpack_from( sfdu_block, 102 )
 
 # ---------------------------------------------------------------------------
 
@@ -1607,185 +1209,84 @@ class DownlinkCarrierPhaseTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 146-378, decoded in a single call
+   LAYOUT = struct.Struct( '>HHffffffIIIIIIIIIIIIIIIIIIIIIIIIIIIIIIIIIdffiBBf8s8sddBBBBB1s8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 146-148
-      self.chdo_type = struct.unpack('>H', sfdu_block[146:148])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 148-150
-      self.chdo_length = struct.unpack('>H', sfdu_block[148:150])[0]
-
       # carr_loop_bw: 4 byte IEEE754MSBSingle, bytes 150-154
-      self.carr_loop_bw = struct.unpack('>f', sfdu_block[150:154])[0]
-
       # pcn0: 4 byte IEEE754MSBSingle, bytes 154-158
-      self.pcn0 = struct.unpack('>f', sfdu_block[154:158])[0]
-
       # pcn0_resid: 4 byte IEEE754MSBSingle, bytes 158-162
-      self.pcn0_resid = struct.unpack('>f', sfdu_block[158:162])[0]
-
       # pdn0: 4 byte IEEE754MSBSingle, bytes 162-166
-      self.pdn0 = struct.unpack('>f', sfdu_block[162:166])[0]
-
       # pdn0_resid: 4 byte IEEE754MSBSingle, bytes 166-170
-      self.pdn0_resid = struct.unpack('>f', sfdu_block[166:170])[0]
-
       # system_noise_temp: 4 byte IEEE754MSBSingle, bytes 170-174
-      self.system_noise_temp = struct.unpack('>f', sfdu_block[170:174])[0]
-
       # phs_hi_0: 4 byte UnsignedMSB4, bytes 174-178
-      self.phs_hi_0 = struct.unpack('>I', sfdu_block[174:178])[0]
-
       # phs_lo_0: 4 byte UnsignedMSB4, bytes 178-182
-      self.phs_lo_0 = struct.unpack('>I', sfdu_block[178:182])[0]
-
       # phs_frac_0: 4 byte UnsignedMSB4, bytes 182-186
-      self.phs_frac_0 = struct.unpack('>I', sfdu_block[182:186])[0]
-
       # phs_hi_1: 4 byte UnsignedMSB4, bytes 186-190
-      self.phs_hi_1 = struct.unpack('>I', sfdu_block[186:190])[0]
-
       # phs_lo_1: 4 byte UnsignedMSB4, bytes 190-194
-      self.phs_lo_1 = struct.unpack('>I', sfdu_block[190:194])[0]
-
       # phs_frac_1: 4 byte UnsignedMSB4, bytes 194-198
-      self.phs_frac_1 = struct.unpack('>I', sfdu_block[194:198])[0]
-
       # phs_hi_2: 4 byte UnsignedMSB4, bytes 198-202
-      self.phs_hi_2 = struct.unpack('>I', sfdu_block[198:202])[0]
-
       # phs_lo_2: 4 byte UnsignedMSB4, bytes 202-206
-      self.phs_lo_2 = struct.unpack('>I', sfdu_block[202:206])[0]
-
       # phs_frac_2: 4 byte UnsignedMSB4, bytes 206-210
-      self.phs_frac_2 = struct.unpack('>I', sfdu_block[206:210])[0]
-
       # phs_hi_3: 4 byte UnsignedMSB4, bytes 210-214
-      self.phs_hi_3 = struct.unpack('>I', sfdu_block[210:214])[0]
-
       # phs_lo_3: 4 byte UnsignedMSB4, bytes 214-218
-      self.phs_lo_3 = struct.unpack('>I', sfdu_block[214:218])[0]
-
       # phs_frac_3: 4 byte UnsignedMSB4, bytes 218-222
-      self.phs_frac_3 = struct.unpack('>I', sfdu_block[218:222])[0]
-
       # phs_hi_4: 4 byte UnsignedMSB4, bytes 222-226
-      self.phs_hi_4 = struct.unpack('>I', sfdu_block[222:226])[0]
-
       # phs_lo_4: 4 byte UnsignedMSB4, bytes 226-230
-      self.phs_lo_4 = struct.unpack('>I', sfdu_block[226:230])[0]
-
       # phs_frac_4: 4 byte UnsignedMSB4, bytes 230-234
-      self.phs_frac_4 = struct.unpack('>I', sfdu_block[230:234])[0]
-
       # phs_hi_5: 4 byte UnsignedMSB4, bytes 234-238
-      self.phs_hi_5 = struct.unpack('>I', sfdu_block[234:238])[0]
-
       # phs_lo_5: 4 byte UnsignedMSB4, bytes 238-242
-      self.phs_lo_5 = struct.unpack('>I', sfdu_block[238:242])[0]
-
       # phs_frac_5: 4 byte UnsignedMSB4, bytes 242-246
-      self.phs_frac_5 = struct.unpack('>I', sfdu_block[242:246])[0]
-
       # phs_hi_6: 4 byte UnsignedMSB4, bytes 246-250
-      self.phs_hi_6 = struct.unpack('>I', sfdu_block[246:250])[0]
-
       # phs_lo_6: 4 byte UnsignedMSB4, bytes 250-254
-      self.phs_lo_6 = struct.unpack('>I', sfdu_block[250:254])[0]
-
       # phs_frac_6: 4 byte UnsignedMSB4, bytes 254-258
-      self.phs_frac_6 = struct.unpack('>I', sfdu_block[254:258])[0]
-
       # phs_hi_7: 4 byte UnsignedMSB4, bytes 258-262
-      self.phs_hi_7 = struct.unpack('>I', sfdu_block[258:262])[0]
-
       # phs_lo_7: 4 byte UnsignedMSB4, bytes 262-266
-      self.phs_lo_7 = struct.unpack('>I', sfdu_block[262:266])[0]
-
       # phs_frac_7: 4 byte UnsignedMSB4, bytes 266-270
-      self.phs_frac_7 = struct.unpack('>I', sfdu_block[266:270])[0]
-
       # phs_hi_8: 4 byte UnsignedMSB4, bytes 270-274
-      self.phs_hi_8 = struct.unpack('>I', sfdu_block[270:274])[0]
-
       # phs_lo_8: 4 byte UnsignedMSB4, bytes 274-278
-      self.phs_lo_8 = struct.unpack('>I', sfdu_block[274:278])[0]
-
       # phs_frac_8: 4 byte UnsignedMSB4, bytes 278-282
-      self.phs_frac_8 = struct.unpack('>I', sfdu_block[278:282])[0]
-
       # phs_hi_9: 4 byte UnsignedMSB4, bytes 282-286
-      self.phs_hi_9 = struct.unpack('>I', sfdu_block[282:286])[0]
-
       # phs_lo_9: 4 byte UnsignedMSB4, bytes 286-290
-      self.phs_lo_9 = struct.unpack('>I', sfdu_block[286:290])[0]
-
       # phs_frac_9: 4 byte UnsignedMSB4, bytes 290-294
-      self.phs_frac_9 = struct.unpack('>I', sfdu_block[290:294])[0]
-
       # phs_hi_avg: 4 byte UnsignedMSB4, bytes 294-298
-      self.phs_hi_avg = struct.unpack('>I', sfdu_block[294:298])[0]
-
       # phs_lo_avg: 4 byte UnsignedMSB4, bytes 298-302
-      self.phs_lo_avg = struct.unpack('>I', sfdu_block[298:302])[0]
-
       # phs_frac_avg: 4 byte UnsignedMSB4, bytes 302-306
-      self.phs_frac_avg = struct.unpack('>I', sfdu_block[302:306])[0]
-
       # dl_freq: 8 byte IEEE754MSBDouble, bytes 306-314
-      self.dl_freq = struct.unpack('>d', sfdu_block[306:314])[0]
-
       # dop_resid: 4 byte IEEE754MSBSingle, bytes 314-318
-      self.dop_resid = struct.unpack('>f', sfdu_block[314:318])[0]
-
       # dop_noise: 4 byte IEEE754MSBSingle, bytes 318-322
-      self.dop_noise = struct.unpack('>f', sfdu_block[318:322])[0]
-
       # slipped_cycles: 4 byte SignedMSB4, bytes 322-326
-      self.slipped_cycles = struct.unpack('>i', sfdu_block[322:326])[0]
-
       # carr_loop_type: 1 byte UnsignedByte, bytes 326-327
-      self.carr_loop_type = struct.unpack('>B', sfdu_block[326:327])[0]
-
       # snt_flag: 1 byte UnsignedByte, bytes 327-328
-      self.snt_flag = struct.unpack('>B', sfdu_block[327:328])[0]
-
       # carr_resid_wt: 4 byte IEEE754MSBSingle, bytes 328-332
-      self.carr_resid_wt = struct.unpack('>f', sfdu_block[328:332])[0]
-
       # sup_data_id: 8 byte ASCII_String, bytes 332-340
-      self.sup_data_id = struct.unpack('>8s', sfdu_block[332:340])[0]
-
       # sup_data_rev: 8 byte ASCII_String, bytes 340-348
-      self.sup_data_rev = struct.unpack('>8s', sfdu_block[340:348])[0]
-
       # prdx_time_offset: 8 byte IEEE754MSBDouble, bytes 348-356
-      self.prdx_time_offset = struct.unpack('>d', sfdu_block[348:356])[0]
-
       # prdx_freq_offset: 8 byte IEEE754MSBDouble, bytes 356-364
-      self.prdx_freq_offset = struct.unpack('>d', sfdu_block[356:364])[0]
-
       # carr_resid_tol_flag: 1 byte UnsignedByte, bytes 364-365
-      self.carr_resid_tol_flag = struct.unpack('>B', sfdu_block[364:365])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 365-366
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[365:366])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 366-367
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[366:367])[0]
-
       # dop_mode_corr_flag: 1 byte UnsignedByte, bytes 367-368
-      self.dop_mode_corr_flag = struct.unpack('>B', sfdu_block[367:368])[0]
-
       # ul_stn_corr_flag: 1 byte UnsignedByte, bytes 368-369
-      self.ul_stn_corr_flag = struct.unpack('>B', sfdu_block[368:369])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 369-370
-      self.reserve1 = sfdu_block[369:370]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 370-378
-      self.reserve8 = sfdu_block[370:378]
+      ( self.chdo_type, self.chdo_length, self.carr_loop_bw, self.pcn0, self.pcn0_resid, self.pdn0,
+        self.pdn0_resid, self.system_noise_temp, self.phs_hi_0, self.phs_lo_0, self.phs_frac_0,
+        self.phs_hi_1, self.phs_lo_1, self.phs_frac_1, self.phs_hi_2, self.phs_lo_2,
+        self.phs_frac_2, self.phs_hi_3, self.phs_lo_3, self.phs_frac_3, self.phs_hi_4,
+        self.phs_lo_4, self.phs_frac_4, self.phs_hi_5, self.phs_lo_5, self.phs_frac_5,
+        self.phs_hi_6, self.phs_lo_6, self.phs_frac_6, self.phs_hi_7, self.phs_lo_7,
+        self.phs_frac_7, self.phs_hi_8, self.phs_lo_8, self.phs_frac_8, self.phs_hi_9,
+        self.phs_lo_9, self.phs_frac_9, self.phs_hi_avg, self.phs_lo_avg, self.phs_frac_avg,
+        self.dl_freq, self.dop_resid, self.dop_noise, self.slipped_cycles, self.carr_loop_type,
+        self.snt_flag, self.carr_resid_wt, self.sup_data_id, self.sup_data_rev,
+        self.prdx_time_offset, self.prdx_freq_offset, self.carr_resid_tol_flag,
+        self.time_tag_corr_flag, self.type_time_corr_flag, self.dop_mode_corr_flag,
+        self.ul_stn_corr_flag, self.reserve1, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 146 )
 
 # ---------------------------------------------------------------------------
 
@@ -1875,110 +1376,54 @@ class UplinkSequentialRangingPhaseTrackingCHDO:
       out += '            reserve6 = %s \n' % self.reserve6
       return out
 
+   # the fixed fields of bytes 102-214, decoded in a single call
+   LAYOUT = struct.Struct( '>HHdddfHdBBf8sHHHBBBBHHdfHIIdBBBBBB6s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 102-104
-      self.chdo_type = struct.unpack('>H', sfdu_block[102:104])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 104-106
-      self.chdo_length = struct.unpack('>H', sfdu_block[104:106])[0]
-
       # stn_cal: 8 byte IEEE754MSBDouble, bytes 106-114
-      self.stn_cal = struct.unpack('>d', sfdu_block[106:114])[0]
-
       # ul_stn_cal: 8 byte IEEE754MSBDouble, bytes 114-122
-      self.ul_stn_cal = struct.unpack('>d', sfdu_block[114:122])[0]
-
       # ul_cal_freq: 8 byte IEEE754MSBDouble, bytes 122-130
-      self.ul_cal_freq = struct.unpack('>d', sfdu_block[122:130])[0]
-
       # cal_std_dev: 4 byte IEEE754MSBSingle, bytes 130-134
-      self.cal_std_dev = struct.unpack('>f', sfdu_block[130:134])[0]
-
       # cal_pts: 2 byte UnsignedMSB2, bytes 134-136
-      self.cal_pts = struct.unpack('>H', sfdu_block[134:136])[0]
-
       # ul_rng_phs: 8 byte IEEE754MSBDouble, bytes 136-144
-      self.ul_rng_phs = struct.unpack('>d', sfdu_block[136:144])[0]
-
       # transmit_switch_stat: 1 byte UnsignedByte, bytes 144-145
-      self.transmit_switch_stat = struct.unpack('>B', sfdu_block[144:145])[0]
-
       # invert: 1 byte UnsignedByte, bytes 145-146
-      self.invert = struct.unpack('>B', sfdu_block[145:146])[0]
-
       # transmit_op_pwr: 4 byte IEEE754MSBSingle, bytes 146-150
-      self.transmit_op_pwr = struct.unpack('>f', sfdu_block[146:150])[0]
-
       # template_id: 8 byte ASCII_String, bytes 150-158
-      self.template_id = struct.unpack('>8s', sfdu_block[150:158])[0]
-
       # t1: 2 byte UnsignedMSB2, bytes 158-160
-      self.t1 = struct.unpack('>H', sfdu_block[158:160])[0]
-
       # t2: 2 byte UnsignedMSB2, bytes 160-162
-      self.t2 = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # t3: 2 byte UnsignedMSB2, bytes 162-164
-      self.t3 = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # first_comp_num: 1 byte UnsignedByte, bytes 164-165
-      self.first_comp_num = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # last_comp_num: 1 byte UnsignedByte, bytes 165-166
-      self.last_comp_num = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # chop_comp_num: 1 byte UnsignedByte, bytes 166-167
-      self.chop_comp_num = struct.unpack('>B', sfdu_block[166:167])[0]
-
       # num_drvid: 1 byte UnsignedByte, bytes 167-168
-      self.num_drvid = struct.unpack('>B', sfdu_block[167:168])[0]
-
       # transmit_inphs_time_year: 2 byte UnsignedMSB2, bytes 168-170
-      self.transmit_inphs_time_year = struct.unpack('>H', sfdu_block[168:170])[0]
-
       # transmit_inphs_time_doy: 2 byte UnsignedMSB2, bytes 170-172
-      self.transmit_inphs_time_doy = struct.unpack('>H', sfdu_block[170:172])[0]
-
       # transmit_inphs_time_sec: 8 byte IEEE754MSBDouble, bytes 172-180
-      self.transmit_inphs_time_sec = struct.unpack('>d', sfdu_block[172:180])[0]
-
       # carr_sup_rng_modul: 4 byte IEEE754MSBSingle, bytes 180-184
-      self.carr_sup_rng_modul = struct.unpack('>f', sfdu_block[180:184])[0]
-
       # rng_modul_amp: 2 byte UnsignedMSB2, bytes 184-186
-      self.rng_modul_amp = struct.unpack('>H', sfdu_block[184:186])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 186-190
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[186:190])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 190-194
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[190:194])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 194-202
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[194:202])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 202-203
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[202:203])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 203-204
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[203:204])[0]
-
       # clock_waveform: 1 byte UnsignedByte, bytes 204-205
-      self.clock_waveform = struct.unpack('>B', sfdu_block[204:205])[0]
-
       # chop_start_num: 1 byte UnsignedByte, bytes 205-206
-      self.chop_start_num = struct.unpack('>B', sfdu_block[205:206])[0]
-
       # rng_meas_type: 1 byte UnsignedByte, bytes 206-207
-      self.rng_meas_type = struct.unpack('>B', sfdu_block[206:207])[0]
-
       # fabricated_sfdu_flag: 1 byte UnsignedByte, bytes 207-208
-      self.fabricated_sfdu_flag = struct.unpack('>B', sfdu_block[207:208])[0]
-
       # reserve6: 6 byte UnsignedMSB6, bytes 208-214
-      self.reserve6 = sfdu_block[208:214]
+      ( self.chdo_type, self.chdo_length, self.stn_cal, self.ul_stn_cal, self.ul_cal_freq,
+        self.cal_std_dev, self.cal_pts, self.ul_rng_phs, self.transmit_switch_stat, self.invert,
+        self.transmit_op_pwr, self.template_id, self.t1, self.t2, self.t3, self.first_comp_num,
+        self.last_comp_num, self.chop_comp_num, self.num_drvid, self.transmit_inphs_time_year,
+        self.transmit_inphs_time_doy, self.transmit_inphs_time_sec, self.carr_sup_rng_modul,
+        self.rng_modul_amp, self.exc_scalar_num, self.exc_scalar_den, self.rng_cycle_time,
+        self.time_tag_corr_flag, self.type_time_corr_flag, self.clock_waveform,
+        self.chop_start_num, self.rng_meas_type, self.fabricated_sfdu_flag, self.reserve6 ) = self.LAYOUT.unpack_from( sfdu_block, 102 )
 
 # ---------------------------------------------------------------------------
 
@@ -2114,179 +1559,82 @@ class DownlinkSequentialRangingPhaseTrackingCHDO:
       out += '            reserve6 = %s \n' % self.reserve6
       return out
 
+   # the fixed fields of bytes 146-324, decoded in a single call
+   LAYOUT = struct.Struct( '>HHdddfHdfddffffffffBBf8sBBHHHBBBBHHdIIdffBBBBBBBBBBBBBBBB6s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 146-148
-      self.chdo_type = struct.unpack('>H', sfdu_block[146:148])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 148-150
-      self.chdo_length = struct.unpack('>H', sfdu_block[148:150])[0]
-
       # stn_cal: 8 byte IEEE754MSBDouble, bytes 150-158
-      self.stn_cal = struct.unpack('>d', sfdu_block[150:158])[0]
-
       # dl_stn_cal: 8 byte IEEE754MSBDouble, bytes 158-166
-      self.dl_stn_cal = struct.unpack('>d', sfdu_block[158:166])[0]
-
       # dl_cal_freq: 8 byte IEEE754MSBDouble, bytes 166-174
-      self.dl_cal_freq = struct.unpack('>d', sfdu_block[166:174])[0]
-
       # cal_std_dev: 4 byte IEEE754MSBSingle, bytes 174-178
-      self.cal_std_dev = struct.unpack('>f', sfdu_block[174:178])[0]
-
       # cal_pts: 2 byte UnsignedMSB2, bytes 178-180
-      self.cal_pts = struct.unpack('>H', sfdu_block[178:180])[0]
-
       # dl_rng_phs: 8 byte IEEE754MSBDouble, bytes 180-188
-      self.dl_rng_phs = struct.unpack('>d', sfdu_block[180:188])[0]
-
       # figure_merit: 4 byte IEEE754MSBSingle, bytes 188-192
-      self.figure_merit = struct.unpack('>f', sfdu_block[188:192])[0]
-
       # rng_resid: 8 byte IEEE754MSBDouble, bytes 192-200
-      self.rng_resid = struct.unpack('>d', sfdu_block[192:200])[0]
-
       # drvid: 8 byte IEEE754MSBDouble, bytes 200-208
-      self.drvid = struct.unpack('>d', sfdu_block[200:208])[0]
-
       # rtlt: 4 byte IEEE754MSBSingle, bytes 208-212
-      self.rtlt = struct.unpack('>f', sfdu_block[208:212])[0]
-
       # pcn0: 4 byte IEEE754MSBSingle, bytes 212-216
-      self.pcn0 = struct.unpack('>f', sfdu_block[212:216])[0]
-
       # pcn0_resid: 4 byte IEEE754MSBSingle, bytes 216-220
-      self.pcn0_resid = struct.unpack('>f', sfdu_block[216:220])[0]
-
       # pdn0: 4 byte IEEE754MSBSingle, bytes 220-224
-      self.pdn0 = struct.unpack('>f', sfdu_block[220:224])[0]
-
       # pdn0_resid: 4 byte IEEE754MSBSingle, bytes 224-228
-      self.pdn0_resid = struct.unpack('>f', sfdu_block[224:228])[0]
-
       # prn0: 4 byte IEEE754MSBSingle, bytes 228-232
-      self.prn0 = struct.unpack('>f', sfdu_block[228:232])[0]
-
       # prn0_resid: 4 byte IEEE754MSBSingle, bytes 232-236
-      self.prn0_resid = struct.unpack('>f', sfdu_block[232:236])[0]
-
       # system_noise_temp: 4 byte IEEE754MSBSingle, bytes 236-240
-      self.system_noise_temp = struct.unpack('>f', sfdu_block[236:240])[0]
-
       # carr_loop_type: 1 byte UnsignedByte, bytes 240-241
-      self.carr_loop_type = struct.unpack('>B', sfdu_block[240:241])[0]
-
       # snt_flag: 1 byte UnsignedByte, bytes 241-242
-      self.snt_flag = struct.unpack('>B', sfdu_block[241:242])[0]
-
       # carr_resid_wt: 4 byte IEEE754MSBSingle, bytes 242-246
-      self.carr_resid_wt = struct.unpack('>f', sfdu_block[242:246])[0]
-
       # template_id: 8 byte ASCII_String, bytes 246-254
-      self.template_id = struct.unpack('>8s', sfdu_block[246:254])[0]
-
       # invert: 1 byte UnsignedByte, bytes 254-255
-      self.invert = struct.unpack('>B', sfdu_block[254:255])[0]
-
       # correl_type: 1 byte UnsignedByte, bytes 255-256
-      self.correl_type = struct.unpack('>B', sfdu_block[255:256])[0]
-
       # t1: 2 byte UnsignedMSB2, bytes 256-258
-      self.t1 = struct.unpack('>H', sfdu_block[256:258])[0]
-
       # t2: 2 byte UnsignedMSB2, bytes 258-260
-      self.t2 = struct.unpack('>H', sfdu_block[258:260])[0]
-
       # t3: 2 byte UnsignedMSB2, bytes 260-262
-      self.t3 = struct.unpack('>H', sfdu_block[260:262])[0]
-
       # first_comp_num: 1 byte UnsignedByte, bytes 262-263
-      self.first_comp_num = struct.unpack('>B', sfdu_block[262:263])[0]
-
       # last_comp_num: 1 byte UnsignedByte, bytes 263-264
-      self.last_comp_num = struct.unpack('>B', sfdu_block[263:264])[0]
-
       # chop_comp_num: 1 byte UnsignedByte, bytes 264-265
-      self.chop_comp_num = struct.unpack('>B', sfdu_block[264:265])[0]
-
       # num_drvid: 1 byte UnsignedByte, bytes 265-266
-      self.num_drvid = struct.unpack('>B', sfdu_block[265:266])[0]
-
       # rcv_inphs_time_year: 2 byte UnsignedMSB2, bytes 266-268
-      self.rcv_inphs_time_year = struct.unpack('>H', sfdu_block[266:268])[0]
-
       # rcv_inphs_time_doy: 2 byte UnsignedMSB2, bytes 268-270
-      self.rcv_inphs_time_doy = struct.unpack('>H', sfdu_block[268:270])[0]
-
       # rcv_inphs_time_sec: 8 byte IEEE754MSBDouble, bytes 270-278
-      self.rcv_inphs_time_sec = struct.unpack('>d', sfdu_block[270:278])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 278-282
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[278:282])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 282-286
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[282:286])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 286-294
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[286:294])[0]
-
       # inphs_correl: 4 byte IEEE754MSBSingle, bytes 294-298
-      self.inphs_correl = struct.unpack('>f', sfdu_block[294:298])[0]
-
       # quad_phs_correl: 4 byte IEEE754MSBSingle, bytes 298-302
-      self.quad_phs_correl = struct.unpack('>f', sfdu_block[298:302])[0]
-
       # metrics_vld_flag: 1 byte UnsignedByte, bytes 302-303
-      self.metrics_vld_flag = struct.unpack('>B', sfdu_block[302:303])[0]
-
       # correl_vld_flag: 1 byte UnsignedByte, bytes 303-304
-      self.correl_vld_flag = struct.unpack('>B', sfdu_block[303:304])[0]
-
       # rng_resid_tol_flag: 1 byte UnsignedByte, bytes 304-305
-      self.rng_resid_tol_flag = struct.unpack('>B', sfdu_block[304:305])[0]
-
       # drvid_tol_flag: 1 byte UnsignedByte, bytes 305-306
-      self.drvid_tol_flag = struct.unpack('>B', sfdu_block[305:306])[0]
-
       # prn0_resid_tol_flag: 1 byte UnsignedByte, bytes 306-307
-      self.prn0_resid_tol_flag = struct.unpack('>B', sfdu_block[306:307])[0]
-
       # rng_sigma_tol_flag: 1 byte UnsignedByte, bytes 307-308
-      self.rng_sigma_tol_flag = struct.unpack('>B', sfdu_block[307:308])[0]
-
       # rng_vld_flag: 1 byte UnsignedByte, bytes 308-309
-      self.rng_vld_flag = struct.unpack('>B', sfdu_block[308:309])[0]
-
       # rng_config_flag: 1 byte UnsignedByte, bytes 309-310
-      self.rng_config_flag = struct.unpack('>B', sfdu_block[309:310])[0]
-
       # rng_hw_flag: 1 byte UnsignedByte, bytes 310-311
-      self.rng_hw_flag = struct.unpack('>B', sfdu_block[310:311])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 311-312
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[311:312])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 312-313
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[312:313])[0]
-
       # dop_mode_corr_flag: 1 byte UnsignedByte, bytes 313-314
-      self.dop_mode_corr_flag = struct.unpack('>B', sfdu_block[313:314])[0]
-
       # ul_stn_corr_flag: 1 byte UnsignedByte, bytes 314-315
-      self.ul_stn_corr_flag = struct.unpack('>B', sfdu_block[314:315])[0]
-
       # chop_start_num: 1 byte UnsignedByte, bytes 315-316
-      self.chop_start_num = struct.unpack('>B', sfdu_block[315:316])[0]
-
       # rng_meas_type: 1 byte UnsignedByte, bytes 316-317
-      self.rng_meas_type = struct.unpack('>B', sfdu_block[316:317])[0]
-
       # stn_cal_corr_flag: 1 byte UnsignedByte, bytes 317-318
-      self.stn_cal_corr_flag = struct.unpack('>B', sfdu_block[317:318])[0]
-
       # reserve6: 6 byte UnsignedMSB6, bytes 318-324
-      self.reserve6 = sfdu_block[318:324]
+      ( self.chdo_type, self.chdo_length, self.stn_cal, self.dl_stn_cal, self.dl_cal_freq,
+        self.cal_std_dev, self.cal_pts, self.dl_rng_phs, self.figure_merit, self.rng_resid,
+        self.drvid, self.rtlt, self.pcn0, self.pcn0_resid, self.pdn0, self.pdn0_resid, self.prn0,
+        self.prn0_resid, self.system_noise_temp, self.carr_loop_type, self.snt_flag,
+        self.carr_resid_wt, self.template_id, self.invert, self.correl_type, self.t1, self.t2,
+        self.t3, self.first_comp_num, self.last_comp_num, self.chop_comp_num, self.num_drvid,
+        self.rcv_inphs_time_year, self.rcv_inphs_time_doy, self.rcv_inphs_time_sec,
+        self.exc_scalar_num, self.exc_scalar_den, self.rng_cycle_time, self.inphs_correl,
+        self.quad_phs_correl, self.metrics_vld_flag, self.correl_vld_flag, self.rng_resid_tol_flag,
+        self.drvid_tol_flag, self.prn0_resid_tol_flag, self.rng_sigma_tol_flag, self.rng_vld_flag,
+        self.rng_config_flag, self.rng_hw_flag, self.time_tag_corr_flag, self.type_time_corr_flag,
+        self.dop_mode_corr_flag, self.ul_stn_corr_flag, self.chop_start_num, self.rng_meas_type,
+        self.stn_cal_corr_flag, self.reserve6 ) = self.LAYOUT.unpack_from( sfdu_block, 146 )
 
 # ---------------------------------------------------------------------------
 
@@ -2418,173 +1766,80 @@ class UplinkPnRangingPhaseTrackingCHDO:
       out += '            reserve4 = %s \n' % self.reserve4
       return out
 
+   # the fixed fields of bytes 102-296, decoded in a single call
+   LAYOUT = struct.Struct( '>HHdddfHdBBBBBBdBBf22sBBBBBBBBBBBBQQQQQQIHHdfHIIdBBBBBBBB4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 102-104
-      self.chdo_type = struct.unpack('>H', sfdu_block[102:104])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 104-106
-      self.chdo_length = struct.unpack('>H', sfdu_block[104:106])[0]
-
       # stn_cal: 8 byte IEEE754MSBDouble, bytes 106-114
-      self.stn_cal = struct.unpack('>d', sfdu_block[106:114])[0]
-
       # ul_stn_cal: 8 byte IEEE754MSBDouble, bytes 114-122
-      self.ul_stn_cal = struct.unpack('>d', sfdu_block[114:122])[0]
-
       # ul_cal_freq: 8 byte IEEE754MSBDouble, bytes 122-130
-      self.ul_cal_freq = struct.unpack('>d', sfdu_block[122:130])[0]
-
       # cal_std_dev: 4 byte IEEE754MSBSingle, bytes 130-134
-      self.cal_std_dev = struct.unpack('>f', sfdu_block[130:134])[0]
-
       # cal_pts: 2 byte UnsignedMSB2, bytes 134-136
-      self.cal_pts = struct.unpack('>H', sfdu_block[134:136])[0]
-
       # ul_rng_phs: 8 byte IEEE754MSBDouble, bytes 136-144
-      self.ul_rng_phs = struct.unpack('>d', sfdu_block[136:144])[0]
-
       # state_subcode1: 1 byte UnsignedByte, bytes 144-145
-      self.state_subcode1 = struct.unpack('>B', sfdu_block[144:145])[0]
-
       # state_subcode2: 1 byte UnsignedByte, bytes 145-146
-      self.state_subcode2 = struct.unpack('>B', sfdu_block[145:146])[0]
-
       # state_subcode3: 1 byte UnsignedByte, bytes 146-147
-      self.state_subcode3 = struct.unpack('>B', sfdu_block[146:147])[0]
-
       # state_subcode4: 1 byte UnsignedByte, bytes 147-148
-      self.state_subcode4 = struct.unpack('>B', sfdu_block[147:148])[0]
-
       # state_subcode5: 1 byte UnsignedByte, bytes 148-149
-      self.state_subcode5 = struct.unpack('>B', sfdu_block[148:149])[0]
-
       # state_subcode6: 1 byte UnsignedByte, bytes 149-150
-      self.state_subcode6 = struct.unpack('>B', sfdu_block[149:150])[0]
-
       # pn_clk_phs: 8 byte IEEE754MSBDouble, bytes 150-158
-      self.pn_clk_phs = struct.unpack('>d', sfdu_block[150:158])[0]
-
       # transmit_switch_stat: 1 byte UnsignedByte, bytes 158-159
-      self.transmit_switch_stat = struct.unpack('>B', sfdu_block[158:159])[0]
-
       # invert: 1 byte UnsignedByte, bytes 159-160
-      self.invert = struct.unpack('>B', sfdu_block[159:160])[0]
-
       # transmit_op_pwr: 4 byte IEEE754MSBSingle, bytes 160-164
-      self.transmit_op_pwr = struct.unpack('>f', sfdu_block[160:164])[0]
-
       # template_id: 22 byte ASCII_String, bytes 164-186
-      self.template_id = struct.unpack('>22s', sfdu_block[164:186])[0]
-
       # chip_rate: 1 byte UnsignedByte, bytes 186-187
-      self.chip_rate = struct.unpack('>B', sfdu_block[186:187])[0]
-
       # len_subcode1: 1 byte UnsignedByte, bytes 187-188
-      self.len_subcode1 = struct.unpack('>B', sfdu_block[187:188])[0]
-
       # len_subcode2: 1 byte UnsignedByte, bytes 188-189
-      self.len_subcode2 = struct.unpack('>B', sfdu_block[188:189])[0]
-
       # len_subcode3: 1 byte UnsignedByte, bytes 189-190
-      self.len_subcode3 = struct.unpack('>B', sfdu_block[189:190])[0]
-
       # len_subcode4: 1 byte UnsignedByte, bytes 190-191
-      self.len_subcode4 = struct.unpack('>B', sfdu_block[190:191])[0]
-
       # len_subcode5: 1 byte UnsignedByte, bytes 191-192
-      self.len_subcode5 = struct.unpack('>B', sfdu_block[191:192])[0]
-
       # len_subcode6: 1 byte UnsignedByte, bytes 192-193
-      self.len_subcode6 = struct.unpack('>B', sfdu_block[192:193])[0]
-
       # op_subcode1: 1 byte UnsignedByte, bytes 193-194
-      self.op_subcode1 = struct.unpack('>B', sfdu_block[193:194])[0]
-
       # op_subcode2: 1 byte UnsignedByte, bytes 194-195
-      self.op_subcode2 = struct.unpack('>B', sfdu_block[194:195])[0]
-
       # op_subcode3: 1 byte UnsignedByte, bytes 195-196
-      self.op_subcode3 = struct.unpack('>B', sfdu_block[195:196])[0]
-
       # op_subcode4: 1 byte UnsignedByte, bytes 196-197
-      self.op_subcode4 = struct.unpack('>B', sfdu_block[196:197])[0]
-
       # op_subcode5: 1 byte UnsignedByte, bytes 197-198
-      self.op_subcode5 = struct.unpack('>B', sfdu_block[197:198])[0]
-
       # def_subcode1: 8 byte UnsignedMSB8, bytes 198-206
-      self.def_subcode1 = struct.unpack('>Q', sfdu_block[198:206])[0]
-
       # def_subcode2: 8 byte UnsignedMSB8, bytes 206-214
-      self.def_subcode2 = struct.unpack('>Q', sfdu_block[206:214])[0]
-
       # def_subcode3: 8 byte UnsignedMSB8, bytes 214-222
-      self.def_subcode3 = struct.unpack('>Q', sfdu_block[214:222])[0]
-
       # def_subcode4: 8 byte UnsignedMSB8, bytes 222-230
-      self.def_subcode4 = struct.unpack('>Q', sfdu_block[222:230])[0]
-
       # def_subcode5: 8 byte UnsignedMSB8, bytes 230-238
-      self.def_subcode5 = struct.unpack('>Q', sfdu_block[230:238])[0]
-
       # def_subcode6: 8 byte UnsignedMSB8, bytes 238-246
-      self.def_subcode6 = struct.unpack('>Q', sfdu_block[238:246])[0]
-
       # pn_code_length: 4 byte UnsignedMSB4, bytes 246-250
-      self.pn_code_length = struct.unpack('>I', sfdu_block[246:250])[0]
-
       # transmit_inphs_time_year: 2 byte UnsignedMSB2, bytes 250-252
-      self.transmit_inphs_time_year = struct.unpack('>H', sfdu_block[250:252])[0]
-
       # transmit_inphs_time_doy: 2 byte UnsignedMSB2, bytes 252-254
-      self.transmit_inphs_time_doy = struct.unpack('>H', sfdu_block[252:254])[0]
-
       # transmit_inphs_time_sec: 8 byte IEEE754MSBDouble, bytes 254-262
-      self.transmit_inphs_time_sec = struct.unpack('>d', sfdu_block[254:262])[0]
-
       # carr_sup_rng_modul: 4 byte IEEE754MSBSingle, bytes 262-266
-      self.carr_sup_rng_modul = struct.unpack('>f', sfdu_block[262:266])[0]
-
       # rng_modul_amp: 2 byte UnsignedMSB2, bytes 266-268
-      self.rng_modul_amp = struct.unpack('>H', sfdu_block[266:268])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 268-272
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[268:272])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 272-276
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[272:276])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 276-284
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[276:284])[0]
-
       # clock_waveform: 1 byte UnsignedByte, bytes 284-285
-      self.clock_waveform = struct.unpack('>B', sfdu_block[284:285])[0]
-
       # rng_meas_type: 1 byte UnsignedByte, bytes 285-286
-      self.rng_meas_type = struct.unpack('>B', sfdu_block[285:286])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 286-287
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[286:287])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 287-288
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[287:288])[0]
-
       # fabricated_sfdu_flag: 1 byte UnsignedByte, bytes 288-289
-      self.fabricated_sfdu_flag = struct.unpack('>B', sfdu_block[288:289])[0]
-
       # op_subcode6: 1 byte UnsignedByte, bytes 289-290
-      self.op_subcode6 = struct.unpack('>B', sfdu_block[289:290])[0]
-
       # ccsds_k: 1 byte UnsignedByte, bytes 290-291
-      self.ccsds_k = struct.unpack('>B', sfdu_block[290:291])[0]
-
       # ccsds_l: 1 byte UnsignedByte, bytes 291-292
-      self.ccsds_l = struct.unpack('>B', sfdu_block[291:292])[0]
-
       # reserve4: 4 byte UnsignedMSB4, bytes 292-296
-      self.reserve4 = sfdu_block[292:296]
+      ( self.chdo_type, self.chdo_length, self.stn_cal, self.ul_stn_cal, self.ul_cal_freq,
+        self.cal_std_dev, self.cal_pts, self.ul_rng_phs, self.state_subcode1, self.state_subcode2,
+        self.state_subcode3, self.state_subcode4, self.state_subcode5, self.state_subcode6,
+        self.pn_clk_phs, self.transmit_switch_stat, self.invert, self.transmit_op_pwr,
+        self.template_id, self.chip_rate, self.len_subcode1, self.len_subcode2, self.len_subcode3,
+        self.len_subcode4, self.len_subcode5, self.len_subcode6, self.op_subcode1,
+        self.op_subcode2, self.op_subcode3, self.op_subcode4, self.op_subcode5, self.def_subcode1,
+        self.def_subcode2, self.def_subcode3, self.def_subcode4, self.def_subcode5,
+        self.def_subcode6, self.pn_code_length, self.transmit_inphs_time_year,
+        self.transmit_inphs_time_doy, self.transmit_inphs_time_sec, self.carr_sup_rng_modul,
+        self.rng_modul_amp, self.exc_scalar_num, self.exc_scalar_den, self.rng_cycle_time,
+        self.clock_waveform, self.rng_meas_type, self.time_tag_corr_flag, self.type_time_corr_flag,
+        self.fabricated_sfdu_flag, self.op_subcode6, self.ccsds_k, self.ccsds_l, self.reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 102 )
 
 # ---------------------------------------------------------------------------
 
@@ -2764,245 +2019,109 @@ class DownlinkPnRangingPhaseTrackingCHDO:
       out += '            reserve4 = %s \n' % self.reserve4
       return out
 
+   # the fixed fields of bytes 146-408, decoded in a single call
+   LAYOUT = struct.Struct( '>HHdddfHdfddffffffffBBBBBBdBBf20sBBIBBBBBBBBBBBBQQQQQQIHHdIIdffBBBBBBBBBBBBBBBBBB4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 146-148
-      self.chdo_type = struct.unpack('>H', sfdu_block[146:148])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 148-150
-      self.chdo_length = struct.unpack('>H', sfdu_block[148:150])[0]
-
       # stn_cal: 8 byte IEEE754MSBDouble, bytes 150-158
-      self.stn_cal = struct.unpack('>d', sfdu_block[150:158])[0]
-
       # dl_stn_cal: 8 byte IEEE754MSBDouble, bytes 158-166
-      self.dl_stn_cal = struct.unpack('>d', sfdu_block[158:166])[0]
-
       # dl_cal_freq: 8 byte IEEE754MSBDouble, bytes 166-174
-      self.dl_cal_freq = struct.unpack('>d', sfdu_block[166:174])[0]
-
       # cal_std_dev: 4 byte IEEE754MSBSingle, bytes 174-178
-      self.cal_std_dev = struct.unpack('>f', sfdu_block[174:178])[0]
-
       # cal_pts: 2 byte UnsignedMSB2, bytes 178-180
-      self.cal_pts = struct.unpack('>H', sfdu_block[178:180])[0]
-
       # dl_rng_phs: 8 byte IEEE754MSBDouble, bytes 180-188
-      self.dl_rng_phs = struct.unpack('>d', sfdu_block[180:188])[0]
-
       # figure_merit: 4 byte IEEE754MSBSingle, bytes 188-192
-      self.figure_merit = struct.unpack('>f', sfdu_block[188:192])[0]
-
       # rng_resid: 8 byte IEEE754MSBDouble, bytes 192-200
-      self.rng_resid = struct.unpack('>d', sfdu_block[192:200])[0]
-
       # drvid: 8 byte IEEE754MSBDouble, bytes 200-208
-      self.drvid = struct.unpack('>d', sfdu_block[200:208])[0]
-
       # rtlt: 4 byte IEEE754MSBSingle, bytes 208-212
-      self.rtlt = struct.unpack('>f', sfdu_block[208:212])[0]
-
       # pcn0: 4 byte IEEE754MSBSingle, bytes 212-216
-      self.pcn0 = struct.unpack('>f', sfdu_block[212:216])[0]
-
       # pcn0_resid: 4 byte IEEE754MSBSingle, bytes 216-220
-      self.pcn0_resid = struct.unpack('>f', sfdu_block[216:220])[0]
-
       # pdn0: 4 byte IEEE754MSBSingle, bytes 220-224
-      self.pdn0 = struct.unpack('>f', sfdu_block[220:224])[0]
-
       # pdn0_resid: 4 byte IEEE754MSBSingle, bytes 224-228
-      self.pdn0_resid = struct.unpack('>f', sfdu_block[224:228])[0]
-
       # prn0: 4 byte IEEE754MSBSingle, bytes 228-232
-      self.prn0 = struct.unpack('>f', sfdu_block[228:232])[0]
-
       # prn0_resid: 4 byte IEEE754MSBSingle, bytes 232-236
-      self.prn0_resid = struct.unpack('>f', sfdu_block[232:236])[0]
-
       # system_noise_temp: 4 byte IEEE754MSBSingle, bytes 236-240
-      self.system_noise_temp = struct.unpack('>f', sfdu_block[236:240])[0]
-
       # state_subcode1: 1 byte UnsignedByte, bytes 240-241
-      self.state_subcode1 = struct.unpack('>B', sfdu_block[240:241])[0]
-
       # state_subcode2: 1 byte UnsignedByte, bytes 241-242
-      self.state_subcode2 = struct.unpack('>B', sfdu_block[241:242])[0]
-
       # state_subcode3: 1 byte UnsignedByte, bytes 242-243
-      self.state_subcode3 = struct.unpack('>B', sfdu_block[242:243])[0]
-
       # state_subcode4: 1 byte UnsignedByte, bytes 243-244
-      self.state_subcode4 = struct.unpack('>B', sfdu_block[243:244])[0]
-
       # state_subcode5: 1 byte UnsignedByte, bytes 244-245
-      self.state_subcode5 = struct.unpack('>B', sfdu_block[244:245])[0]
-
       # state_subcode6: 1 byte UnsignedByte, bytes 245-246
-      self.state_subcode6 = struct.unpack('>B', sfdu_block[245:246])[0]
-
       # pn_clk_phs: 8 byte IEEE754MSBDouble, bytes 246-254
-      self.pn_clk_phs = struct.unpack('>d', sfdu_block[246:254])[0]
-
       # carr_loop_type: 1 byte UnsignedByte, bytes 254-255
-      self.carr_loop_type = struct.unpack('>B', sfdu_block[254:255])[0]
-
       # snt_flag: 1 byte UnsignedByte, bytes 255-256
-      self.snt_flag = struct.unpack('>B', sfdu_block[255:256])[0]
-
       # carr_resid_wt: 4 byte IEEE754MSBSingle, bytes 256-260
-      self.carr_resid_wt = struct.unpack('>f', sfdu_block[256:260])[0]
-
       # template_id: 20 byte ASCII_String, bytes 260-280
-      self.template_id = struct.unpack('>20s', sfdu_block[260:280])[0]
-
       # invert: 1 byte UnsignedByte, bytes 280-281
-      self.invert = struct.unpack('>B', sfdu_block[280:281])[0]
-
       # correl_type: 1 byte UnsignedByte, bytes 281-282
-      self.correl_type = struct.unpack('>B', sfdu_block[281:282])[0]
-
       # int_time: 4 byte UnsignedMSB4, bytes 282-286
-      self.int_time = struct.unpack('>I', sfdu_block[282:286])[0]
-
       # chip_rate: 1 byte UnsignedByte, bytes 286-287
-      self.chip_rate = struct.unpack('>B', sfdu_block[286:287])[0]
-
       # len_subcode1: 1 byte UnsignedByte, bytes 287-288
-      self.len_subcode1 = struct.unpack('>B', sfdu_block[287:288])[0]
-
       # len_subcode2: 1 byte UnsignedByte, bytes 288-289
-      self.len_subcode2 = struct.unpack('>B', sfdu_block[288:289])[0]
-
       # len_subcode3: 1 byte UnsignedByte, bytes 289-290
-      self.len_subcode3 = struct.unpack('>B', sfdu_block[289:290])[0]
-
       # len_subcode4: 1 byte UnsignedByte, bytes 290-291
-      self.len_subcode4 = struct.unpack('>B', sfdu_block[290:291])[0]
-
       # len_subcode5: 1 byte UnsignedByte, bytes 291-292
-      self.len_subcode5 = struct.unpack('>B', sfdu_block[291:292])[0]
-
       # len_subcode6: 1 byte UnsignedByte, bytes 292-293
-      self.len_subcode6 = struct.unpack('>B', sfdu_block[292:293])[0]
-
       # op_subcode1: 1 byte UnsignedByte, bytes 293-294
-      self.op_subcode1 = struct.unpack('>B', sfdu_block[293:294])[0]
-
       # op_subcode2: 1 byte UnsignedByte, bytes 294-295
-      self.op_subcode2 = struct.unpack('>B', sfdu_block[294:295])[0]
-
       # op_subcode3: 1 byte UnsignedByte, bytes 295-296
-      self.op_subcode3 = struct.unpack('>B', sfdu_block[295:296])[0]
-
       # op_subcode4: 1 byte UnsignedByte, bytes 296-297
-      self.op_subcode4 = struct.unpack('>B', sfdu_block[296:297])[0]
-
       # op_subcode5: 1 byte UnsignedByte, bytes 297-298
-      self.op_subcode5 = struct.unpack('>B', sfdu_block[297:298])[0]
-
       # def_subcode1: 8 byte UnsignedMSB8, bytes 298-306
-      self.def_subcode1 = struct.unpack('>Q', sfdu_block[298:306])[0]
-
       # def_subcode2: 8 byte UnsignedMSB8, bytes 306-314
-      self.def_subcode2 = struct.unpack('>Q', sfdu_block[306:314])[0]
-
       # def_subcode3: 8 byte UnsignedMSB8, bytes 314-322
-      self.def_subcode3 = struct.unpack('>Q', sfdu_block[314:322])[0]
-
       # def_subcode4: 8 byte UnsignedMSB8, bytes 322-330
-      self.def_subcode4 = struct.unpack('>Q', sfdu_block[322:330])[0]
-
       # def_subcode5: 8 byte UnsignedMSB8, bytes 330-338
-      self.def_subcode5 = struct.unpack('>Q', sfdu_block[330:338])[0]
-
       # def_subcode6: 8 byte UnsignedMSB8, bytes 338-346
-      self.def_subcode6 = struct.unpack('>Q', sfdu_block[338:346])[0]
-
       # pn_code_length: 4 byte UnsignedMSB4, bytes 346-350
-      self.pn_code_length = struct.unpack('>I', sfdu_block[346:350])[0]
-
       # rcv_inphs_time_year: 2 byte UnsignedMSB2, bytes 350-352
-      self.rcv_inphs_time_year = struct.unpack('>H', sfdu_block[350:352])[0]
-
       # rcv_inphs_time_doy: 2 byte UnsignedMSB2, bytes 352-354
-      self.rcv_inphs_time_doy = struct.unpack('>H', sfdu_block[352:354])[0]
-
       # rcv_inphs_time_sec: 8 byte IEEE754MSBDouble, bytes 354-362
-      self.rcv_inphs_time_sec = struct.unpack('>d', sfdu_block[354:362])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 362-366
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[362:366])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 366-370
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[366:370])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 370-378
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[370:378])[0]
-
       # inphs_correl: 4 byte IEEE754MSBSingle, bytes 378-382
-      self.inphs_correl = struct.unpack('>f', sfdu_block[378:382])[0]
-
       # quad_phs_correl: 4 byte IEEE754MSBSingle, bytes 382-386
-      self.quad_phs_correl = struct.unpack('>f', sfdu_block[382:386])[0]
-
       # metrics_vld_flag: 1 byte UnsignedByte, bytes 386-387
-      self.metrics_vld_flag = struct.unpack('>B', sfdu_block[386:387])[0]
-
       # correl_vld_flag: 1 byte UnsignedByte, bytes 387-388
-      self.correl_vld_flag = struct.unpack('>B', sfdu_block[387:388])[0]
-
       # rng_resid_tol_flag: 1 byte UnsignedByte, bytes 388-389
-      self.rng_resid_tol_flag = struct.unpack('>B', sfdu_block[388:389])[0]
-
       # drvid_tol_flag: 1 byte UnsignedByte, bytes 389-390
-      self.drvid_tol_flag = struct.unpack('>B', sfdu_block[389:390])[0]
-
       # prn0_resid_tol_flag: 1 byte UnsignedByte, bytes 390-391
-      self.prn0_resid_tol_flag = struct.unpack('>B', sfdu_block[390:391])[0]
-
       # rng_sigma_tol_flag: 1 byte UnsignedByte, bytes 391-392
-      self.rng_sigma_tol_flag = struct.unpack('>B', sfdu_block[391:392])[0]
-
       # rng_vld_flag: 1 byte UnsignedByte, bytes 392-393
-      self.rng_vld_flag = struct.unpack('>B', sfdu_block[392:393])[0]
-
       # rng_config_flag: 1 byte UnsignedByte, bytes 393-394
-      self.rng_config_flag = struct.unpack('>B', sfdu_block[393:394])[0]
-
       # rng_hw_flag: 1 byte UnsignedByte, bytes 394-395
-      self.rng_hw_flag = struct.unpack('>B', sfdu_block[394:395])[0]
-
       # rng_meas_type: 1 byte UnsignedByte, bytes 395-396
-      self.rng_meas_type = struct.unpack('>B', sfdu_block[395:396])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 396-397
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[396:397])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 397-398
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[397:398])[0]
-
       # dop_mode_corr_flag: 1 byte UnsignedByte, bytes 398-399
-      self.dop_mode_corr_flag = struct.unpack('>B', sfdu_block[398:399])[0]
-
       # ul_stn_corr_flag: 1 byte UnsignedByte, bytes 399-400
-      self.ul_stn_corr_flag = struct.unpack('>B', sfdu_block[399:400])[0]
-
       # stn_cal_corr_flag: 1 byte UnsignedByte, bytes 400-401
-      self.stn_cal_corr_flag = struct.unpack('>B', sfdu_block[400:401])[0]
-
       # op_subcode6: 1 byte UnsignedByte, bytes 401-402
-      self.op_subcode6 = struct.unpack('>B', sfdu_block[401:402])[0]
-
       # ccsds_k: 1 byte UnsignedByte, bytes 402-403
-      self.ccsds_k = struct.unpack('>B', sfdu_block[402:403])[0]
-
       # ccsds_l: 1 byte UnsignedByte, bytes 403-404
-      self.ccsds_l = struct.unpack('>B', sfdu_block[403:404])[0]
-
       # reserve4: 4 byte UnsignedMSB4, bytes 404-408
-      self.reserve4 = sfdu_block[404:408]
+      ( self.chdo_type, self.chdo_length, self.stn_cal, self.dl_stn_cal, self.dl_cal_freq,
+        self.cal_std_dev, self.cal_pts, self.dl_rng_phs, self.figure_merit, self.rng_resid,
+        self.drvid, self.rtlt, self.pcn0, self.pcn0_resid, self.pdn0, self.pdn0_resid, self.prn0,
+        self.prn0_resid, self.system_noise_temp, self.state_subcode1, self.state_subcode2,
+        self.state_subcode3, self.state_subcode4, self.state_subcode5, self.state_subcode6,
+        self.pn_clk_phs, self.carr_loop_type, self.snt_flag, self.carr_resid_wt, self.template_id,
+        self.invert, self.correl_type, self.int_time, self.chip_rate, self.len_subcode1,
+        self.len_subcode2, self.len_subcode3, self.len_subcode4, self.len_subcode5,
+        self.len_subcode6, self.op_subcode1, self.op_subcode2, self.op_subcode3, self.op_subcode4,
+        self.op_subcode5, self.def_subcode1, self.def_subcode2, self.def_subcode3,
+        self.def_subcode4, self.def_subcode5, self.def_subcode6, self.pn_code_length,
+        self.rcv_inphs_time_year, self.rcv_inphs_time_doy, self.rcv_inphs_time_sec,
+        self.exc_scalar_num, self.exc_scalar_den, self.rng_cycle_time, self.inphs_correl,
+        self.quad_phs_correl, self.metrics_vld_flag, self.correl_vld_flag, self.rng_resid_tol_flag,
+        self.drvid_tol_flag, self.prn0_resid_tol_flag, self.rng_sigma_tol_flag, self.rng_vld_flag,
+        self.rng_config_flag, self.rng_hw_flag, self.rng_meas_type, self.time_tag_corr_flag,
+        self.type_time_corr_flag, self.dop_mode_corr_flag, self.ul_stn_corr_flag,
+        self.stn_cal_corr_flag, self.op_subcode6, self.ccsds_k, self.ccsds_l, self.reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 146 )
 
 # ---------------------------------------------------------------------------
 
@@ -3058,59 +2177,34 @@ class DopplerCountTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 160-220, decoded in a single call
+   LAYOUT = struct.Struct( '>HHB1sffddddBBBBBB8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # ref_rcv_type: 1 byte UnsignedByte, bytes 164-165
-      self.ref_rcv_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # reserve1a: 1 byte UnsignedByte, bytes 165-166
-      self.reserve1a = sfdu_block[165:166]
-
       # sampl_interval: 4 byte IEEE754MSBSingle, bytes 166-170
-      self.sampl_interval = struct.unpack('>f', sfdu_block[166:170])[0]
-
       # rcv_sig_lvl: 4 byte IEEE754MSBSingle, bytes 170-174
-      self.rcv_sig_lvl = struct.unpack('>f', sfdu_block[170:174])[0]
-
       # ul_freq: 8 byte IEEE754MSBDouble, bytes 174-182
-      self.ul_freq = struct.unpack('>d', sfdu_block[174:182])[0]
-
       # dop_cnt_bias_freq: 8 byte IEEE754MSBDouble, bytes 182-190
-      self.dop_cnt_bias_freq = struct.unpack('>d', sfdu_block[182:190])[0]
-
       # dop_cnt: 8 byte IEEE754MSBDouble, bytes 190-198
-      self.dop_cnt = struct.unpack('>d', sfdu_block[190:198])[0]
-
       # dop_pseudo_resid: 8 byte IEEE754MSBDouble, bytes 198-206
-      self.dop_pseudo_resid = struct.unpack('>d', sfdu_block[198:206])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 206-207
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[206:207])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 207-208
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[207:208])[0]
-
       # dop_mode_corr_flag: 1 byte UnsignedByte, bytes 208-209
-      self.dop_mode_corr_flag = struct.unpack('>B', sfdu_block[208:209])[0]
-
       # ul_stn_corr_flag: 1 byte UnsignedByte, bytes 209-210
-      self.ul_stn_corr_flag = struct.unpack('>B', sfdu_block[209:210])[0]
-
       # dl_band_corr_flag: 1 byte UnsignedByte, bytes 210-211
-      self.dl_band_corr_flag = struct.unpack('>B', sfdu_block[210:211])[0]
-
       # dop_vld_flag: 1 byte UnsignedByte, bytes 211-212
-      self.dop_vld_flag = struct.unpack('>B', sfdu_block[211:212])[0]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 212-220
-      self.reserve8 = sfdu_block[212:220]
+      ( self.chdo_type, self.chdo_length, self.ref_rcv_type, self.reserve1a, self.sampl_interval,
+        self.rcv_sig_lvl, self.ul_freq, self.dop_cnt_bias_freq, self.dop_cnt,
+        self.dop_pseudo_resid, self.time_tag_corr_flag, self.type_time_corr_flag,
+        self.dop_mode_corr_flag, self.ul_stn_corr_flag, self.dl_band_corr_flag, self.dop_vld_flag,
+        self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -3244,176 +2338,82 @@ class SequentialRangeTrackingCHDO:
       out += '            reserve6 = %s \n' % self.reserve6
       return out
 
+   # the fixed fields of bytes 160-350, decoded in a single call
+   LAYOUT = struct.Struct( '>HHdddddBBfdfffBBHHHBBBBfffIIdIffdBBfddBBfffffBBBBBBBBBB6s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # ul_stn_cal: 8 byte IEEE754MSBDouble, bytes 164-172
-      self.ul_stn_cal = struct.unpack('>d', sfdu_block[164:172])[0]
-
       # dl_stn_cal: 8 byte IEEE754MSBDouble, bytes 172-180
-      self.dl_stn_cal = struct.unpack('>d', sfdu_block[172:180])[0]
-
       # meas_rng: 8 byte IEEE754MSBDouble, bytes 180-188
-      self.meas_rng = struct.unpack('>d', sfdu_block[180:188])[0]
-
       # rng_obs: 8 byte IEEE754MSBDouble, bytes 188-196
-      self.rng_obs = struct.unpack('>d', sfdu_block[188:196])[0]
-
       # rng_obs_dl: 8 byte IEEE754MSBDouble, bytes 196-204
-      self.rng_obs_dl = struct.unpack('>d', sfdu_block[196:204])[0]
-
       # clock_waveform: 1 byte UnsignedByte, bytes 204-205
-      self.clock_waveform = struct.unpack('>B', sfdu_block[204:205])[0]
-
       # chop_start_num: 1 byte UnsignedByte, bytes 205-206
-      self.chop_start_num = struct.unpack('>B', sfdu_block[205:206])[0]
-
       # figure_merit: 4 byte IEEE754MSBSingle, bytes 206-210
-      self.figure_merit = struct.unpack('>f', sfdu_block[206:210])[0]
-
       # drvid: 8 byte IEEE754MSBDouble, bytes 210-218
-      self.drvid = struct.unpack('>d', sfdu_block[210:218])[0]
-
       # rtlt: 4 byte IEEE754MSBSingle, bytes 218-222
-      self.rtlt = struct.unpack('>f', sfdu_block[218:222])[0]
-
       # prn0: 4 byte IEEE754MSBSingle, bytes 222-226
-      self.prn0 = struct.unpack('>f', sfdu_block[222:226])[0]
-
       # transmit_pwr: 4 byte IEEE754MSBSingle, bytes 226-230
-      self.transmit_pwr = struct.unpack('>f', sfdu_block[226:230])[0]
-
       # invert: 1 byte UnsignedByte, bytes 230-231
-      self.invert = struct.unpack('>B', sfdu_block[230:231])[0]
-
       # correl_type: 1 byte UnsignedByte, bytes 231-232
-      self.correl_type = struct.unpack('>B', sfdu_block[231:232])[0]
-
       # t1: 2 byte UnsignedMSB2, bytes 232-234
-      self.t1 = struct.unpack('>H', sfdu_block[232:234])[0]
-
       # t2: 2 byte UnsignedMSB2, bytes 234-236
-      self.t2 = struct.unpack('>H', sfdu_block[234:236])[0]
-
       # t3: 2 byte UnsignedMSB2, bytes 236-238
-      self.t3 = struct.unpack('>H', sfdu_block[236:238])[0]
-
       # first_comp_num: 1 byte UnsignedByte, bytes 238-239
-      self.first_comp_num = struct.unpack('>B', sfdu_block[238:239])[0]
-
       # last_comp_num: 1 byte UnsignedByte, bytes 239-240
-      self.last_comp_num = struct.unpack('>B', sfdu_block[239:240])[0]
-
       # chop_comp_num: 1 byte UnsignedByte, bytes 240-241
-      self.chop_comp_num = struct.unpack('>B', sfdu_block[240:241])[0]
-
       # num_drvid: 1 byte UnsignedByte, bytes 241-242
-      self.num_drvid = struct.unpack('>B', sfdu_block[241:242])[0]
-
       # transmit_inphs_time: 4 byte IEEE754MSBSingle, bytes 242-246
-      self.transmit_inphs_time = struct.unpack('>f', sfdu_block[242:246])[0]
-
       # rcv_inphs_time: 4 byte IEEE754MSBSingle, bytes 246-250
-      self.rcv_inphs_time = struct.unpack('>f', sfdu_block[246:250])[0]
-
       # carr_sup_rng_modul: 4 byte IEEE754MSBSingle, bytes 250-254
-      self.carr_sup_rng_modul = struct.unpack('>f', sfdu_block[250:254])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 254-258
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[254:258])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 258-262
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[258:262])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 262-270
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[262:270])[0]
-
       # rng_modulo: 4 byte UnsignedMSB4, bytes 270-274
-      self.rng_modulo = struct.unpack('>I', sfdu_block[270:274])[0]
-
       # inphs_correl: 4 byte IEEE754MSBSingle, bytes 274-278
-      self.inphs_correl = struct.unpack('>f', sfdu_block[274:278])[0]
-
       # quad_phs_correl: 4 byte IEEE754MSBSingle, bytes 278-282
-      self.quad_phs_correl = struct.unpack('>f', sfdu_block[278:282])[0]
-
       # ul_freq: 8 byte IEEE754MSBDouble, bytes 282-290
-      self.ul_freq = struct.unpack('>d', sfdu_block[282:290])[0]
-
       # rng_type: 1 byte UnsignedByte, bytes 290-291
-      self.rng_type = struct.unpack('>B', sfdu_block[290:291])[0]
-
       # fabricated_ul_flag: 1 byte UnsignedByte, bytes 291-292
-      self.fabricated_ul_flag = struct.unpack('>B', sfdu_block[291:292])[0]
-
       # rng_noise: 4 byte IEEE754MSBSingle, bytes 292-296
-      self.rng_noise = struct.unpack('>f', sfdu_block[292:296])[0]
-
       # rng_prefit_resid: 8 byte IEEE754MSBDouble, bytes 296-304
-      self.rng_prefit_resid = struct.unpack('>d', sfdu_block[296:304])[0]
-
       # rng_dl_prefit_resid: 8 byte IEEE754MSBDouble, bytes 304-312
-      self.rng_dl_prefit_resid = struct.unpack('>d', sfdu_block[304:312])[0]
-
       # rng_prefit_resid_vld_flag: 1 byte UnsignedByte, bytes 312-313
-      self.rng_prefit_resid_vld_flag = struct.unpack('>B', sfdu_block[312:313])[0]
-
       # rng_dl_prefit_resid_vld_flag: 1 byte UnsignedByte, bytes 313-314
-      self.rng_dl_prefit_resid_vld_flag = struct.unpack('>B', sfdu_block[313:314])[0]
-
       # rng_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 314-318
-      self.rng_resid_tol_value = struct.unpack('>f', sfdu_block[314:318])[0]
-
       # drvid_tol_value: 4 byte IEEE754MSBSingle, bytes 318-322
-      self.drvid_tol_value = struct.unpack('>f', sfdu_block[318:322])[0]
-
       # prn0_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 322-326
-      self.prn0_resid_tol_value = struct.unpack('>f', sfdu_block[322:326])[0]
-
       # rng_sigma_tol_value: 4 byte IEEE754MSBSingle, bytes 326-330
-      self.rng_sigma_tol_value = struct.unpack('>f', sfdu_block[326:330])[0]
-
       # fom_tol_value: 4 byte IEEE754MSBSingle, bytes 330-334
-      self.fom_tol_value = struct.unpack('>f', sfdu_block[330:334])[0]
-
       # rng_resid_tol_flag: 1 byte UnsignedByte, bytes 334-335
-      self.rng_resid_tol_flag = struct.unpack('>B', sfdu_block[334:335])[0]
-
       # drvid_tol_flag: 1 byte UnsignedByte, bytes 335-336
-      self.drvid_tol_flag = struct.unpack('>B', sfdu_block[335:336])[0]
-
       # prn0_resid_tol_flag: 1 byte UnsignedByte, bytes 336-337
-      self.prn0_resid_tol_flag = struct.unpack('>B', sfdu_block[336:337])[0]
-
       # rng_sigma_tol_flag: 1 byte UnsignedByte, bytes 337-338
-      self.rng_sigma_tol_flag = struct.unpack('>B', sfdu_block[337:338])[0]
-
       # rng_vld_flag: 1 byte UnsignedByte, bytes 338-339
-      self.rng_vld_flag = struct.unpack('>B', sfdu_block[338:339])[0]
-
       # rng_config_flag: 1 byte UnsignedByte, bytes 339-340
-      self.rng_config_flag = struct.unpack('>B', sfdu_block[339:340])[0]
-
       # stn_cal_corr_flag: 1 byte UnsignedByte, bytes 340-341
-      self.stn_cal_corr_flag = struct.unpack('>B', sfdu_block[340:341])[0]
-
       # rng_chan_num: 1 byte UnsignedByte, bytes 341-342
-      self.rng_chan_num = struct.unpack('>B', sfdu_block[341:342])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 342-343
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[342:343])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 343-344
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[343:344])[0]
-
       # reserve6: 6 byte UnsignedMSB6, bytes 344-350
-      self.reserve6 = sfdu_block[344:350]
+      ( self.chdo_type, self.chdo_length, self.ul_stn_cal, self.dl_stn_cal, self.meas_rng,
+        self.rng_obs, self.rng_obs_dl, self.clock_waveform, self.chop_start_num, self.figure_merit,
+        self.drvid, self.rtlt, self.prn0, self.transmit_pwr, self.invert, self.correl_type,
+        self.t1, self.t2, self.t3, self.first_comp_num, self.last_comp_num, self.chop_comp_num,
+        self.num_drvid, self.transmit_inphs_time, self.rcv_inphs_time, self.carr_sup_rng_modul,
+        self.exc_scalar_num, self.exc_scalar_den, self.rng_cycle_time, self.rng_modulo,
+        self.inphs_correl, self.quad_phs_correl, self.ul_freq, self.rng_type,
+        self.fabricated_ul_flag, self.rng_noise, self.rng_prefit_resid, self.rng_dl_prefit_resid,
+        self.rng_prefit_resid_vld_flag, self.rng_dl_prefit_resid_vld_flag,
+        self.rng_resid_tol_value, self.drvid_tol_value, self.prn0_resid_tol_value,
+        self.rng_sigma_tol_value, self.fom_tol_value, self.rng_resid_tol_flag, self.drvid_tol_flag,
+        self.prn0_resid_tol_flag, self.rng_sigma_tol_flag, self.rng_vld_flag, self.rng_config_flag,
+        self.stn_cal_corr_flag, self.rng_chan_num, self.time_tag_corr_flag,
+        self.type_time_corr_flag, self.reserve6 ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -3467,56 +2467,32 @@ class AngleTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 160-198, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBBBBBffffBB2s8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # source_type: 1 byte UnsignedByte, bytes 164-165
-      self.source_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # ang_type: 1 byte UnsignedByte, bytes 165-166
-      self.ang_type = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # ang_vld_flag: 1 byte UnsignedByte, bytes 166-167
-      self.ang_vld_flag = struct.unpack('>B', sfdu_block[166:167])[0]
-
       # ang_mode: 1 byte UnsignedByte, bytes 167-168
-      self.ang_mode = struct.unpack('>B', sfdu_block[167:168])[0]
-
       # conscan_mode: 1 byte UnsignedByte, bytes 168-169
-      self.conscan_mode = struct.unpack('>B', sfdu_block[168:169])[0]
-
       # acq_aid_mode: 1 byte UnsignedByte, bytes 169-170
-      self.acq_aid_mode = struct.unpack('>B', sfdu_block[169:170])[0]
-
       # ang1: 4 byte IEEE754MSBSingle, bytes 170-174
-      self.ang1 = struct.unpack('>f', sfdu_block[170:174])[0]
-
       # ang2: 4 byte IEEE754MSBSingle, bytes 174-178
-      self.ang2 = struct.unpack('>f', sfdu_block[174:178])[0]
-
       # ang1_pseudo_resid: 4 byte IEEE754MSBSingle, bytes 178-182
-      self.ang1_pseudo_resid = struct.unpack('>f', sfdu_block[178:182])[0]
-
       # ang2_pseudo_resid: 4 byte IEEE754MSBSingle, bytes 182-186
-      self.ang2_pseudo_resid = struct.unpack('>f', sfdu_block[182:186])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 186-187
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[186:187])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 187-188
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[187:188])[0]
-
       # reserve2: 2 byte UnsignedMSB2, bytes 188-190
-      self.reserve2 = sfdu_block[188:190]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 190-198
-      self.reserve8 = sfdu_block[190:198]
+      ( self.chdo_type, self.chdo_length, self.source_type, self.ang_type, self.ang_vld_flag,
+        self.ang_mode, self.conscan_mode, self.acq_aid_mode, self.ang1, self.ang2,
+        self.ang1_pseudo_resid, self.ang2_pseudo_resid, self.time_tag_corr_flag,
+        self.type_time_corr_flag, self.reserve2, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -3558,38 +2534,25 @@ class RampTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 102-144, decoded in a single call
+   LAYOUT = struct.Struct( '>HHIIIddBB8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 102-104
-      self.chdo_type = struct.unpack('>H', sfdu_block[102:104])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 104-106
-      self.chdo_length = struct.unpack('>H', sfdu_block[104:106])[0]
-
       # ul_hi_phs_cycles: 4 byte UnsignedMSB4, bytes 106-110
-      self.ul_hi_phs_cycles = struct.unpack('>I', sfdu_block[106:110])[0]
-
       # ul_lo_phs_cycles: 4 byte UnsignedMSB4, bytes 110-114
-      self.ul_lo_phs_cycles = struct.unpack('>I', sfdu_block[110:114])[0]
-
       # ul_frac_phs_cycles: 4 byte UnsignedMSB4, bytes 114-118
-      self.ul_frac_phs_cycles = struct.unpack('>I', sfdu_block[114:118])[0]
-
       # ramp_freq: 8 byte IEEE754MSBDouble, bytes 118-126
-      self.ramp_freq = struct.unpack('>d', sfdu_block[118:126])[0]
-
       # ramp_rate: 8 byte IEEE754MSBDouble, bytes 126-134
-      self.ramp_rate = struct.unpack('>d', sfdu_block[126:134])[0]
-
       # ramp_type: 1 byte UnsignedByte, bytes 134-135
-      self.ramp_type = struct.unpack('>B', sfdu_block[134:135])[0]
-
       # fabricated_sfdu_flag: 1 byte UnsignedByte, bytes 135-136
-      self.fabricated_sfdu_flag = struct.unpack('>B', sfdu_block[135:136])[0]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 136-144
-      self.reserve8 = sfdu_block[136:144]
+      ( self.chdo_type, self.chdo_length, self.ul_hi_phs_cycles, self.ul_lo_phs_cycles,
+        self.ul_frac_phs_cycles, self.ramp_freq, self.ramp_rate, self.ramp_type,
+        self.fabricated_sfdu_flag, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 102 )
 
 # ---------------------------------------------------------------------------
 
@@ -3653,71 +2616,38 @@ class VlbiCHDO:
       out += '           Reserve20 = %s \n' % self.Reserve20
       return out
 
+   # the fixed fields of bytes 124-224, decoded in a single call
+   LAYOUT = struct.Struct( '>HHHHdffBB12sHBBBBddfdd20s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 124-126
-      self.chdo_type = struct.unpack('>H', sfdu_block[124:126])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 126-128
-      self.chdo_length = struct.unpack('>H', sfdu_block[126:128])[0]
-
       # clk_off_epoch_year: 2 byte UnsignedMSB2, bytes 128-130
-      self.clk_off_epoch_year = struct.unpack('>H', sfdu_block[128:130])[0]
-
       # clk_off_epoch_doy: 2 byte UnsignedMSB2, bytes 130-132
-      self.clk_off_epoch_doy = struct.unpack('>H', sfdu_block[130:132])[0]
-
       # clk_off_epoch_sec: 8 byte IEEE754MSBDouble, bytes 132-140
-      self.clk_off_epoch_sec = struct.unpack('>d', sfdu_block[132:140])[0]
-
       # clk_off_1: 4 byte IEEE754MSBSingle, bytes 140-144
-      self.clk_off_1 = struct.unpack('>f', sfdu_block[140:144])[0]
-
       # clk_off_2: 4 byte IEEE754MSBSingle, bytes 144-148
-      self.clk_off_2 = struct.unpack('>f', sfdu_block[144:148])[0]
-
       # phs_cal_flag: 1 byte UnsignedByte, bytes 148-149
-      self.phs_cal_flag = struct.unpack('>B', sfdu_block[148:149])[0]
-
       # chan_sampl_flag: 1 byte UnsignedByte, bytes 149-150
-      self.chan_sampl_flag = struct.unpack('>B', sfdu_block[149:150])[0]
-
       # quasar_id: 12 byte ASCII_String, bytes 150-162
-      self.quasar_id = struct.unpack('>12s', sfdu_block[150:162])[0]
-
       # quasar_id_num: 2 byte UnsignedMSB2, bytes 162-164
-      self.quasar_id_num = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # data_qual_flag: 1 byte UnsignedByte, bytes 164-165
-      self.data_qual_flag = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # freq_chan_num: 1 byte UnsignedByte, bytes 165-166
-      self.freq_chan_num = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # mode_id: 1 byte UnsignedByte, bytes 166-167
-      self.mode_id = struct.unpack('>B', sfdu_block[166:167])[0]
-
       # modulo_flag: 1 byte UnsignedByte, bytes 167-168
-      self.modulo_flag = struct.unpack('>B', sfdu_block[167:168])[0]
-
       # ref_freq: 8 byte IEEE754MSBDouble, bytes 168-176
-      self.ref_freq = struct.unpack('>d', sfdu_block[168:176])[0]
-
       # modulus: 8 byte IEEE754MSBDouble, bytes 176-184
-      self.modulus = struct.unpack('>d', sfdu_block[176:184])[0]
-
       # dod_cnt_time: 4 byte IEEE754MSBSingle, bytes 184-188
-      self.dod_cnt_time = struct.unpack('>f', sfdu_block[184:188])[0]
-
       # dod_obs: 8 byte IEEE754MSBDouble, bytes 188-196
-      self.dod_obs = struct.unpack('>d', sfdu_block[188:196])[0]
-
       # dor_obs: 8 byte IEEE754MSBDouble, bytes 196-204
-      self.dor_obs = struct.unpack('>d', sfdu_block[196:204])[0]
-
       # Reserve20: 20 byte UnsignedMSB20, bytes 204-224
-      self.Reserve20 = sfdu_block[204:224]
+      ( self.chdo_type, self.chdo_length, self.clk_off_epoch_year, self.clk_off_epoch_doy,
+        self.clk_off_epoch_sec, self.clk_off_1, self.clk_off_2, self.phs_cal_flag,
+        self.chan_sampl_flag, self.quasar_id, self.quasar_id_num, self.data_qual_flag,
+        self.freq_chan_num, self.mode_id, self.modulo_flag, self.ref_freq, self.modulus,
+        self.dod_cnt_time, self.dod_obs, self.dor_obs, self.Reserve20 ) = self.LAYOUT.unpack_from( sfdu_block, 124 )
 
 # ---------------------------------------------------------------------------
 
@@ -3767,50 +2697,29 @@ class DrvidTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 160-202, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBdffff1sBBB8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # drvid_type: 1 byte UnsignedByte, bytes 164-165
-      self.drvid_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # drvid_pts: 1 byte UnsignedByte, bytes 165-166
-      self.drvid_pts = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # drvid: 8 byte IEEE754MSBDouble, bytes 166-174
-      self.drvid = struct.unpack('>d', sfdu_block[166:174])[0]
-
       # prn0: 4 byte IEEE754MSBSingle, bytes 174-178
-      self.prn0 = struct.unpack('>f', sfdu_block[174:178])[0]
-
       # drvid_noise: 4 byte IEEE754MSBSingle, bytes 178-182
-      self.drvid_noise = struct.unpack('>f', sfdu_block[178:182])[0]
-
       # drvid_tol_value: 4 byte IEEE754MSBSingle, bytes 182-186
-      self.drvid_tol_value = struct.unpack('>f', sfdu_block[182:186])[0]
-
       # prn0_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 186-190
-      self.prn0_resid_tol_value = struct.unpack('>f', sfdu_block[186:190])[0]
-
       # reserve1: 1 byte UnsignedByte, bytes 190-191
-      self.reserve1 = sfdu_block[190:191]
-
       # drvid_tol_flag: 1 byte UnsignedByte, bytes 191-192
-      self.drvid_tol_flag = struct.unpack('>B', sfdu_block[191:192])[0]
-
       # prn0_resid_tol_flag: 1 byte UnsignedByte, bytes 192-193
-      self.prn0_resid_tol_flag = struct.unpack('>B', sfdu_block[192:193])[0]
-
       # drvid_noise_pts: 1 byte UnsignedByte, bytes 193-194
-      self.drvid_noise_pts = struct.unpack('>B', sfdu_block[193:194])[0]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 194-202
-      self.reserve8 = sfdu_block[194:202]
+      ( self.chdo_type, self.chdo_length, self.drvid_type, self.drvid_pts, self.drvid, self.prn0,
+        self.drvid_noise, self.drvid_tol_value, self.prn0_resid_tol_value, self.reserve1,
+        self.drvid_tol_flag, self.prn0_resid_tol_flag, self.drvid_noise_pts, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -3866,59 +2775,33 @@ class SmoothedNoiseTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 134-184, decoded in a single call
+   LAYOUT = struct.Struct( '>HHffffffIfBBBBBB8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 134-136
-      self.chdo_type = struct.unpack('>H', sfdu_block[134:136])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 136-138
-      self.chdo_length = struct.unpack('>H', sfdu_block[136:138])[0]
-
       # 01sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 138-142
-      self.n01sec_sm_noise = struct.unpack('>f', sfdu_block[138:142])[0]
-
       # 1sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 142-146
-      self.n1sec_sm_noise = struct.unpack('>f', sfdu_block[142:146])[0]
-
       # 10sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 146-150
-      self.n10sec_sm_noise = struct.unpack('>f', sfdu_block[146:150])[0]
-
       # 100sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 150-154
-      self.n100sec_sm_noise = struct.unpack('>f', sfdu_block[150:154])[0]
-
       # 200sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 154-158
-      self.n200sec_sm_noise = struct.unpack('>f', sfdu_block[154:158])[0]
-
       # 600sec_sm_noise: 4 byte IEEE754MSBSingle, bytes 158-162
-      self.n600sec_sm_noise = struct.unpack('>f', sfdu_block[158:162])[0]
-
       # int_time: 4 byte UnsignedMSB4, bytes 162-166
-      self.int_time = struct.unpack('>I', sfdu_block[162:166])[0]
-
       # percent_data_used: 4 byte IEEE754MSBSingle, bytes 166-170
-      self.percent_data_used = struct.unpack('>f', sfdu_block[166:170])[0]
-
       # new_01sec: 1 byte UnsignedByte, bytes 170-171
-      self.new_01sec = struct.unpack('>B', sfdu_block[170:171])[0]
-
       # new_1sec: 1 byte UnsignedByte, bytes 171-172
-      self.new_1sec = struct.unpack('>B', sfdu_block[171:172])[0]
-
       # new_10sec: 1 byte UnsignedByte, bytes 172-173
-      self.new_10sec = struct.unpack('>B', sfdu_block[172:173])[0]
-
       # new_100sec: 1 byte UnsignedByte, bytes 173-174
-      self.new_100sec = struct.unpack('>B', sfdu_block[173:174])[0]
-
       # new_200sec: 1 byte UnsignedByte, bytes 174-175
-      self.new_200sec = struct.unpack('>B', sfdu_block[174:175])[0]
-
       # new_600sec: 1 byte UnsignedByte, bytes 175-176
-      self.new_600sec = struct.unpack('>B', sfdu_block[175:176])[0]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 176-184
-      self.reserve8 = sfdu_block[176:184]
+      ( self.chdo_type, self.chdo_length, self.n01sec_sm_noise, self.n1sec_sm_noise,
+        self.n10sec_sm_noise, self.n100sec_sm_noise, self.n200sec_sm_noise, self.n600sec_sm_noise,
+        self.int_time, self.percent_data_used, self.new_01sec, self.new_1sec, self.new_10sec,
+        self.new_100sec, self.new_200sec, self.new_600sec, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 134 )
 
 # ---------------------------------------------------------------------------
 
@@ -3972,56 +2855,32 @@ class AllanDeviationTrackingCHDO:
       out += '            reserve8 = %s \n' % self.reserve8
       return out
 
+   # the fixed fields of bytes 134-180, decoded in a single call
+   LAYOUT = struct.Struct( '>HHfffffIfBBBBBB8s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 134-136
-      self.chdo_type = struct.unpack('>H', sfdu_block[134:136])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 136-138
-      self.chdo_length = struct.unpack('>H', sfdu_block[136:138])[0]
-
       # 01sec_allan_dev: 4 byte IEEE754MSBSingle, bytes 138-142
-      self.n01sec_allan_dev = struct.unpack('>f', sfdu_block[138:142])[0]
-
       # 1sec_allan_dev: 4 byte IEEE754MSBSingle, bytes 142-146
-      self.n1sec_allan_dev = struct.unpack('>f', sfdu_block[142:146])[0]
-
       # 10sec_allan_dev: 4 byte IEEE754MSBSingle, bytes 146-150
-      self.n10sec_allan_dev = struct.unpack('>f', sfdu_block[146:150])[0]
-
       # 100sec_allan_dev: 4 byte IEEE754MSBSingle, bytes 150-154
-      self.n100sec_allan_dev = struct.unpack('>f', sfdu_block[150:154])[0]
-
       # 1000sec_allan_dev: 4 byte IEEE754MSBSingle, bytes 154-158
-      self.n1000sec_allan_dev = struct.unpack('>f', sfdu_block[154:158])[0]
-
       # int_time: 4 byte UnsignedMSB4, bytes 158-162
-      self.int_time = struct.unpack('>I', sfdu_block[158:162])[0]
-
       # percent_data_used: 4 byte IEEE754MSBSingle, bytes 162-166
-      self.percent_data_used = struct.unpack('>f', sfdu_block[162:166])[0]
-
       # rpt_cause: 1 byte UnsignedByte, bytes 166-167
-      self.rpt_cause = struct.unpack('>B', sfdu_block[166:167])[0]
-
       # new_01sec: 1 byte UnsignedByte, bytes 167-168
-      self.new_01sec = struct.unpack('>B', sfdu_block[167:168])[0]
-
       # new_1sec: 1 byte UnsignedByte, bytes 168-169
-      self.new_1sec = struct.unpack('>B', sfdu_block[168:169])[0]
-
       # new_10sec: 1 byte UnsignedByte, bytes 169-170
-      self.new_10sec = struct.unpack('>B', sfdu_block[169:170])[0]
-
       # new_100sec: 1 byte UnsignedByte, bytes 170-171
-      self.new_100sec = struct.unpack('>B', sfdu_block[170:171])[0]
-
       # new_1000sec: 1 byte UnsignedByte, bytes 171-172
-      self.new_1000sec = struct.unpack('>B', sfdu_block[171:172])[0]
-
       # reserve8: 8 byte UnsignedMSB8, bytes 172-180
-      self.reserve8 = sfdu_block[172:180]
+      ( self.chdo_type, self.chdo_length, self.n01sec_allan_dev, self.n1sec_allan_dev,
+        self.n10sec_allan_dev, self.n100sec_allan_dev, self.n1000sec_allan_dev, self.int_time,
+        self.percent_data_used, self.rpt_cause, self.new_01sec, self.new_1sec, self.new_10sec,
+        self.new_100sec, self.new_1000sec, self.reserve8 ) = self.LAYOUT.unpack_from( sfdu_block, 134 )
 
 # ---------------------------------------------------------------------------
 
@@ -4165,191 +3024,88 @@ class PnRangeTrackingCHDO:
       out += '            Reserve4 = %s \n' % self.Reserve4
       return out
 
+   # the fixed fields of bytes 160-368, decoded in a single call
+   LAYOUT = struct.Struct( '>HHddddfdfffBBBBBBBBBBBBBBQQQQQQIfffIIdIBBfdBBfffffBBBBBBBBBB4s' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # ul_stn_cal: 8 byte IEEE754MSBDouble, bytes 164-172
-      self.ul_stn_cal = struct.unpack('>d', sfdu_block[164:172])[0]
-
       # dl_stn_cal: 8 byte IEEE754MSBDouble, bytes 172-180
-      self.dl_stn_cal = struct.unpack('>d', sfdu_block[172:180])[0]
-
       # meas_rng: 8 byte IEEE754MSBDouble, bytes 180-188
-      self.meas_rng = struct.unpack('>d', sfdu_block[180:188])[0]
-
       # rng_obs_dl: 8 byte IEEE754MSBDouble, bytes 188-196
-      self.rng_obs_dl = struct.unpack('>d', sfdu_block[188:196])[0]
-
       # figure_merit: 4 byte IEEE754MSBSingle, bytes 196-200
-      self.figure_merit = struct.unpack('>f', sfdu_block[196:200])[0]
-
       # drvid: 8 byte IEEE754MSBDouble, bytes 200-208
-      self.drvid = struct.unpack('>d', sfdu_block[200:208])[0]
-
       # rtlt: 4 byte IEEE754MSBSingle, bytes 208-212
-      self.rtlt = struct.unpack('>f', sfdu_block[208:212])[0]
-
       # prn0: 4 byte IEEE754MSBSingle, bytes 212-216
-      self.prn0 = struct.unpack('>f', sfdu_block[212:216])[0]
-
       # transmit_pwr: 4 byte IEEE754MSBSingle, bytes 216-220
-      self.transmit_pwr = struct.unpack('>f', sfdu_block[216:220])[0]
-
       # invert: 1 byte UnsignedByte, bytes 220-221
-      self.invert = struct.unpack('>B', sfdu_block[220:221])[0]
-
       # correl_type: 1 byte UnsignedByte, bytes 221-222
-      self.correl_type = struct.unpack('>B', sfdu_block[221:222])[0]
-
       # chip_rate: 1 byte UnsignedByte, bytes 222-223
-      self.chip_rate = struct.unpack('>B', sfdu_block[222:223])[0]
-
       # len_subcode1: 1 byte UnsignedByte, bytes 223-224
-      self.len_subcode1 = struct.unpack('>B', sfdu_block[223:224])[0]
-
       # len_subcode2: 1 byte UnsignedByte, bytes 224-225
-      self.len_subcode2 = struct.unpack('>B', sfdu_block[224:225])[0]
-
       # len_subcode3: 1 byte UnsignedByte, bytes 225-226
-      self.len_subcode3 = struct.unpack('>B', sfdu_block[225:226])[0]
-
       # len_subcode4: 1 byte UnsignedByte, bytes 226-227
-      self.len_subcode4 = struct.unpack('>B', sfdu_block[226:227])[0]
-
       # len_subcode5: 1 byte UnsignedByte, bytes 227-228
-      self.len_subcode5 = struct.unpack('>B', sfdu_block[227:228])[0]
-
       # len_subcode6: 1 byte UnsignedByte, bytes 228-229
-      self.len_subcode6 = struct.unpack('>B', sfdu_block[228:229])[0]
-
       # op_subcode1: 1 byte UnsignedByte, bytes 229-230
-      self.op_subcode1 = struct.unpack('>B', sfdu_block[229:230])[0]
-
       # op_subcode2: 1 byte UnsignedByte, bytes 230-231
-      self.op_subcode2 = struct.unpack('>B', sfdu_block[230:231])[0]
-
       # op_subcode3: 1 byte UnsignedByte, bytes 231-232
-      self.op_subcode3 = struct.unpack('>B', sfdu_block[231:232])[0]
-
       # op_subcode4: 1 byte UnsignedByte, bytes 232-233
-      self.op_subcode4 = struct.unpack('>B', sfdu_block[232:233])[0]
-
       # op_subcode5: 1 byte UnsignedByte, bytes 233-234
-      self.op_subcode5 = struct.unpack('>B', sfdu_block[233:234])[0]
-
       # def_subcode1: 8 byte UnsignedMSB8, bytes 234-242
-      self.def_subcode1 = struct.unpack('>Q', sfdu_block[234:242])[0]
-
       # def_subcode2: 8 byte UnsignedMSB8, bytes 242-250
-      self.def_subcode2 = struct.unpack('>Q', sfdu_block[242:250])[0]
-
       # def_subcode3: 8 byte UnsignedMSB8, bytes 250-258
-      self.def_subcode3 = struct.unpack('>Q', sfdu_block[250:258])[0]
-
       # def_subcode4: 8 byte UnsignedMSB8, bytes 258-266
-      self.def_subcode4 = struct.unpack('>Q', sfdu_block[258:266])[0]
-
       # def_subcode5: 8 byte UnsignedMSB8, bytes 266-274
-      self.def_subcode5 = struct.unpack('>Q', sfdu_block[266:274])[0]
-
       # def_subcode6: 8 byte UnsignedMSB8, bytes 274-282
-      self.def_subcode6 = struct.unpack('>Q', sfdu_block[274:282])[0]
-
       # pn_code_length: 4 byte UnsignedMSB4, bytes 282-286
-      self.pn_code_length = struct.unpack('>I', sfdu_block[282:286])[0]
-
       # transmit_inphs_time: 4 byte IEEE754MSBSingle, bytes 286-290
-      self.transmit_inphs_time = struct.unpack('>f', sfdu_block[286:290])[0]
-
       # rcv_inphs_time: 4 byte IEEE754MSBSingle, bytes 290-294
-      self.rcv_inphs_time = struct.unpack('>f', sfdu_block[290:294])[0]
-
       # carr_sup_rng_modul: 4 byte IEEE754MSBSingle, bytes 294-298
-      self.carr_sup_rng_modul = struct.unpack('>f', sfdu_block[294:298])[0]
-
       # exc_scalar_num: 4 byte UnsignedMSB4, bytes 298-302
-      self.exc_scalar_num = struct.unpack('>I', sfdu_block[298:302])[0]
-
       # exc_scalar_den: 4 byte UnsignedMSB4, bytes 302-306
-      self.exc_scalar_den = struct.unpack('>I', sfdu_block[302:306])[0]
-
       # rng_cycle_time: 8 byte IEEE754MSBDouble, bytes 306-314
-      self.rng_cycle_time = struct.unpack('>d', sfdu_block[306:314])[0]
-
       # rng_modulo: 4 byte UnsignedMSB4, bytes 314-318
-      self.rng_modulo = struct.unpack('>I', sfdu_block[314:318])[0]
-
       # rng_type: 1 byte UnsignedByte, bytes 318-319
-      self.rng_type = struct.unpack('>B', sfdu_block[318:319])[0]
-
       # fabricated_ul_flag: 1 byte UnsignedByte, bytes 319-320
-      self.fabricated_ul_flag = struct.unpack('>B', sfdu_block[319:320])[0]
-
       # rng_noise: 4 byte IEEE754MSBSingle, bytes 320-324
-      self.rng_noise = struct.unpack('>f', sfdu_block[320:324])[0]
-
       # rng_dl_prefit_resid: 8 byte IEEE754MSBDouble, bytes 324-332
-      self.rng_dl_prefit_resid = struct.unpack('>d', sfdu_block[324:332])[0]
-
       # rng_dl_prefit_resid_vld_flag: 1 byte UnsignedByte, bytes 332-333
-      self.rng_dl_prefit_resid_vld_flag = struct.unpack('>B', sfdu_block[332:333])[0]
-
       # clock_waveform: 1 byte UnsignedByte, bytes 333-334
-      self.clock_waveform = struct.unpack('>B', sfdu_block[333:334])[0]
-
       # rng_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 334-338
-      self.rng_resid_tol_value = struct.unpack('>f', sfdu_block[334:338])[0]
-
       # drvid_tol_value: 4 byte IEEE754MSBSingle, bytes 338-342
-      self.drvid_tol_value = struct.unpack('>f', sfdu_block[338:342])[0]
-
       # prn0_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 342-346
-      self.prn0_resid_tol_value = struct.unpack('>f', sfdu_block[342:346])[0]
-
       # rng_sigma_tol_value: 4 byte IEEE754MSBSingle, bytes 346-350
-      self.rng_sigma_tol_value = struct.unpack('>f', sfdu_block[346:350])[0]
-
       # fom_tol_value: 4 byte IEEE754MSBSingle, bytes 350-354
-      self.fom_tol_value = struct.unpack('>f', sfdu_block[350:354])[0]
-
       # rng_resid_tol_flag: 1 byte UnsignedByte, bytes 354-355
-      self.rng_resid_tol_flag = struct.unpack('>B', sfdu_block[354:355])[0]
-
       # drvid_tol_flag: 1 byte UnsignedByte, bytes 355-356
-      self.drvid_tol_flag = struct.unpack('>B', sfdu_block[355:356])[0]
-
       # prn0_resid_tol_flag: 1 byte UnsignedByte, bytes 356-357
-      self.prn0_resid_tol_flag = struct.unpack('>B', sfdu_block[356:357])[0]
-
       # rng_sigma_tol_flag: 1 byte UnsignedByte, bytes 357-358
-      self.rng_sigma_tol_flag = struct.unpack('>B', sfdu_block[357:358])[0]
-
       # rng_vld_flag: 1 byte UnsignedByte, bytes 358-359
-      self.rng_vld_flag = struct.unpack('>B', sfdu_block[358:359])[0]
-
       # rng_config_flag: 1 byte UnsignedByte, bytes 359-360
-      self.rng_config_flag = struct.unpack('>B', sfdu_block[359:360])[0]
-
       # stn_cal_corr_flag: 1 byte UnsignedByte, bytes 360-361
-      self.stn_cal_corr_flag = struct.unpack('>B', sfdu_block[360:361])[0]
-
       # op_subcode6: 1 byte UnsignedByte, bytes 361-362
-      self.op_subcode6 = struct.unpack('>B', sfdu_block[361:362])[0]
-
       # ccsds_k: 1 byte UnsignedByte, bytes 362-363
-      self.ccsds_k = struct.unpack('>B', sfdu_block[362:363])[0]
-
       # ccsds_l: 1 byte UnsignedByte, bytes 363-364
-      self.ccsds_l = struct.unpack('>B', sfdu_block[363:364])[0]
-
       # Reserve4: 4 byte UnsignedMSB4, bytes 364-368
-      self.Reserve4 = sfdu_block[364:368]
+      ( self.chdo_type, self.chdo_length, self.ul_stn_cal, self.dl_stn_cal, self.meas_rng,
+        self.rng_obs_dl, self.figure_merit, self.drvid, self.rtlt, self.prn0, self.transmit_pwr,
+        self.invert, self.correl_type, self.chip_rate, self.len_subcode1, self.len_subcode2,
+        self.len_subcode3, self.len_subcode4, self.len_subcode5, self.len_subcode6,
+        self.op_subcode1, self.op_subcode2, self.op_subcode3, self.op_subcode4, self.op_subcode5,
+        self.def_subcode1, self.def_subcode2, self.def_subcode3, self.def_subcode4,
+        self.def_subcode5, self.def_subcode6, self.pn_code_length, self.transmit_inphs_time,
+        self.rcv_inphs_time, self.carr_sup_rng_modul, self.exc_scalar_num, self.exc_scalar_den,
+        self.rng_cycle_time, self.rng_modulo, self.rng_type, self.fabricated_ul_flag,
+        self.rng_noise, self.rng_dl_prefit_resid, self.rng_dl_prefit_resid_vld_flag,
+        self.clock_waveform, self.rng_resid_tol_value, self.drvid_tol_value,
+        self.prn0_resid_tol_value, self.rng_sigma_tol_value, self.fom_tol_value,
+        self.rng_resid_tol_flag, self.drvid_tol_flag, self.prn0_resid_tol_flag,
+        self.rng_sigma_tol_flag, self.rng_vld_flag, self.rng_config_flag, self.stn_cal_corr_flag,
+        self.op_subcode6, self.ccsds_k, self.ccsds_l, self.Reserve4 ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -4399,50 +3155,29 @@ class ToneRangeTrackingCHDO:
       out += ' type_time_corr_flag = %i \n' % self.type_time_corr_flag
       return out
 
+   # the fixed fields of bytes 160-214, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBBBdddfddBB' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # source_type: 1 byte UnsignedByte, bytes 164-165
-      self.source_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # mjr_tone_freq: 1 byte UnsignedByte, bytes 165-166
-      self.mjr_tone_freq = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # mnr_tone_freq: 1 byte UnsignedByte, bytes 166-167
-      self.mnr_tone_freq = struct.unpack('>B', sfdu_block[166:167])[0]
-
       # rng_prefit_resid_vld_flag: 1 byte UnsignedByte, bytes 167-168
-      self.rng_prefit_resid_vld_flag = struct.unpack('>B', sfdu_block[167:168])[0]
-
       # meas_rng: 8 byte IEEE754MSBDouble, bytes 168-176
-      self.meas_rng = struct.unpack('>d', sfdu_block[168:176])[0]
-
       # rng_obs: 8 byte IEEE754MSBDouble, bytes 176-184
-      self.rng_obs = struct.unpack('>d', sfdu_block[176:184])[0]
-
       # stn_cal: 8 byte IEEE754MSBDouble, bytes 184-192
-      self.stn_cal = struct.unpack('>d', sfdu_block[184:192])[0]
-
       # carr_pwr: 4 byte IEEE754MSBSingle, bytes 192-196
-      self.carr_pwr = struct.unpack('>f', sfdu_block[192:196])[0]
-
       # rng_prefit_resid: 8 byte IEEE754MSBDouble, bytes 196-204
-      self.rng_prefit_resid = struct.unpack('>d', sfdu_block[196:204])[0]
-
       # ul_freq: 8 byte IEEE754MSBDouble, bytes 204-212
-      self.ul_freq = struct.unpack('>d', sfdu_block[204:212])[0]
-
       # time_tag_corr_flag: 1 byte UnsignedByte, bytes 212-213
-      self.time_tag_corr_flag = struct.unpack('>B', sfdu_block[212:213])[0]
-
       # type_time_corr_flag: 1 byte UnsignedByte, bytes 213-214
-      self.type_time_corr_flag = struct.unpack('>B', sfdu_block[213:214])[0]
+      ( self.chdo_type, self.chdo_length, self.source_type, self.mjr_tone_freq, self.mnr_tone_freq,
+        self.rng_prefit_resid_vld_flag, self.meas_rng, self.rng_obs, self.stn_cal, self.carr_pwr,
+        self.rng_prefit_resid, self.ul_freq, self.time_tag_corr_flag, self.type_time_corr_flag ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
 # ---------------------------------------------------------------------------
 
@@ -4498,62 +3233,48 @@ class CarrierFrequencyObservableTrackingCHDO:
       out += '            reserve8 = %s \n' % str(self.reserve8)
       return out
 
+   # the fixed fields of bytes 160-194, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBf2sfdfHf' )
+
+   # the numeric fields of each carrier frequency observation
+   OBSERVATION = struct.Struct( '>dfBB' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # ref_rcv_type: 1 byte UnsignedByte, bytes 164-165
-      self.ref_rcv_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # fabricated_ul_flag: 1 byte UnsignedByte, bytes 165-166
-      self.fabricated_ul_flag = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # carr_prefit_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 166-170
-      self.carr_prefit_resid_tol_value = struct.unpack('>f', sfdu_block[166:170])[0]
-
       # reserve2: 2 byte UnsignedMSB2, bytes 170-172
-      self.reserve2 = sfdu_block[170:172]
-
       # dop_noise: 4 byte IEEE754MSBSingle, bytes 172-176
-      self.dop_noise = struct.unpack('>f', sfdu_block[172:176])[0]
-
       # delta_ff: 8 byte IEEE754MSBDouble, bytes 176-184
-      self.delta_ff = struct.unpack('>d', sfdu_block[176:184])[0]
-
       # rcv_sig_lvl: 4 byte IEEE754MSBSingle, bytes 184-188
-      self.rcv_sig_lvl = struct.unpack('>f', sfdu_block[184:188])[0]
-
       # num_obs: 2 byte UnsignedMSB2, bytes 188-190
-      self.num_obs = struct.unpack('>H', sfdu_block[188:190])[0]
-
       # obs_cnt_time: 4 byte IEEE754MSBSingle, bytes 190-194
-      self.obs_cnt_time = struct.unpack('>f', sfdu_block[190:194])[0]
+      ( self.chdo_type, self.chdo_length, self.ref_rcv_type, self.fabricated_ul_flag,
+        self.carr_prefit_resid_tol_value, self.reserve2, self.dop_noise, self.delta_ff,
+        self.rcv_sig_lvl, self.num_obs, self.obs_cnt_time ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
       # --- LOOP THROUGH OBSERVATIONS ---
       for i in range( self.num_obs ):
 
          # rcv_carr_obs: IEEE754MSBDouble
-         self.rcv_carr_obs.append( struct.unpack('>d', sfdu_block[194+i*18:194+i*18+8])[0] )
-
          # carr_prefit_resid: IEEE754MSBSingle
-         self.carr_prefit_resid.append( struct.unpack('>f', sfdu_block[202+i*18:202+i*18+4])[0] )
-
          # carr_prefit_resid_vld_flag: UnsignedByte
-         self.carr_prefit_resid_vld_flag.append( struct.unpack('>B', sfdu_block[206+i*18:206+i*18+1])[0] )
-
          # carr_prefit_resid_tol_flag: UnsignedByte
-         self.carr_prefit_resid_tol_flag.append( struct.unpack('>B', sfdu_block[207+i*18:207+i*18+1])[0] )
+         obs = self.OBSERVATION.unpack_from( sfdu_block, 194+i*18 )
+         self.rcv_carr_obs.append( obs[0] )
+         self.carr_prefit_resid.append( obs[1] )
+         self.carr_prefit_resid_vld_flag.append( obs[2] )
+         self.carr_prefit_resid_tol_flag.append( obs[3] )
 
          # reserve4: UnsignedMSB4
-         self.reserve4.append( sfdu_block[208+i*18:208+i*18+4] )
+         self.reserve4.append( bytes(sfdu_block[208+i*18:208+i*18+4]) )
 
          # reserve8: UnsignedMSB8
-         self.reserve8.append( sfdu_block[212+i*18:212+i*18+8] )
+         self.reserve8.append( bytes(sfdu_block[212+i*18:212+i*18+8]) )
 
 # ---------------------------------------------------------------------------
 
@@ -4619,76 +3340,55 @@ class TotalCountPhaseObservableTrackingCHDO:
       out += '            reserve8 = %s \n' % str(self.reserve8)
       return out
 
+   # the fixed fields of bytes 160-206, decoded in a single call
+   LAYOUT = struct.Struct( '>HHBBf2sfdfHfHHd' )
+
+   # the numeric fields of each total count phase observation
+   OBSERVATION = struct.Struct( '>IIIfBB' )
+
    def decode(self, sfdu_block):
       """ decode a binary string into the attributes """
 
       # chdo_type: 2 byte UnsignedMSB2, bytes 160-162
-      self.chdo_type = struct.unpack('>H', sfdu_block[160:162])[0]
-
       # chdo_length: 2 byte UnsignedMSB2, bytes 162-164
-      self.chdo_length = struct.unpack('>H', sfdu_block[162:164])[0]
-
       # ref_rcv_type: 1 byte UnsignedByte, bytes 164-165
-      self.ref_rcv_type = struct.unpack('>B', sfdu_block[164:165])[0]
-
       # fabricated_ul_flag: 1 byte UnsignedByte, bytes 165-166
-      self.fabricated_ul_flag = struct.unpack('>B', sfdu_block[165:166])[0]
-
       # total_cnt_phs_prefit_resid_tol_value: 4 byte IEEE754MSBSingle, bytes 166-170
-      self.total_cnt_phs_prefit_resid_tol_value = struct.unpack('>f', sfdu_block[166:170])[0]
-
       # reserve2: 2 byte UnsignedMSB2, bytes 170-172
-      self.reserve2 = sfdu_block[170:172]
-
       # dop_noise: 4 byte IEEE754MSBSingle, bytes 172-176
-      self.dop_noise = struct.unpack('>f', sfdu_block[172:176])[0]
-
       # delta_ff: 8 byte IEEE754MSBDouble, bytes 176-184
-      self.delta_ff = struct.unpack('>d', sfdu_block[176:184])[0]
-
       # rcv_sig_lvl: 4 byte IEEE754MSBSingle, bytes 184-188
-      self.rcv_sig_lvl = struct.unpack('>f', sfdu_block[184:188])[0]
-
       # num_obs: 2 byte UnsignedMSB2, bytes 188-190
-      self.num_obs = struct.unpack('>H', sfdu_block[188:190])[0]
-
       # obs_cnt_time: 4 byte IEEE754MSBSingle, bytes 190-194
-      self.obs_cnt_time = struct.unpack('>f', sfdu_block[190:194])[0]
-
       # total_cnt_phs_st_year: 2 byte UnsignedMSB2, bytes 194-196
-      self.total_cnt_phs_st_year = struct.unpack('>H', sfdu_block[194:196])[0]
-
       # total_cnt_phs_st_doy: 2 byte UnsignedMSB2, bytes 196-198
-      self.total_cnt_phs_st_doy = struct.unpack('>H', sfdu_block[196:198])[0]
-
       # total_cnt_phs_st_sec: 8 byte IEEE754MSBDouble, bytes 198-206
-      self.total_cnt_phs_st_sec = struct.unpack('>d', sfdu_block[198:206])[0]
+      ( self.chdo_type, self.chdo_length, self.ref_rcv_type, self.fabricated_ul_flag,
+        self.total_cnt_phs_prefit_resid_tol_value, self.reserve2, self.dop_noise, self.delta_ff,
+        self.rcv_sig_lvl, self.num_obs, self.obs_cnt_time, self.total_cnt_phs_st_year,
+        self.total_cnt_phs_st_doy, self.total_cnt_phs_st_sec ) = self.LAYOUT.unpack_from( sfdu_block, 160 )
 
       # --- LOOP THROUGH OBSERVATIONS ---
       for i in range( self.num_obs ):
 
          # total_cnt_phs_obs_hi: UnsignedMSB4
-         self.total_cnt_phs_obs_hi.append( struct.unpack('>I', sfdu_block[206+i*22:206+i*22+4])[0] )
-
          # total_cnt_phs_obs_lo: UnsignedMSB4
-         self.total_cnt_phs_obs_lo.append( struct.unpack('>I', sfdu_block[210+i*22:210+i*22+4])[0] )
-
          # total_cnt_phs_obs_frac: UnsignedMSB4
-         self.total_cnt_phs_obs_frac.append( struct.unpack('>I', sfdu_block[214+i*22:214+i*22+4])[0] )
-
          # total_cnt_phs_prefit_resid: IEEE754MSBSingle
-         self.total_cnt_phs_prefit_resid.append( struct.unpack('>f', sfdu_block[218+i*22:218+i*22+4])[0] )
-
          # total_cnt_phs_prefit_resid_vld_flag: UnsignedByte
-         self.total_cnt_phs_prefit_resid_vld_flag.append( struct.unpack('>B', sfdu_block[222+i*22:222+i*22+1])[0] )
-
          # total_cnt_phs_prefit_resid_tol_flag: UnsignedByte
-         self.total_cnt_phs_prefit_resid_tol_flag.append( struct.unpack('>B', sfdu_block[223+i*22:223+i*22+1])[0] )
+         obs = self.OBSERVATION.unpack_from( sfdu_block, 206+i*22 )
+         self.total_cnt_phs_obs_hi.append( obs[0] )
+         self.total_cnt_phs_obs_lo.append( obs[1] )
+         self.total_cnt_phs_obs_frac.append( obs[2] )
+         self.total_cnt_phs_prefit_resid.append( obs[3] )
+         self.total_cnt_phs_prefit_resid_vld_flag.append( obs[4] )
+         self.total_cnt_phs_prefit_resid_tol_flag.append( obs[5] )
 
          # reserve4: UnsignedMSB4
-         self.reserve4.append( sfdu_block[224+i*22:224+i*22+4] )
+         self.reserve4.append( bytes(sfdu_block[224+i*22:224+i*22+4]) )
 
          # reserve8: UnsignedMSB8
-         self.reserve8.append( sfdu_block[228+i*22:228+i*22+8] )
+         self.reserve8.append( bytes(sfdu_block[228+i*22:228+i*22+8]) )
 
 # ---------------------------------------------------------------------------
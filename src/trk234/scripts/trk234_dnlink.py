@@ -68,6 +68,7 @@ Options::
    -m <mode>, the mode of the signal (1, 2, 3)
    -t, use an ISOT timestamp (YYYY-DDDTHH:MM:SS.ffffff) instead of YYY DDD SPM format
    -c, write to Excel-compatible CSV instead
+   -j <jobs>, decode the file with this many worker processes
    -h, access program help via the command line
 
 """
@@ -75,108 +76,171 @@ Options::
 import os
 import sys
 from argparse import ArgumentParser
+from multiprocessing import Pool
 import trk234
 
+# Output format of the CSV time tags
+TIME_CSV = '"%Y-%m-%d %H:%M:%S.%f"'
+
+# Number of output lines to collect before writing them to stdout
+BATCH = 1000
+
+
+def emit_iso(sfdu, sec, trk):
+    """Output line with an ISOT timestamp"""
+    ts = trk234.fast_iso(sec.year, sec.doy, sec.sec)
+    return (
+        f"{ts:>24} {trk.dl_freq:17.5f} {trk.dop_resid:14.4f} "
+        f"{trk.system_noise_temp:5.1f} {trk.pcn0:5.1f} {trk.carr_loop_bw:5.1f}"
+    )
+
+
+def emit_csv(sfdu, sec, trk):
+    """Output line in Excel-compatible CSV"""
+    ts = sfdu.timestamp().strftime(TIME_CSV)
+    return (
+        f"{ts},{trk.dl_freq:.5f},{trk.dop_resid:.4f},"
+        f"{trk.system_noise_temp:.1f},{trk.pcn0:.1f},{trk.carr_loop_bw:.1f}"
+    )
+
+
+def emit_plain(sfdu, sec, trk):
+    """Output line with a YYYY DOY SPM timestamp"""
+    return (
+        f"{sec.year:4d} {sec.doy:3d} {sec.sec:12.6f} "
+        f"{trk.dl_freq:17.5f} {trk.dop_resid:14.4f} "
+        f"{trk.system_noise_temp:5.1f} {trk.pcn0:5.1f} {trk.carr_loop_bw:5.1f}"
+    )
+
+
+class Options:
+    """Command line options, copied once from the argparse namespace. The
+    band is stored as its integer band code, or -1 to accept any band"""
+
+    __slots__ = (
+        "Input",
+        "in_lock",
+        "dl_dss",
+        "ul_dss",
+        "band",
+        "mode",
+        "chan",
+        "timestamp",
+        "csv",
+        "jobs",
+    )
+
+    def __init__(self, args):
+        self.Input = args.Input
+        self.in_lock = args.in_lock
+        self.dl_dss = args.dl_dss
+        self.ul_dss = args.ul_dss
+        self.band = trk234.band_codes[args.band] if args.band != "" else -1
+        self.mode = args.mode
+        self.chan = args.chan
+        self.timestamp = args.timestamp
+        self.csv = args.csv
+        self.jobs = args.jobs
+
 
 def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file. only decode the label, aggregation CHDO and primary CHDO to start
-    # not decoding the secondary CHDO and tracking CHDO saves a lot of time
-    f = trk234.Reader(args.Input)
-    f.decode(sec_chdo=False, trk_chdo=False)
-
-    # Loop through the SFDU records
-    for sfdu in f.sfdu_list:
-
-        # Only look at data type 01
-        if sfdu.pri_chdo.format_code == 1:
-
-            # Now decode the secondary chdo and tracking chdo - (label, agg_chdo, pri_chdo already decoded)
-            sfdu.decode(
-                sfdu.binarydata, label=False, agg_chdo=False, pri_chdo=False
-            )
-
-            # Skip invalid SFDUs
-            if sfdu.is_decoded == False:
-                continue
-
-            # Extract what we need
-            year = sfdu.sec_chdo.year
-            doy = sfdu.sec_chdo.doy
-            sec = sfdu.sec_chdo.sec
-            pcn0 = sfdu.trk_chdo.pcn0
-            snt = sfdu.trk_chdo.system_noise_temp
-            skyfreq = sfdu.trk_chdo.dl_freq
-            resid = sfdu.trk_chdo.dop_resid
-            lockstat = sfdu.sec_chdo.carr_lock_stat
-            dl_dss = sfdu.sec_chdo.dl_dss_id
-            ul_dss = sfdu.sec_chdo.ul_prdx_stn
-            band = trk234.bands[sfdu.sec_chdo.dl_band]
-            loop_bw = sfdu.trk_chdo.carr_loop_bw
-            channel = sfdu.sec_chdo.dl_chan_num
-
-            # Do we meet the lock status?
-            if args.in_lock and lockstat == 4 or not args.in_lock:
-                # Do we meet the DSS_ID?
-                if args.dl_dss == dl_dss or args.dl_dss == 0:
-                    # Do we meet uplink DSS ID
-                    if args.ul_dss == ul_dss or args.ul_dss == 0:
-                        # Do we meet the band requirement?
-                        if args.band == band or args.band == "":
-                            # Do we met the DTT channel number?
-                            if args.chan == channel or args.chan == 0:
-                                # Do we meet the tracking mode requirement?
-                                if (
-                                    args.mode == sfdu.tracking_mode()
-                                    or args.mode == ""
-                                ):
-                                    # Print the information in the right time format
-                                    if args.timestamp:
-                                        ts = sfdu.timestamp().strftime(
-                                            "%Y-%jT%H:%M:%S.%f"
-                                        )
-                                        print(
-                                            "%24s %17.5f %14.4f %5.1f %5.1f %5.1f"
-                                            % (
-                                                ts,
-                                                skyfreq,
-                                                resid,
-                                                snt,
-                                                pcn0,
-                                                loop_bw,
-                                            )
-                                        )
-                                    elif args.csv:
-                                        ts = sfdu.timestamp().strftime(
-                                            '"%Y-%m-%d %H:%M:%S.%f"'
-                                        )
-                                        print(
-                                            "%s,%.5f,%.4f,%.1f,%.1f,%.1f"
-                                            % (
-                                                ts,
-                                                skyfreq,
-                                                resid,
-                                                snt,
-                                                pcn0,
-                                                loop_bw,
-                                            )
-                                        )
-                                    else:
-                                        print(
-                                            "%4i %3i %12.6f %17.5f %14.4f %5.1f %5.1f %5.1f"
-                                            % (
-                                                year,
-                                                doy,
-                                                sec,
-                                                skyfreq,
-                                                resid,
-                                                snt,
-                                                pcn0,
-                                                loop_bw,
-                                            )
-                                        )
+    write = sys.stdout.write
+
+    # Split the file into blocks of SFDUs and decode them in worker
+    # processes. the blocks are contiguous, so the output stays in order
+    if args.jobs > 1:
+        blocks = trk234.Reader(args.Input).blocks(4 * args.jobs)
+        with Pool(args.jobs) as pool:
+            for text in pool.imap(
+                dnlink_block, [(args,) + block for block in blocks]
+            ):
+                write(text)
+        return
+
+    # Write the lines in batches
+    buf = []
+    for line in dnlink_lines(args):
+        buf.append(line)
+        if len(buf) >= BATCH:
+            buf.append("")
+            write("\n".join(buf))
+            buf.clear()
+
+    # Write out whatever is left over
+    if buf:
+        buf.append("")
+        write("\n".join(buf))
+
+
+def dnlink_block(job):
+    """Worker for the parallel mode, returns the output of a block of SFDUs"""
+    return "".join([line + "\n" for line in dnlink_lines(*job)])
+
+
+def dnlink_lines(args, start=0, stop=None, first=0):
+    """Generator of the output lines for the SFDUs between the start and stop
+    byte offsets of the file, where first is the number of the first SFDU"""
+
+    # Read the TRK 2-34 file. the SFDUs are decoded one at a time, and only
+    # data type 01 gets the secondary CHDO and tracking CHDO decoded, which
+    # saves a lot of time
+    f = trk234.Reader(args.Input, start, stop, first)
+
+    # The lock status, DSS IDs, band and DTT channel number are single bytes,
+    # so they are packed into one integer key per SFDU and all tested with a
+    # single masked compare. fields that are not filtered on are masked out
+    mask = 0
+    want = 0
+    for value, wildcard, shift in (
+        (args.dl_dss, 0, 0),
+        (args.ul_dss, 0, 8),
+        (args.band, -1, 16),
+        (args.chan, 0, 24),
+        (4 if args.in_lock else -1, -1, 32),
+    ):
+        if value != wildcard:
+            mask |= 0xFF << shift
+            want |= value << shift
+    want_mode = args.mode
+
+    # Pick the output line format once
+    if args.timestamp:
+        emit = emit_iso
+    elif args.csv:
+        emit = emit_csv
+    else:
+        emit = emit_plain
+
+    # Loop through the SFDU records of data type 01. the filters are all on
+    # the secondary CHDO, so the tracking CHDO is only decoded for the
+    # records that pass them
+    for sfdu in f.iter_sfdus(agg_chdo=False, trk_chdo=False, format_codes={1}):
+
+        # Skip invalid SFDUs
+        if sfdu.is_decoded == False:
+            continue
+
+        # Extract what we need
+        sec_chdo = sfdu.sec_chdo
+        key = (
+            sec_chdo.dl_dss_id
+            | sec_chdo.ul_prdx_stn << 8
+            | sec_chdo.dl_band << 16
+            | sec_chdo.dl_chan_num << 24
+            | sec_chdo.carr_lock_stat << 32
+        )
+
+        # Do we meet the lock status, DSS IDs, band, DTT channel number
+        # and tracking mode requirements? the tracking mode is a method
+        # call, so it is tested last
+        if key & mask == want and (
+            want_mode == "" or want_mode == sfdu.tracking_mode()
+        ):
+            sfdu.decode(sfdu.binarydata, False, False, False, False, True)
+            yield emit(sfdu, sec_chdo, sfdu.trk_chdo)
 
 
 def execute() -> None:
@@ -254,6 +318,14 @@ def execute() -> None:
         action="store_true",
         help="write a CSV file instead which can be read in excel",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        default=1,
+        type=int,
+        help="number of worker processes to decode the file with",
+    )
 
     # Parse the command line automatically
     args = parser.parse_args()
@@ -284,6 +356,14 @@ def execute() -> None:
             "invalid mode, please use 1W, 2W or 3W/XX, where XX is the transmitting station"
         )
 
-    main(args)
+    # Validate the number of jobs
+    if args.jobs < 1:
+        parser.error("the number of jobs must be at least 1")
+
+    main(Options(args))
 
     return None
+
+
+if __name__ == "__main__":
+    execute()
@@ -69,34 +69,44 @@ import sys
 from argparse import ArgumentParser
 import trk234
 
+# Number of SFDUs to collect before writing them to stdout
+BATCH = 100
+
 
 def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file
+    # Read the TRK 2-34 file. the SFDUs are decoded one at a time as they
+    # are dumped, and SFDUs of other types only get their headers decoded
     f = trk234.Reader(args.Input)
-    f.decode(sec_chdo=False, trk_chdo=False)
+    format_codes = None if args.format_code is None else {args.format_code}
 
-    # Loop through the SFDU records
+    # Loop through the SFDU records, writing them in batches
+    write = sys.stdout.write
+    buf = []
     i = 1
-    for s in f.sfdu_list:
+    for s in f.iter_sfdus(format_codes=format_codes):
 
         # Dump only the requested records, if specified
-        if args.format_code is not None:
-            if s.pri_chdo.format_code == args.format_code:
-                s.decode(s.binarydata)
-                print(s)
-                i = i + 1
-        else:
-            s.decode(s.binarydata)
-            print(s)
-            i = i + 1
+        if args.format_code is not None and s.pri_chdo.format_code != args.format_code:
+            continue
+        buf.append(str(s))
+        i = i + 1
+        if len(buf) >= BATCH:
+            buf.append("")
+            write("\n".join(buf))
+            buf.clear()
 
         # if we reach the maximum number of records to dump, exit loop
         if args.max is not None and i > args.max:
             break
 
+    # Write out whatever is left over
+    if buf:
+        buf.append("")
+        write("\n".join(buf))
+
 
 # If called as a script, go to the main() function immediately
 def execute():
@@ -63,6 +63,7 @@ Options::
    -p, show a progress display for reading the file
    -h, access program help via the command line
    -t, print an ISO-T timestamp in YYYY-DDDTHH:MM:SS.fff format instead
+   -j <jobs>, decode the file with this many worker processes
    --label OR --agg OR --pri OR --sec OR --trk, the location where the identifer is in the file
 
 """
@@ -70,65 +71,145 @@ Options::
 import os
 import sys
 from argparse import ArgumentParser
+from multiprocessing import Pool
+from operator import attrgetter
 import trk234
 
 
+class Options:
+    """Command line options, copied once from the argparse namespace"""
+
+    __slots__ = (
+        "Input",
+        "format_code",
+        "progress",
+        "timestamp",
+        "identifier",
+        "label",
+        "agg",
+        "pri",
+        "sec",
+        "trk",
+        "jobs",
+    )
+
+    def __init__(self, args):
+        self.Input = args.Input
+        self.format_code = args.format_code
+        self.progress = args.progress
+        self.timestamp = args.timestamp
+        self.identifier = args.identifier
+        self.label = args.label
+        self.agg = args.agg
+        self.pri = args.pri
+        self.sec = args.sec
+        self.trk = args.trk
+        self.jobs = args.jobs
+
+
 def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file
-    f = trk234.Reader(args.Input)
-    f.decode(progress=args.progress)
+    # Split the file into blocks of SFDUs and decode them in worker
+    # processes. the blocks are contiguous, so the output stays in order
+    if args.jobs > 1:
+        blocks = trk234.Reader(args.Input).blocks(4 * args.jobs)
+        with Pool(args.jobs) as pool:
+            for text in pool.imap(
+                extract_block, [(args,) + block for block in blocks]
+            ):
+                sys.stdout.write(text)
+        return
+
+    # The progress display draws on the same terminal, so with -p every
+    # record is decoded before the lines are printed
+    lines = extract_lines(args)
+    if args.progress:
+        lines = list(lines)
+    for line in lines:
+        print(line)
+
+
+def extract_block(job):
+    """Worker for the parallel mode, returns the output of a block of SFDUs"""
+    return "".join([line + "\n" for line in extract_lines(*job)])
+
+
+def extract_lines(args, start=0, stop=None, first=0):
+    """Generator of the output lines for the SFDUs between the start and stop
+    byte offsets of the file, where first is the number of the first SFDU"""
+
+    # Read the TRK 2-34 file. if a format code is requested, the other
+    # records are rejected before their secondary and tracking CHDOs are decoded.
+    # the progress display only makes sense when reading the whole file
+    f = trk234.Reader(args.Input, start, stop, first)
+    progress = args.progress and args.jobs == 1
+    format_codes = None if args.format_code is None else {args.format_code}
+
+    # Only decode the parts that are needed. the secondary CHDO has the time
+    # tags and needs the label for its type, and the tracking CHDO needs the
+    # format code from the primary CHDO for its type. the SFDUs are decoded
+    # one at a time as they are printed
+    sfdus = f.iter_sfdus(
+        progress=progress,
+        label=True,
+        agg_chdo=args.agg,
+        pri_chdo=args.pri or args.trk or format_codes is not None,
+        sec_chdo=True,
+        trk_chdo=args.trk,
+        format_codes=format_codes,
+    )
+
+    # Exactly one location flag is set, so resolve the identifier lookup once
+    if args.label:
+        section = "label"
+    elif args.agg:
+        section = "agg_chdo"
+    elif args.pri:
+        section = "pri_chdo"
+    elif args.sec:
+        section = "sec_chdo"
+    else:
+        section = "trk_chdo"
+    getter = attrgetter(section + "." + args.identifier)
 
     # Loop through the SFDU records
-    for s in f.sfdu_list:
+    for s in sfdus:
 
-        # Skip invalid SFDUs
+        # Skip invalid SFDUs, and those not matching the format code
         if s.is_decoded == False:
             continue
 
-        # Dump only the requested records, if specified
-        if args.format_code is not None:
-            if s.pri_chdo.format_code == args.format_code:
-                print_line(s, args)
-        else:
-            print_line(s, args)
+        line = format_line(s, getter, args)
+        if line is not None:
+            yield line
+
 
+def format_line(sfdu, getter, args):
+    """function that formats a single line of TRK 2-34 data from the extract,
+    or returns None if the SFDU does not have the identifier"""
 
-def print_line(sfdu, args):
-    """function that prints a single line of TRK 2-34 data from the extract"""
+    # Extract the requested identifier, skipping SFDUs that do not have it
+    try:
+        param = getter(sfdu)
+    except AttributeError:
+        return None
 
     # Extract what we need
-    year = sfdu.sec_chdo.year
-    doy = sfdu.sec_chdo.doy
-    sec = sfdu.sec_chdo.sec
+    sec_chdo = sfdu.sec_chdo
+    year = sec_chdo.year
+    doy = sec_chdo.doy
+    sec = sec_chdo.sec
 
-    # Extract the requested identifier from CHDO
-    param = None
-    if args.label:
-        if hasattr(sfdu.label, args.identifier):
-            param = getattr(sfdu.label, args.identifier)
-    if args.agg:
-        if hasattr(sfdu.agg_chdo, args.identifier):
-            param = getattr(sfdu.agg_chdo, args.identifier)
-    if args.pri:
-        if hasattr(sfdu.pri_chdo, args.identifier):
-            param = getattr(sfdu.pri_chdo, args.identifier)
-    if args.sec:
-        if hasattr(sfdu.sec_chdo, args.identifier):
-            param = getattr(sfdu.sec_chdo, args.identifier)
-    if args.trk:
-        if hasattr(sfdu.trk_chdo, args.identifier):
-            param = getattr(sfdu.trk_chdo, args.identifier)
-
-    # Print, but only if it exists
+    # Format, but only if it exists
     if param is not None:
         if args.timestamp:
-            ts = sfdu.timestamp().strftime("%Y-%jT%H:%M:%S.%f")
-            print("%24s %17s " % (ts, str(param)))
+            ts = trk234.fast_iso(year, doy, sec)
+            return f"{ts:>24} {param!s:>17} "
         else:
-            print("%4i %3i %12.6f %17s" % (year, doy, sec, str(param)))
+            return f"{year:4d} {doy:3d} {sec:12.6f} {param!s:>17}"
+    return None
 
 
 # If called as a script, go to the main() function immediately
@@ -208,6 +289,14 @@ def execute():
         action="store_true",
         help="flag the identifier as from the tracking CHDO",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        default=1,
+        type=int,
+        help="number of worker processes to decode the file with",
+    )
 
     # Parse the command line automatically
     args = parser.parse_args()
@@ -226,8 +315,8 @@ def execute():
         parser.error('an identifier is required to extract, such as "dop_cnt"')
 
     # Only one of the flags is required to determine where to look in the file
-    ll = [args.label, args.agg, args.pri, args.sec, args.trk]
-    if sum(ll) == 0:
+    n_flags = args.label + args.agg + args.pri + args.sec + args.trk
+    if n_flags == 0:
         parser.error(
             "one flag is required to determine where to look in the file for the identifer\n"
             + "   --label    flag it as from the SFDU Label\n"
@@ -236,7 +325,15 @@ def execute():
             + "   --sec      flag it as from the secondary CHDO\n"
             + "   --trk      flag it as from the tracking CHDO"
         )
-    if sum(ll) > 1:
+    elif n_flags > 1:
         parser.error("only one flag is required")
 
-    main(args)
+    # Validate the number of jobs
+    if args.jobs < 1:
+        parser.error("the number of jobs must be at least 1")
+
+    main(Options(args))
+
+
+if __name__ == "__main__":
+    execute()
@@ -66,8 +66,13 @@ Options::
 import os
 import sys
 from argparse import ArgumentParser
+from itertools import compress, islice
+from operator import ne
 import trk234
 
+# Output format of the mode change times in the tracking mode report
+TIME_FORMAT = "%Y-%jT%H:%M:%S"
+
 
 def main(args):
     """Main program function. This is the first executed code,
@@ -96,17 +101,22 @@ def main(args):
     # Do the tracking mode report
     if args.trk_mode_report:
 
+        # Group the SFDUs by downlink station and band in a single pass,
+        # instead of scanning every SFDU for each station and band
+        stations = set(info.dnlinkDssId)
+        groups = {}
+        for s in f.sfdu_list:
+            dss = s.dss_id()[1]
+            if dss in stations:
+                groups.setdefault((dss, s.radio_band()[1]), []).append(s)
+
         # Loop through each station
         for dss in info.dnlinkDssId:
 
             for band in info.dnlinkBand:
 
                 # Extract SFDUs for only this station and determine the tracking mode
-                sfdus = [
-                    s
-                    for s in f.sfdu_list
-                    if s.dss_id()[1] == dss and s.radio_band()[1] == band
-                ]
+                sfdus = groups.get((dss, band), [])
 
                 # If none exist, skip it
                 if len(sfdus) == 0:
@@ -115,8 +125,12 @@ def main(args):
                 else:
                     print("%24s:" % ("DSS-%i %s-band Downlink" % (dss, band)))
 
-                # Extract times and SFDUs
-                times = [s.timestamp() for s in sfdus]
+                # Extract times and SFDUs. the (year, doy, sec) epochs sort the
+                # same way as the timestamps, so only the mode changes are
+                # converted to a datetime
+                times = [
+                    (s.sec_chdo.year, s.sec_chdo.doy, s.sec_chdo.sec) for s in sfdus
+                ]
                 # trk_mode = [ s.tracking_mode() for s in sfdus ]
                 trk_mode = [
                     "DCC %02d %s" % (s.sec_chdo.dl_chan_num, s.tracking_mode())
@@ -131,49 +145,57 @@ def main(args):
                 loop_bw = {}
                 for s in sfdus:
                     if s.pri_chdo.format_code == 1:
-                        s.decode(s.binarydata)
+                        # the headers and secondary CHDO are already decoded
+                        s.decode(s.binarydata, False, False, False, False, True)
                         # loop_bw[s.tracking_mode()] = s.trk_chdo.carr_loop_bw
                         loop_bw[
                             "DCC %02d %s"
                             % (s.sec_chdo.dl_chan_num, s.tracking_mode())
                         ] = s.trk_chdo.carr_loop_bw
 
-                # set the current mode empty so we print the first result
-                current_mode = ""
+                # Find the indexes where the mode changes. each mode is compared
+                # to the next one in map/compress, so only the changes are
+                # looped over here
+                changes = compress(
+                    range(1, len(trk_mode_sorted)),
+                    map(ne, trk_mode_sorted, islice(trk_mode_sorted, 1, None)),
+                )
 
                 # start loop
-                for i, (t, m) in enumerate(zip(t_sorted, trk_mode_sorted)):
-
-                    # if the mode has changed, print the start time and set the current mode
-                    if m != current_mode:
-
-                        # if this isnt the first iteration, the stop time is the previous time. print it.
-                        if i > 0:
-                            if trk_mode_sorted[i - 1] != "None":
-                                print(
-                                    " - %s (Final Loop BW = %.1f Hz)\n"
-                                    % (
-                                        t_sorted[i - 1].strftime(
-                                            "%Y-%jT%H:%M:%S"
-                                        ),
-                                        loop_bw[m],
-                                    ),
-                                    end=" ",
-                                )
-
-                        # Print the new mode and start time
-                        if m != "None":
+                for i in (0, *changes):
+                    t = t_sorted[i]
+                    m = trk_mode_sorted[i]
+
+                    # if this isnt the first change, the stop time is the previous
+                    # time. print it.
+                    if i > 0:
+                        if trk_mode_sorted[i - 1] != "None":
                             print(
-                                "%23s @ %s" % (m, t.strftime("%Y-%jT%H:%M:%S")),
+                                " - %s (Final Loop BW = %.1f Hz)\n"
+                                % (
+                                    trk234.doy_datetime(*t_sorted[i - 1]).strftime(
+                                        TIME_FORMAT
+                                    ),
+                                    loop_bw[m],
+                                ),
                                 end=" ",
                             )
-                        current_mode = m
+
+                    # Print the new mode and start time
+                    if m != "None":
+                        print(
+                            "%23s @ %s"
+                            % (m, trk234.doy_datetime(*t).strftime(TIME_FORMAT)),
+                            end=" ",
+                        )
 
                 # exit loop, print the stop time.
+                t = t_sorted[-1]
+                m = trk_mode_sorted[-1]
                 if m != "None":
                     print(
                         " - %s (Final Loop BW = %.1f Hz)\n"
-                        % (t.strftime("%Y-%jT%H:%M:%S"), loop_bw[m])
+                        % (trk234.doy_datetime(*t).strftime(TIME_FORMAT), loop_bw[m])
                     )
                 else:
                     print(
@@ -183,14 +205,11 @@ def main(args):
 
 
 def two_list_sort(list1, list2):
-    """sort two lists by the first list:
-    http://stackoverflow.com/questions/13668393/python-sorting-two-lists
+    """sort two lists by the first list. the sort is stable and only
+    compares the first list, through a bound method instead of a lambda
     """
-    sort = [
-        list(x)
-        for x in zip(*sorted(zip(list1, list2), key=lambda pair: pair[0]))
-    ]
-    return (sort[0], sort[1])
+    order = sorted(range(len(list1)), key=list1.__getitem__)
+    return ([list1[i] for i in order], [list2[i] for i in order])
 
 
 def execute():
@@ -73,16 +73,56 @@ import sys
 from argparse import ArgumentParser
 import trk234
 
+# Valid data description IDs and format codes
+VALID_DD = frozenset(trk234.data_descriptions)
+VALID_FC = frozenset(trk234.format_codes)
+
+
+class Options:
+    """Command line options, copied once from the argparse namespace. The
+    bands are also stored as their integer band codes, or -1 if unused"""
+
+    __slots__ = (
+        "Input",
+        "Output",
+        "verbose",
+        "prompt",
+        "dl_band",
+        "ul_band",
+        "dl_dss_id",
+        "ul_dss_id",
+        "format_code",
+        "dl_band_code",
+        "ul_band_code",
+    )
+
+    def __init__(self, args):
+        self.Input = args.Input
+        self.Output = args.Output
+        self.verbose = args.verbose
+        self.prompt = args.prompt
+        self.dl_band = args.dl_band
+        self.ul_band = args.ul_band
+        self.dl_dss_id = args.dl_dss_id
+        self.ul_dss_id = args.ul_dss_id
+        self.format_code = args.format_code
+        self.dl_band_code = trk234.band_codes.get(args.dl_band, -1)
+        self.ul_band_code = trk234.band_codes.get(args.ul_band, -1)
+
 
 def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file
-    print_log("Reading %s" % args.Input, args.verbose)
+    # Log messages go to the screen only in verbose mode. otherwise they are
+    # dropped, and the message arguments are never formatted into a string
+    log = print if args.verbose else no_log
+
+    # Read the TRK 2-34 file. the filter fields are read directly from the
+    # binary data as parallel columns, so no SFDU needs to be decoded
+    log("Reading", args.Input)
     f = trk234.Reader(args.Input)
-    f.decode(trk_chdo=False)
-    sfdus = f.sfdu_list
+    cols = f.columns("ul_dss_id", "ul_band", "dl_dss_id", "dl_band")
 
     # Open the output file for writing
     if args.prompt:
@@ -90,102 +130,119 @@ def main(args):
         confirm = True if raw_input("%s (y/N) " % msg).lower() == "y" else False
         if not confirm:
             sys.exit()
-    fout = open(args.Output, "wb")
-    print_log(
-        "Beginning writing of binary data to %s" % args.Output, args.verbose
+    # Writing over the input would truncate it while it is still memory
+    # mapped, so an in-place run writes a temporary file and moves it over
+    # the input once it is complete
+    out_name = trk234.output_name(args.Input, args.Output)
+    fout = open(out_name, "wb", buffering=1 << 20)
+    log("Beginning writing of binary data to", args.Output)
+
+    # Build the mask of SFDUs to keep. filters that are not used are -1
+    keep = purify_mask(
+        cols,
+        -1 if args.format_code is None else args.format_code,
+        -1 if args.ul_dss_id is None else args.ul_dss_id,
+        args.ul_band_code,
+        -1 if args.dl_dss_id is None else args.dl_dss_id,
+        args.dl_band_code,
     )
 
-    # Loop through each SFDU and determine if it matches the criteria
-    for s in f.sfdu_list:
+    # Report why each SFDU was discarded
+    if args.verbose:
+        for i, k in enumerate(keep):
+            if not k:
+                log(discard_reason(i, cols, args))
 
-        # If its not in the data descriptions, skip it
-        if s.label.data_description_id not in trk234.data_descriptions.keys():
-            print_log(
-                'Discarding SFDU %d - invalid CHDO data description of "%s"'
-                % (s.number, s.label.data_description_id),
-                args.verbose,
-            )
-            continue
-
-        # If its not in the format codes, skip it
-        if s.pri_chdo.format_code not in trk234.format_codes.keys():
-            print_log(
-                "Discarding SFDU %d - invalid CHDO format code of %d"
-                % (s.number, s.pri_chdo.format_code),
-                args.verbose,
-            )
-            continue
-
-        # Test for format code
-        if args.format_code is not None:
-            if args.format_code != s.pri_chdo.format_code:
-                print_log(
-                    "Discarding SFDU %d - does not match user specified format code (%d, this one = %d)"
-                    % (s.number, args.format_code, s.pri_chdo.format_code),
-                    args.verbose,
-                )
-                continue
-
-        # Test for uplink dss ID, only if valid
-        if args.ul_dss_id is not None and hasattr(s.sec_chdo, "ul_dss_id"):
-            if args.ul_dss_id != s.sec_chdo.ul_dss_id:
-                print_log(
-                    "Discarding SFDU %d - does not match user specified uplink DSS ID (%d, this one = %d)"
-                    % (s.number, args.ul_dss_id, s.sec_chdo.ul_dss_id),
-                    args.verbose,
-                )
-                continue
-
-        # Test for uplink band, only if valid
-        if args.ul_band is not None and hasattr(s.sec_chdo, "ul_band"):
-            if args.ul_band != trk234.bands[s.sec_chdo.ul_band]:
-                print_log(
-                    "Discarding SFDU %d - does not match user specified uplink band (%s, this one = %s)"
-                    % (
-                        s.number,
-                        args.ul_band,
-                        trk234.bands[s.sec_chdo.ul_band],
-                    ),
-                    args.verbose,
-                )
-                continue
-
-        # Test for downlink dss ID, only if valid
-        if args.dl_dss_id is not None and hasattr(s.sec_chdo, "dl_dss_id"):
-            if args.dl_dss_id != s.sec_chdo.dl_dss_id:
-                print_log(
-                    "Discarding SFDU %d - does not match user specified downlink DSS ID (%d, this one = %d)"
-                    % (s.number, args.dl_dss_id, s.sec_chdo.dl_dss_id),
-                    args.verbose,
-                )
-                continue
-
-        # Test for downlink band, only if valid
-        if args.dl_band is not None and hasattr(s.sec_chdo, "dl_band"):
-            if args.dl_band != trk234.bands[s.sec_chdo.dl_band]:
-                print_log(
-                    "Discarding SFDU %d - does not match user specified downlink band(%s, this one = %s)"
-                    % (
-                        s.number,
-                        args.dl_band,
-                        trk234.bands[s.sec_chdo.dl_band],
-                    ),
-                    args.verbose,
-                )
-                continue
-
-        # write to file
-        fout.write(s.binarydata)
+    # copy the surviving SFDUs to file as contiguous byte ranges
+    kept = [i for i, k in enumerate(keep) if k]
+    trk234.write_runs(args.Input, f.binarydata, trk234.sfdu_runs(f.index, kept), fout)
 
     # Finished. close file
     fout.close()
-    print_log("Finished binary file write", args.verbose)
+    if out_name != args.Output:
+        os.replace(out_name, args.Output)
+    log("Finished binary file write")
+
+
+def purify_mask(cols, format_code, ul_dss_id, ul_band, dl_dss_id, dl_band):
+    """return a list of booleans, one per SFDU, which is True for the SFDUs to
+    keep. filters set to -1 are not used, and DSS ID and band filters only
+    apply to SFDUs that have the field (column value != -1)"""
+
+    # (column, accepted values) of each filter that is used. the data
+    # description and format code are always checked for validity
+    filters = [
+        (cols["data_description_id"], VALID_DD),
+        (cols["format_code"], VALID_FC),
+    ]
+    if format_code != -1:
+        filters.append((cols["format_code"], {format_code}))
+    if ul_dss_id != -1:
+        filters.append((cols["ul_dss_id"], {-1, ul_dss_id}))
+    if ul_band != -1:
+        filters.append((cols["ul_band"], {-1, ul_band}))
+    if dl_dss_id != -1:
+        filters.append((cols["dl_dss_id"], {-1, dl_dss_id}))
+    if dl_band != -1:
+        filters.append((cols["dl_band"], {-1, dl_band}))
+
+    # apply the filters one column at a time
+    keep = [True] * len(cols["format_code"])
+    for col, accepted in filters:
+        keep = [k and value in accepted for k, value in zip(keep, col)]
+    return keep
+
+
+def discard_reason(i, cols, args):
+    """return the log message explaining why SFDU i was discarded"""
+
+    ddid = cols["data_description_id"][i]
+    fc = cols["format_code"][i]
+    ul_dss_id = cols["ul_dss_id"][i]
+    ul_band = cols["ul_band"][i]
+    dl_dss_id = cols["dl_dss_id"][i]
+    dl_band = cols["dl_band"][i]
+
+    if ddid not in VALID_DD:
+        return 'Discarding SFDU %d - invalid CHDO data description of "%s"' % (
+            i,
+            ddid,
+        )
+    if fc not in VALID_FC:
+        return "Discarding SFDU %d - invalid CHDO format code of %d" % (i, fc)
+    if args.format_code is not None and args.format_code != fc:
+        return (
+            "Discarding SFDU %d - does not match user specified format code (%d, this one = %d)"
+            % (i, args.format_code, fc)
+        )
+    if args.ul_dss_id is not None and ul_dss_id != -1:
+        if args.ul_dss_id != ul_dss_id:
+            return (
+                "Discarding SFDU %d - does not match user specified uplink DSS ID (%d, this one = %d)"
+                % (i, args.ul_dss_id, ul_dss_id)
+            )
+    if args.ul_band is not None and ul_band != -1:
+        if args.ul_band_code != ul_band:
+            return (
+                "Discarding SFDU %d - does not match user specified uplink band (%s, this one = %s)"
+                % (i, args.ul_band, trk234.bands.get(ul_band, ul_band))
+            )
+    if args.dl_dss_id is not None and dl_dss_id != -1:
+        if args.dl_dss_id != dl_dss_id:
+            return (
+                "Discarding SFDU %d - does not match user specified downlink DSS ID (%d, this one = %d)"
+                % (i, args.dl_dss_id, dl_dss_id)
+            )
+    if args.dl_band is not None and dl_band != -1:
+        if args.dl_band_code != dl_band:
+            return (
+                "Discarding SFDU %d - does not match user specified downlink band(%s, this one = %s)"
+                % (i, args.dl_band, trk234.bands.get(dl_band, dl_band))
+            )
 
 
-def print_log(message, verbose):
-    """write a message to the screen if verbose is true"""
-    if verbose:
-        print(message)
+def no_log(*message):
+    """log function for the quiet mode, which ignores the message"""
 
 
 def execute():
@@ -269,7 +326,7 @@ def execute():
     # validate the band input
     if args.dl_band not in trk234.bands.values() and args.dl_band is not None:
         parser.error("invalid band. valid bands are: S, X, Ka, Ku, or L")
-    if args.ul_band not in trk234.bands.values() and args.dl_band is not None:
+    if args.ul_band not in trk234.bands.values() and args.ul_band is not None:
         parser.error("invalid band. valid bands are: S, X, Ka, Ku, or L")
 
-    main(args)
+    main(Options(args))
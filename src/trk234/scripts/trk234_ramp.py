@@ -64,6 +64,7 @@ Options::
    -d <dss_id>, print the DSS ID Number
    -b <band>, the band of the signal to print (S, X, K, L)
    -t, use an ISOT timestamp (YYYY-DDDTHH:MM:SS.ffffff) instead of YYY DDD SPM format
+   -j <jobs>, decode the file with this many worker processes
    -h, access program help via the command line
 
 """
@@ -71,60 +72,136 @@ Options::
 import os
 import sys
 from argparse import ArgumentParser
+from multiprocessing import Pool
 import trk234
 
+# Number of output lines to collect before writing them to stdout
+BATCH = 1000
+
+
+def emit_iso(year, doy, sec, ramp_rate, ramp_freq):
+    """Output line with an ISOT timestamp"""
+    ts = trk234.fast_iso(year, doy, sec)
+    return f"{ts:>24} {ramp_rate:13.6f} {ramp_freq:18.6f}"
+
+
+def emit_plain(year, doy, sec, ramp_rate, ramp_freq):
+    """Output line with a YYYY DOY SPM timestamp"""
+    return f"{year:4d} {doy:3d} {sec:12.6f} {ramp_rate:13.6f} {ramp_freq:18.6f}"
+
+
+class Options:
+    """Command line options, copied once from the argparse namespace. The
+    band is stored as its integer band code, or -1 to accept any band"""
+
+    __slots__ = (
+        "Input",
+        "dss",
+        "band",
+        "timestamp",
+        "jobs",
+    )
+
+    def __init__(self, args):
+        self.Input = args.Input
+        self.dss = args.dss
+        self.band = trk234.band_codes[args.band] if args.band != "" else -1
+        self.timestamp = args.timestamp
+        self.jobs = args.jobs
+
 
 def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file. only decode the label, aggregation CHDO and primary CHDO to start
-    # not decoding the secondary CHDO and tracking CHDO saves a lot of time
-    f = trk234.Reader(args.Input)
-    f.decode(sec_chdo=False, trk_chdo=False)
+    write = sys.stdout.write
+
+    # Split the file into blocks of SFDUs and read them in worker
+    # processes. the blocks are contiguous, so the output stays in order
+    if args.jobs > 1:
+        blocks = trk234.Reader(args.Input).blocks(4 * args.jobs)
+        with Pool(args.jobs) as pool:
+            for text in pool.imap(
+                ramp_block, [(args,) + block for block in blocks]
+            ):
+                write(text)
+        return
+
+    # Write the lines in batches
+    buf = []
+    for line in ramp_lines(args):
+        buf.append(line)
+        if len(buf) >= BATCH:
+            buf.append("")
+            write("\n".join(buf))
+            buf.clear()
+
+    # Write out whatever is left over
+    if buf:
+        buf.append("")
+        write("\n".join(buf))
 
-    # Loop through the SFDU records
-    for sfdu in f.sfdu_list:
 
-        # Only look at data type 09 - RAMPS
-        if sfdu.pri_chdo.format_code == 9:
+def ramp_block(job):
+    """Worker for the parallel mode, returns the output of a block of SFDUs"""
+    return "".join([line + "\n" for line in ramp_lines(*job)])
 
-            # Now decode the secondary chdo and tracking chdo - (label, agg_chdo, pri_chdo already decoded)
-            sfdu.decode(
-                sfdu.binarydata, label=False, agg_chdo=False, pri_chdo=False
+
+def ramp_lines(args, start=0, stop=None, first=0):
+    """Generator of the output lines for the ramp records between the start
+    and stop byte offsets of the file, where first is the number of the
+    first SFDU"""
+
+    # Read the TRK 2-34 file. the fields of the data type 09 - RAMPS records
+    # are read straight from the binary data into parallel columns, so no
+    # SFDU needs to be decoded, which saves a lot of time
+    f = trk234.Reader(args.Input, start, stop, first)
+    cols = f.columns(
+        "year",
+        "doy",
+        "sec",
+        "ul_dss_id",
+        "ul_band",
+        "ramp_freq",
+        "ramp_rate",
+        format_codes={9},
+    )
+
+    # Bind the filters and lookups used for every record once
+    want_dss = args.dss
+    want_band = args.band
+    sec_chdos = trk234.SFDU.SEC_CHDO
+
+    # Pick the output line format once
+    emit = emit_iso if args.timestamp else emit_plain
+
+    # Loop through the ramp records in a single pass
+    for number, ddid, year, doy, sec, dss, band, ramp_freq, ramp_rate in zip(
+        cols["number"],
+        cols["data_description_id"],
+        cols["year"],
+        cols["doy"],
+        cols["sec"],
+        cols["ul_dss_id"],
+        cols["ul_band"],
+        cols["ramp_freq"],
+        cols["ramp_rate"],
+    ):
+
+        # Skip invalid SFDUs. fields a secondary CHDO does not have are -1
+        if ddid not in sec_chdos:
+            print(
+                "SFDU %d: Warning: Unknown secondary CHDO type %s. Skipping..."
+                % (number, ddid),
+                file=sys.stderr,
             )
+            continue
 
-            # Skip invalid SFDUs
-            if sfdu.is_decoded == False:
-                continue
-
-            # Extract time
-            year = sfdu.sec_chdo.year
-            doy = sfdu.sec_chdo.doy
-            sec = sfdu.sec_chdo.sec
-
-            # Get DSS info
-            dss = sfdu.sec_chdo.ul_dss_id
-            band = trk234.bands[sfdu.sec_chdo.ul_band]
-
-            # Get ramp info
-            ramp_freq = sfdu.trk_chdo.ramp_freq
-            ramp_rate = sfdu.trk_chdo.ramp_rate
-            ramp_type = sfdu.trk_chdo.ramp_type
-
-            # Do we meet the DSS_ID?
-            if args.dss == dss or args.dss == 0:
-                # Do we meet the band requirement?
-                if args.band == band or args.band == "":
-                    # Print the information in the right time format
-                    if args.timestamp:
-                        ts = sfdu.timestamp().strftime("%Y-%jT%H:%M:%S.%f")
-                        print("%24s %13.6f %18.6f" % (ts, ramp_rate, ramp_freq))
-                    else:
-                        print(
-                            "%4i %3i %12.6f %13.6f %18.6f"
-                            % (year, doy, sec, ramp_rate, ramp_freq)
-                        )
+        # Do we meet the DSS_ID?
+        if want_dss == dss or want_dss == 0:
+            # Do we meet the band requirement?
+            if want_band == band or want_band == -1:
+                yield emit(year, doy, sec, ramp_rate, ramp_freq)
 
 
 # If called as a script, go to the main() function immediately
@@ -164,6 +241,14 @@ def execute():
         action="store_true",
         help="print time in YYYY-DDDTHH:MM:SS.fff format instead",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        default=1,
+        type=int,
+        help="number of worker processes to decode the file with",
+    )
 
     # Parse the command line automatically
     args = parser.parse_args()
@@ -180,4 +265,12 @@ def execute():
     if args.dss < 0 or args.dss > 255:
         parser.error("invalid DSS ID number. enter a number between 1 and 255")
 
-    main(args)
+    # Validate the number of jobs
+    if args.jobs < 1:
+        parser.error("the number of jobs must be at least 1")
+
+    main(Options(args))
+
+
+if __name__ == "__main__":
+    execute()
@@ -74,6 +74,8 @@ Options::
 import os
 import sys
 from argparse import ArgumentParser
+from collections import Counter
+from hashlib import sha256
 import trk234
 
 
@@ -81,68 +83,83 @@ def main(args):
     """Main program function. This is the first executed code,
     and contains the necessary argument parsing and dump functions"""
 
-    # Read the TRK 2-34 file
+    # List of data types to sort
+    sort_types = range(0, 18)
+
+    # Read the TRK 2-34 file. only the format codes are needed to regroup,
+    # so no SFDU is decoded
     print_log("Reading %s" % args.Input, args.verbose)
     f = trk234.Reader(args.Input)
-    f.decode(sec_chdo=False, trk_chdo=False)
-    sfdus = f.sfdu_list
+    codes = f.get_data_types()
     print_log("Sorting %s by file type ascending" % args.Input, args.verbose)
 
+    # Bucket the SFDU numbers by data type in a single pass
+    buckets = [[] for i in sort_types]
+    for i, fc in enumerate(codes):
+        if fc < 18:
+            buckets[fc].append(i)
+
     # Open the output file for writing
     if args.prompt:
         msg = "Confirm write of file %s" % args.Output
         confirm = True if raw_input("%s (y/N) " % msg).lower() == "y" else False
         if not confirm:
             sys.exit()
-    fout = open(args.Output, "wb")
+    # Writing over the input would truncate it while it is still memory
+    # mapped, so an in-place run writes a temporary file and moves it over
+    # the input once it is complete
+    out_name = trk234.output_name(args.Input, args.Output)
+    fout = open(out_name, "wb", buffering=1 << 20)
     print_log(
         "Beginning writing of binary data to %s" % args.Output, args.verbose
     )
 
-    # List of data types to sort
-    sort_types = range(0, 18)
-
-    # Group SFDUs and write to file
+    # Write each group of SFDUs to file. this is a stable counting sort on
+    # the format code, so each bucket is copied in one go, with runs of
+    # neighbouring SFDUs copied as a single range of the input
     for i in sort_types:
-
-        # Get matching SDFUs
-        sfdu_list = [x for x in sfdus if x.pri_chdo.format_code == i]
-
-        # For each SFDU in that list, write to the binary file
-        for s in sfdu_list:
-            fout.write(s.binarydata)
+        runs = trk234.sfdu_runs(f.index, buckets[i])
+        trk234.write_runs(args.Input, f.binarydata, runs, fout)
 
         # Print log
         print_log(
             "   Wrote %i SFDUs in file of data type %02i to output"
-            % (len(sfdu_list), i),
+            % (len(buckets[i]), i),
             args.verbose,
         )
 
     # Finished. close file
     fout.close()
+    if out_name != args.Output:
+        os.replace(out_name, args.Output)
     print_log("Finished binary file write", args.verbose)
 
-    # Validate if requested - we will check the number of SFDUs and the number of each type
+    # Validate if requested - we will check the number of SFDUs, the number of
+    # each type and that the output holds the same SFDUs as the input
     if args.validate:
 
-        # Open the output file for reading
-        f2 = trk234.Reader(args.Input)
-        f2.decode(sec_chdo=False, trk_chdo=False)
-        sfdus2 = f2.sfdu_list
+        # Open the output file for reading. the input counts are the bucket
+        # sizes, so the input is not read again
+        f2 = trk234.Reader(args.Output)
+        codes2 = f2.get_data_types()
 
         # Check number of SFDUs
-        n1 = len(sfdus)
-        n2 = len(sfdus2)
+        n1 = len(codes)
+        n2 = len(codes2)
         if n1 != n2:
             print("WARNING: files contain different number of SFDUs!")
 
         # Check the number of each kind of each SFDU
-        n_type1 = trk234.types(sfdus)
-        n_type2 = trk234.types(sfdus2)
+        counts2 = Counter(codes2)
+        n_type1 = [len(buckets[i]) for i in sort_types]
+        n_type2 = [counts2[i] for i in sort_types]
         if n_type1 != n_type2:
             print("WARNING: files contain different numbers of data types!")
 
+        # Check the content of the SFDUs, regardless of their order
+        if record_digests(f) != record_digests(f2):
+            print("WARNING: files contain different SFDUs!")
+
         # Print validation results
         print("Output Validation Results:")
         print("%10s%10s%10s" % ("SFDU Type", "Input", "Output"))
@@ -151,6 +168,11 @@ def main(args):
             print("%10i%10i%10i" % (i, n_type1[i], n_type2[i]))
 
 
+def record_digests(f):
+    """return the sorted SHA-256 digests of every SFDU in a Reader"""
+    return sorted(sha256(block).digest() for _, _, _, block in f.iter_records())
+
+
 def print_log(message, verbose):
     """write a message to the screen if verbose is true"""
     if verbose:
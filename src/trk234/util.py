@@ -51,6 +51,13 @@ Last Modified: 14-SEP-2023
 
 """
 
+from collections import Counter
+from datetime import datetime, timedelta
+import os
+import shutil
+import sys
+import tempfile
+
 # dict to decode the data description field
 data_descriptions = {
    'C123' : 'Uplink types',
@@ -92,15 +99,209 @@ bands = {
    5 : 'L',
 }
 
+# reverse dict to encode a band name into its band code
+band_codes = { v : k for k, v in bands.items() }
+
+# dict of the secondary CHDO fields that can be read directly from the binary
+#   data without decoding the SFDU, by data description ID. each entry is the
+#   (byte offset, struct format) of the field within the SFDU. these are the
+#   scalar fields of the secondary CHDO classes in trk234.components, so the
+#   two have to be kept in sync
+sec_chdo_fields = {
+   'C123' : {
+      'orig_id' : (36, '>B'), 'last_modifier_id' : (37, '>B'), 'scft_id' : (39, '>B'),
+      'upl_rec_seq_num' : (40, '>I'), 'rec_seq_num' : (44, '>I'), 'year' : (48, '>H'),
+      'doy' : (50, '>H'), 'sec' : (52, '>d'), 'rct_day' : (60, '>H'), 'rct_msec' : (62, '>I'),
+      'ul_dss_id' : (66, '>B'), 'ul_band' : (67, '>B'), 'ul_assembly_num' : (68, '>B'),
+      'transmit_num' : (69, '>B'), 'transmit_stat' : (70, '>B'), 'transmit_mode' : (71, '>B'),
+      'cmd_modul_stat' : (72, '>B'), 'rng_modul_stat' : (73, '>B'), 'fts_vld_flag' : (74, '>B'),
+      'transmit_time_tag_delay' : (76, '>d'), 'ul_zheight_corr' : (84, '>f'),
+      'mod_day' : (88, '>H'), 'mod_msec' : (90, '>I'), 'version_num' : (94, '>B'),
+      'sub_version_num' : (95, '>B'), 'sub_sub_version_num' : (96, '>B')
+   },
+   'C124' : {
+      'orig_id' : (36, '>B'), 'last_modifier_id' : (37, '>B'), 'scft_id' : (39, '>B'),
+      'dtt_rec_seq_num' : (40, '>I'), 'rec_seq_num' : (44, '>I'), 'year' : (48, '>H'),
+      'doy' : (50, '>H'), 'sec' : (52, '>d'), 'rct_day' : (60, '>H'), 'rct_msec' : (62, '>I'),
+      'dl_dss_id' : (66, '>B'), 'dl_band' : (67, '>B'), 'dl_chan_num' : (68, '>B'),
+      'prdx_mode' : (69, '>B'), 'ul_prdx_stn' : (70, '>B'), 'ul_band_dl' : (71, '>B'),
+      'array_delay' : (72, '>d'), 'fts_vld_flag' : (80, '>B'), 'carr_lock_stat' : (81, '>B'),
+      'array_flag' : (82, '>B'), 'polarization' : (83, '>B'), 'diplxr_stat' : (84, '>B'),
+      'lna_num' : (85, '>B'), 'rf_if_chan_num' : (86, '>B'), 'if_num' : (87, '>B'),
+      'rcv_time_tag_delay' : (88, '>d'), 'dl_zheight_corr' : (96, '>f'),
+      'vld_ul_stn' : (100, '>B'), 'vld_dop_mode' : (101, '>B'), 'vld_scft_coh' : (102, '>B'),
+      'scft_transpd_lock' : (103, '>B'), 'scft_transpd_num' : (104, '>B'),
+      'scft_osc_freq' : (106, '>d'), 'scft_transpd_delay' : (114, '>d'),
+      'scft_transpd_turn_num' : (122, '>I'), 'scft_transpd_turn_den' : (126, '>I'),
+      'scft_twnc_stat' : (130, '>B'), 'scft_osc_type' : (131, '>B'), 'mod_day' : (132, '>H'),
+      'mod_msec' : (134, '>I'), 'version_num' : (138, '>B'), 'sub_version_num' : (139, '>B'),
+      'sub_sub_version_num' : (140, '>B'), 'lna_corr_value' : (141, '>B')
+   },
+   'C125' : {
+      'orig_id' : (36, '>B'), 'last_modifier_id' : (37, '>B'), 'scft_id' : (39, '>B'),
+      'rec_seq_num' : (40, '>I'), 'year' : (44, '>H'), 'doy' : (46, '>H'), 'sec' : (48, '>d'),
+      'rct_day' : (56, '>H'), 'rct_msec' : (58, '>I'), 'stn_stream_src' : (62, '>B'),
+      'ul_band' : (63, '>B'), 'ul_assembly_num' : (64, '>B'), 'transmit_num' : (65, '>B'),
+      'transmit_stat' : (66, '>B'), 'transmit_mode' : (67, '>B'), 'cmd_modul_stat' : (68, '>B'),
+      'rng_modul_stat' : (69, '>B'), 'transmit_time_tag_delay' : (70, '>d'),
+      'ul_zheight_corr' : (78, '>f'), 'dl_dss_id' : (82, '>B'), 'dl_chan_num' : (84, '>B'),
+      'prdx_mode' : (85, '>B'), 'ul_prdx_stn' : (86, '>B'), 'ul_band_dl' : (87, '>B'),
+      'array_delay' : (88, '>d'), 'fts_vld_flag' : (96, '>B'), 'carr_lock_stat' : (97, '>B'),
+      'array_flag' : (98, '>B'), 'lna_num' : (99, '>B'), 'rcv_time_tag_delay' : (100, '>d'),
+      'dl_zheight_corr' : (108, '>f'), 'vld_ul_stn' : (112, '>B'), 'vld_dop_mode' : (113, '>B'),
+      'vld_scft_coh' : (114, '>B'), 'vld_dl_band' : (115, '>B'), 'scft_transpd_lock' : (116, '>B'),
+      'scft_transpd_num' : (117, '>B'), 'scft_osc_freq' : (120, '>d'),
+      'scft_transpd_delay' : (128, '>d'), 'scft_transpd_turn_num' : (136, '>I'),
+      'scft_transpd_turn_den' : (140, '>I'), 'scft_twnc_stat' : (144, '>B'),
+      'scft_osc_type' : (145, '>B'), 'mod_day' : (146, '>H'), 'mod_msec' : (148, '>I'),
+      'cnt_time' : (152, '>f'), 'version_num' : (156, '>B'), 'sub_version_num' : (157, '>B'),
+      'sub_sub_version_num' : (158, '>B'), 'lna_corr_value' : (159, '>B')
+   },
+   'C126' : {
+      'orig_id' : (36, '>B'), 'last_modifier_id' : (37, '>B'), 'scft_id' : (39, '>B'),
+      'rec_seq_num' : (40, '>I'), 'year' : (44, '>H'), 'doy' : (46, '>H'), 'sec' : (48, '>d'),
+      'rct_day' : (56, '>H'), 'rct_msec' : (58, '>I'), 'ul_dss_id' : (62, '>B'),
+      'dl_dss_id' : (63, '>B'), 'dl_dss_id_2' : (64, '>B'), 'dl_band' : (65, '>B'),
+      'prdx_mode' : (66, '>B'), 'ul_band' : (67, '>B'), 'rec_type' : (68, '>B'),
+      'source_type' : (69, '>B'), 'fts_vld_flag' : (70, '>B'), 'array_flag' : (72, '>B'),
+      'array_flag_2' : (73, '>B'), 'array_delay' : (74, '>d'), 'array_delay_2' : (82, '>d'),
+      'rcv_time_tag_delay' : (90, '>d'), 'rcv_time_tag_delay_2' : (98, '>d'),
+      'mod_day' : (106, '>H'), 'mod_msec' : (108, '>I'), 'version_num' : (112, '>B'),
+      'sub_version_num' : (113, '>B'), 'sub_sub_version_num' : (114, '>B')
+   },
+   'C127' : {
+      'orig_id' : (36, '>B'), 'last_modifier_id' : (37, '>B'), 'scft_id' : (39, '>B'),
+      'rec_seq_num' : (40, '>I'), 'year' : (44, '>H'), 'doy' : (46, '>H'), 'sec' : (48, '>d'),
+      'rct_day' : (56, '>H'), 'rct_msec' : (58, '>I'), 'dl_dss_id' : (62, '>B'),
+      'dl_band' : (63, '>B'), 'dl_chan_num' : (64, '>B'), 'prdx_mode' : (65, '>B'),
+      'ul_prdx_stn' : (66, '>B'), 'ul_band_dl' : (67, '>B'), 'rcv_time_tag_delay' : (68, '>d'),
+      'array_delay' : (76, '>d'), 'fts_vld_flag' : (84, '>B'), 'carr_lock_stat' : (85, '>B'),
+      'array_flag' : (86, '>B'), 'lna_num' : (87, '>B'), 'vld_ul_stn' : (88, '>B'),
+      'vld_dop_mode' : (89, '>B'), 'vld_scft_coh' : (90, '>B'), 'scft_transpd_lock' : (91, '>B'),
+      'scft_transpd_num' : (92, '>B'), 'scft_osc_freq' : (94, '>d'),
+      'scft_transpd_delay' : (102, '>d'), 'scft_transpd_turn_num' : (110, '>I'),
+      'scft_transpd_turn_den' : (114, '>I'), 'scft_twnc_stat' : (118, '>B'),
+      'scft_osc_type' : (119, '>B'), 'mod_day' : (120, '>H'), 'mod_msec' : (122, '>I'),
+      'version_num' : (126, '>B'), 'sub_version_num' : (127, '>B'),
+      'sub_sub_version_num' : (128, '>B')
+   },
+}
+
+# dict of the tracking CHDO fields that can be read directly from the binary
+#   data, by format code, in the same form as sec_chdo_fields. only the
+#   tracking CHDOs that are read this way are listed
+trk_chdo_fields = {
+   9 : {
+      'ul_hi_phs_cycles' : (106, '>I'), 'ul_lo_phs_cycles' : (110, '>I'),
+      'ul_frac_phs_cycles' : (114, '>I'), 'ramp_freq' : (118, '>d'), 'ramp_rate' : (126, '>d'),
+      'ramp_type' : (134, '>B'), 'fabricated_sfdu_flag' : (135, '>B')
+   },
+}
+
 # ---------------------------------------------------------------------------
 def types(sfdu_list):
    """ return the number of each type of SFDU (0-17) """
 
-   # Loop through each type and determine the number
-   n = []
-   for i in range(0,18):
-      n.append( len([ s for s in sfdu_list if s.pri_chdo.format_code == i ]) )
+   # Count every type in a single pass over the SFDUs
+   counts = Counter( s.pri_chdo.format_code for s in sfdu_list )
    
    # return a list whose index corresponds to the data type
-   return n
+   return [ counts[i] for i in range(0,18) ]
+
+# ---------------------------------------------------------------------------
+def doy_datetime(year, doy, sec):
+   """ return the python datetime of a year, day of year and seconds past
+         midnight, such as the epoch fields of a secondary CHDO """
+   return datetime(year=year, month=1, day=1) + timedelta(days=doy - 1, seconds=sec)
+
+# ---------------------------------------------------------------------------
+def fast_iso(year, doy, sec):
+   """ return the YYYY-DDDTHH:MM:SS.ffffff timestamp of a year, day of year and
+         seconds past midnight. gives the same string as SFDU.timestamp().strftime()
+         with '%Y-%jT%H:%M:%S.%f', without building a datetime for every SFDU """
+
+   # round to the microsecond like timedelta does (half to even)
+   whole = int(sec)
+   usec = round( (sec - whole) * 1e6 )
+   if usec == 1000000:
+      whole += 1
+      usec = 0
+
+   # let datetime deal with negative times and day rollovers
+   if sec < 0 or whole >= 86400:
+      return doy_datetime(year, doy, sec).strftime('%Y-%jT%H:%M:%S.%f')
+
+   return '%04d-%03dT%02d:%02d:%02d.%06d' % ( year, doy, whole // 3600, whole // 60 % 60, whole % 60, usec )
+
+# ---------------------------------------------------------------------------
+def sfdu_runs(index, numbers):
+   """ return the [start, stop] byte ranges of the SFDUs with the given numbers
+         (in that order) from a Reader index, with neighbouring SFDUs merged
+         into a single range """
+
+   # neighbouring SFDUs have consecutive numbers, so the runs are found on
+   #   the numbers and the index is only looked up at the ends of each run
+   runs = []
+   append = runs.append
+   first = last = None
+   for j in numbers:
+      if j != last:
+         if first is not None:
+            append( [index[first], index[last]] )
+         first = j
+      last = j + 1
+   if first is not None:
+      append( [index[first], index[last]] )
+   return runs
+
+# ---------------------------------------------------------------------------
+def output_name(filename, output):
+   """ return the name to write the output file of a script that reads the
+         TRK 2-34 file filename under. this is output, unless output is the
+         input file itself. opening it for writing would then truncate the
+         file while the Reader still has it memory mapped, so a temporary
+         file next to it is returned instead, which is to be moved over the
+         input with os.replace once it is written """
+
+   if not ( os.path.exists(output) and os.path.samefile(filename, output) ):
+      return output
+   fd, name = tempfile.mkstemp( dir=os.path.dirname( os.path.abspath(output) ),
+                                prefix='.%s.' % os.path.basename(output) )
+   os.close( fd )
+   shutil.copymode( filename, name )
+   return name
+
+# ---------------------------------------------------------------------------
+def write_runs(filename, data, runs, fout):
+   """ copy byte ranges of the TRK 2-34 file filename, whose contents are data,
+         to the open output file fout. on Linux the kernel copies them file to
+         file with os.sendfile, otherwise (or if that fails) they are written
+         from data """
+
+   data = memoryview(data)
+   if not sys.platform.startswith('linux'):
+      fout.writelines( data[start:stop] for start, stop in runs )
+      return
+
+   fout.flush()
+   with open(filename, 'rb') as fin:
+      infd = fin.fileno()
+      outfd = fout.fileno()
+      sendfile = os.sendfile
+
+      # the runs are in ascending order, so the input is read in forward
+      #   sweeps with gaps, never at random. ask for a larger read-ahead
+      os.posix_fadvise( infd, 0, 0, os.POSIX_FADV_SEQUENTIAL )
+      kernel_copy = True
+      for start, stop in runs:
+         while kernel_copy and start < stop:
+            try:
+               sent = sendfile( outfd, infd, start, stop - start )
+            except OSError:
+               sent = 0
+            if sent == 0:
+               kernel_copy = False
+            start += sent
+         if start < stop:
+            fout.write( data[start:stop] )
 # ---------------------------------------------------------------------------